@@ -0,0 +1,199 @@
+# qpfolio/aio.py
+"""
+Asyncio front end for blocking solves.
+
+Solves run on a bounded worker pool so they never block the event loop.
+OSQP releases the GIL in its native code, so a thread pool scales across
+cores; a process pool is available for pure-Python workloads.
+
+Example
+-------
+.. code-block:: python
+
+   from qpfolio.aio import AsyncSolveExecutor, asolve
+
+   pool = AsyncSolveExecutor(max_workers=4, max_pending=64)
+
+   async def handler(problem):
+       return await asolve(MathOptOSQP(), problem, executor=pool, timeout=2.0)
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from qpfolio.core.frontier import compute_frontier
+from qpfolio.core.types import ProblemSpec, Solution
+from qpfolio.personal_indexing import personal_index_optimizer
+
+
+class AsyncSolveExecutor:
+    """
+    Bounded worker pool with backpressure for async callers.
+
+    Parameters
+    ~~~~~~~~~~
+    - **max_workers** (int, optional): Pool size; defaults to ``os.cpu_count()``,
+      so bursts never oversubscribe cores.
+    - **max_pending** (int, optional): Jobs admitted at once (running plus
+      queued in the pool); further callers wait in :meth:`run` until a slot
+      frees up. Defaults to ``2 * max_workers``.
+    - **kind** (str): ``"thread"`` (default) or ``"process"``.
+
+    Cancelling the awaiting task drops a job that has not started yet; a job
+    already running cannot be interrupted, so pass a ``time_limit`` to the
+    solver (``asolve`` does this for ``timeout``) to bound its run time.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 kind: str = "thread"):
+        if kind not in ("thread", "process"):
+            raise ValueError("kind must be 'thread' or 'process'.")
+        self.max_workers = int(max_workers or os.cpu_count() or 1)
+        self.max_pending = int(max_pending or 2 * self.max_workers)
+        if self.max_workers < 1 or self.max_pending < 1:
+            raise ValueError("max_workers and max_pending must be positive.")
+        self.kind = kind
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                cls = ThreadPoolExecutor if self.kind == "thread" else ProcessPoolExecutor
+                self._pool = cls(max_workers=self.max_workers)
+            return self._pool
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; rebuild when the loop changes.
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._loop = loop
+        return self._slots
+
+    async def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run ``fn(*args, **kwargs)`` on the pool and await its result.
+
+        Waits for a free slot first (backpressure). ``timeout`` (seconds)
+        covers the wait for a slot and the run; on expiry
+        ``asyncio.TimeoutError`` is raised.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+
+        async def admitted():
+            slots = self._semaphore()
+            await slots.acquire()
+            try:
+                cfut = self._executor().submit(call)
+            except BaseException:
+                slots.release()
+                raise
+            # The slot is held until the worker is actually done, so a
+            # cancelled or timed-out job that is still running keeps counting
+            # against max_pending.
+            cfut.add_done_callback(lambda _: loop.call_soon_threadsafe(slots.release))
+            return await asyncio.wrap_future(cfut, loop=loop)
+
+        if timeout is None:
+            return await admitted()
+        return await asyncio.wait_for(admitted(), timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pool down; it is recreated on the next :meth:`run`."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_default_executor: Optional[AsyncSolveExecutor] = None
+
+
+def default_executor() -> AsyncSolveExecutor:
+    """Process-wide thread pool used when no ``executor`` is passed."""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = AsyncSolveExecutor()
+    return _default_executor
+
+
+# ---------- Async variants ----------
+
+async def asolve(
+    solver,
+    problem: ProblemSpec,
+    *,
+    executor: Optional[AsyncSolveExecutor] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> Solution:
+    """
+    Awaitable ``solver.solve(problem, **kwargs)``.
+
+    If the solver accepts ``time_limit`` and none is given, ``timeout`` is
+    forwarded as well, so a timed-out solve also stops in the worker instead
+    of holding the slot until it converges.
+    """
+    if (timeout is not None and "time_limit" not in kwargs
+            and "time_limit" in inspect.signature(solver.solve).parameters):
+        kwargs["time_limit"] = timeout
+    ex = executor or default_executor()
+    return await ex.run(solver.solve, problem, timeout=timeout, **kwargs)
+
+
+async def acompute_frontier(
+    mu: np.ndarray,
+    Sigma: np.ndarray,
+    targets: np.ndarray,
+    solver,
+    *,
+    executor: Optional[AsyncSolveExecutor] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+):
+    """Awaitable :func:`qpfolio.core.frontier.compute_frontier` (one pool job)."""
+    ex = executor or default_executor()
+    return await ex.run(compute_frontier, mu, Sigma, targets, solver, timeout=timeout, **kwargs)
+
+
+async def apersonal_index_batch(
+    accounts: Iterable[Mapping[str, Any]],
+    *,
+    optimizer: Callable[..., Solution] = personal_index_optimizer,
+    executor: Optional[AsyncSolveExecutor] = None,
+    timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Solve one personal-index problem per account concurrently.
+
+    Each account is a mapping of keyword arguments for ``optimizer``
+    (``Sigma``, ``w_bench``, ``max_weight``, ``exclude``, ...). Results come
+    back in account order. ``timeout`` applies to each account separately;
+    with ``return_exceptions=True`` failures and timeouts are returned in place
+    instead of cancelling the rest of the batch.
+    """
+    ex = executor or default_executor()
+    jobs = [ex.run(optimizer, timeout=timeout, **dict(acct)) for acct in accounts]
+    return await asyncio.gather(*jobs, return_exceptions=return_exceptions)
+
+
+__all__ = [
+    "AsyncSolveExecutor",
+    "default_executor",
+    "asolve",
+    "acompute_frontier",
+    "apersonal_index_batch",
+]
@@ -0,0 +1,415 @@
+# qpfolio/batch.py
+"""
+Config-driven batch runs: load a return panel, estimate inputs, expand the
+config into independent solve jobs, run them in parallel and stream one
+record per job to CSV, Parquet or JSONL as it finishes.
+
+Config keys (JSON, TOML or YAML)
+--------------------------------
+.. code-block:: json
+
+   {
+     "returns": "returns.csv",
+     "freq": 252,
+     "estimator": "sample",
+     "model": "mvo",
+     "targets": {"start": 0.05, "stop": 0.12, "num": 30},
+     "accounts": [{"id": "acct-1", "max_weight": 0.05, "exclude": ["XOM"]}],
+     "solver": {"eps_abs": 1e-7},
+     "workers": 4,
+     "output": "results.csv",
+     "checkpoint": "ckpt/"
+   }
+
+``model`` is ``"mvo"`` (one job per target), ``"mdp"`` (one job) or
+``"personal_index"`` (one job per account; ``benchmark`` defaults to equal
+weights). Relative paths resolve against the config file's directory.
+With ``checkpoint`` set, solves go through
+:class:`qpfolio.checkpoint.CheckpointedSolver`, so a rerun after a crash
+re-emits finished jobs from the store instead of solving them again.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from qpfolio.checkpoint import CheckpointedSolver, CheckpointStore
+from qpfolio.core.estimates import sample_mean_cov
+from qpfolio.core.models import build_mdp_problem, build_mvo_problem
+from qpfolio.core.types import ProblemSpec, Solution
+from qpfolio.personal_indexing import personal_index_optimizer
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+ESTIMATORS: Dict[str, Callable[..., Any]] = {
+    "sample": sample_mean_cov,
+}
+
+
+# ---------- Config and data ----------
+
+def load_config(path: os.PathLike) -> Dict[str, Any]:
+    """Read a job config from ``.json``, ``.toml`` or ``.yaml``/``.yml``."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        cfg = json.loads(path.read_text())
+    elif suffix == ".toml":
+        try:
+            import tomllib  # type: ignore
+        except ImportError:  # pragma: no cover
+            import tomli as tomllib  # type: ignore
+        cfg = tomllib.loads(path.read_text())
+    elif suffix in (".yaml", ".yml"):
+        try:
+            import yaml  # type: ignore
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("YAML configs need PyYAML: `pip install pyyaml`.") from exc
+        cfg = yaml.safe_load(path.read_text())
+    else:
+        raise ValueError(f"Unsupported config format {suffix!r}; use .json, .toml or .yaml.")
+    cfg.setdefault("base_dir", str(path.parent))
+    return cfg
+
+
+def _resolve(cfg: Mapping[str, Any], p: str) -> Path:
+    p = Path(p)
+    return p if p.is_absolute() else Path(cfg.get("base_dir", ".")) / p
+
+
+def load_returns(path: os.PathLike):
+    """
+    Load a (T, N) return panel. CSV and Parquet files keep their column names
+    as asset labels (first CSV column is the index); ``.npy`` is memory-mapped
+    and labelled ``a0 .. a{N-1}``; estimators then read it in row chunks of
+    ``chunk_size`` (config key, default 4096) instead of loading it.
+
+    Returns ``(X, labels)``.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        X = np.load(path, mmap_mode="r")
+        return X, [f"a{i}" for i in range(X.shape[1])]
+    import pandas as pd
+    if suffix == ".csv":
+        df = pd.read_csv(path, index_col=0)
+    elif suffix in (".parquet", ".pq"):
+        df = pd.read_parquet(path)
+    else:
+        raise ValueError(f"Unsupported returns format {suffix!r}; use .csv, .parquet or .npy.")
+    return df.to_numpy(dtype=float), [str(c) for c in df.columns]
+
+
+def _targets(spec) -> np.ndarray:
+    if isinstance(spec, Mapping):
+        return np.linspace(float(spec["start"]), float(spec["stop"]), int(spec["num"]))
+    return np.asarray(spec, dtype=float).ravel()
+
+
+def _asset_indices(labels: Sequence[str], items: Iterable) -> List[int]:
+    index = {name: k for k, name in enumerate(labels)}
+    out = []
+    for it in items:
+        if isinstance(it, (int, np.integer)):
+            out.append(int(it))
+        elif it in index:
+            out.append(index[it])
+        else:
+            raise ValueError(f"Unknown asset {it!r}.")
+    return out
+
+
+# ---------- Jobs ----------
+
+@dataclass
+class Job:
+    """One independent solve; ``run()`` returns a Solution, ``meta`` is copied into the record."""
+    job_id: str
+    run: Callable[[], Solution]
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+def build_jobs(cfg: Mapping[str, Any]):
+    """
+    Expand a config into ``(jobs, labels, mu, Sigma)``.
+    """
+    X, labels = load_returns(_resolve(cfg, cfg["returns"]))
+    name = cfg.get("estimator", "sample")
+    if name not in ESTIMATORS:
+        raise ValueError(f"Unknown estimator {name!r}; available: {sorted(ESTIMATORS)}.")
+    kwargs = {"freq": int(cfg.get("freq", 1))}
+    if isinstance(X, np.memmap):
+        # Estimate straight from the mapped panel, one row chunk at a time.
+        kwargs["chunk_size"] = int(cfg.get("chunk_size", 4096))
+    mu, Sigma = ESTIMATORS[name](X, **kwargs)
+    solver = MathOptOSQP(**cfg.get("solver", {}))
+    if cfg.get("checkpoint"):
+        solver = CheckpointedSolver(solver, CheckpointStore(_resolve(cfg, cfg["checkpoint"])))
+    model = cfg.get("model", "mvo")
+
+    jobs: List[Job] = []
+    if model == "mvo":
+        for k, r in enumerate(_targets(cfg["targets"])):
+            prob = build_mvo_problem(mu, Sigma, r_target=float(r), trusted=True)
+            jobs.append(Job(f"mvo-{k}", (lambda p=prob: solver.solve(p)), {"target": float(r)}))
+    elif model == "mdp":
+        prob = build_mdp_problem(np.sqrt(np.diag(Sigma)), Sigma, trusted=True)
+        jobs.append(Job("mdp", lambda: _normalized(solver.solve(prob), prob)))
+    elif model == "personal_index":
+        n = len(labels)
+        for k, acct in enumerate(cfg.get("accounts", [{}])):
+            bench = acct.get("benchmark")
+            if bench is None:
+                w_bench = np.full(n, 1.0 / n)
+            elif isinstance(bench, str):
+                w_bench = np.loadtxt(_resolve(cfg, bench), delimiter=",", dtype=float).ravel()
+            else:
+                w_bench = np.asarray(bench, dtype=float)
+            kwargs = dict(max_weight=float(acct.get("max_weight", 0.05)),
+                          exclude=_asset_indices(labels, acct.get("exclude", [])),
+                          solver=solver)
+            run = (lambda wb=w_bench, kw=kwargs: personal_index_optimizer(Sigma, wb, **kw))
+            jobs.append(Job(str(acct.get("id", f"account-{k}")), run))
+    else:
+        raise ValueError("model must be one of 'mvo', 'mdp', 'personal_index'.")
+    return jobs, labels, mu, Sigma
+
+
+def _normalized(sol: Solution, problem: ProblemSpec) -> Solution:
+    # MDP solves in a scaled space (w^T sigma = 1); report budget weights and
+    # the problem's objective at those weights, so "obj" matches the record.
+    # Returns a new Solution; the solver's (possibly cached) one is untouched.
+    s = float(np.sum(sol.x))
+    x = sol.x / s if s > 0 else np.array(sol.x, dtype=float)
+    obj = 0.5 * float(x @ (problem.Q @ x)) + float(problem.c @ x)
+    return Solution(x=x, obj=obj, status=sol.status, info=sol.info, y=sol.y,
+                    active=sol.active, blocks=sol.blocks)
+
+
+RECORD_FIELDS = ("job", "status", "obj", "ret", "risk", "iter", "solve_time")
+
+
+def record_columns(jobs: Sequence[Job], labels: Sequence[str]) -> List[str]:
+    """Column order of :func:`solution_record` output for ``jobs``."""
+    meta = list(dict.fromkeys(k for job in jobs for k in job.meta))
+    return [*RECORD_FIELDS, *meta, *labels]
+
+
+def record_schema(jobs: Sequence[Job], labels: Sequence[str]) -> Dict[str, str]:
+    """
+    Column types (``"string"``, ``"float64"``, ``"int64"``) of
+    :func:`record_columns`, known before any job runs: fixed for the record
+    fields, float64 per asset, and from the jobs' ``meta`` values otherwise.
+    """
+    types = {"job": "string", "status": "string", "obj": "float64", "ret": "float64",
+             "risk": "float64", "iter": "int64", "solve_time": "float64"}
+    for job in jobs:
+        for k, v in job.meta.items():
+            if k in types or v is None:
+                continue
+            if isinstance(v, (bool, str)):
+                types[k] = "string"
+            elif isinstance(v, (int, np.integer)):
+                types[k] = "int64"
+            elif isinstance(v, (float, np.floating)):
+                types[k] = "float64"
+            else:
+                types[k] = "string"
+    types.update((name, "float64") for name in labels)
+    return {c: types.get(c, "string") for c in record_columns(jobs, labels)}
+
+
+def solution_record(job: Job, sol: Solution, labels: Sequence[str], mu, Sigma) -> Dict[str, Any]:
+    """Flat record: job, status, obj, ret, risk, iter, solve time, meta, one column per asset."""
+    x = np.asarray(sol.x, dtype=float)
+    info = sol.info or {}
+    rec: Dict[str, Any] = {
+        "job": job.job_id,
+        "status": sol.status,
+        "obj": float(sol.obj),
+        "ret": float(x @ mu),
+        "risk": float(np.sqrt(max(x @ Sigma @ x, 0.0))),
+        "iter": info.get("iter"),
+        "solve_time": info.get("solve_time"),
+    }
+    rec.update(job.meta)
+    rec.update(zip(labels, x.tolist()))
+    return rec
+
+
+# ---------- Streaming writers ----------
+
+class _CsvWriter:
+    def __init__(self, path: Path, columns: Optional[Sequence[str]] = None, append: bool = False,
+                 schema: Optional[Mapping[str, str]] = None):
+        exists = append and path.exists() and path.stat().st_size > 0
+        self._fh = open(path, "a" if append else "w", newline="")
+        self._columns = columns
+        self._writer: Optional[csv.DictWriter] = None
+        self._header_written = exists
+
+    def write(self, rec: Mapping[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._fh, fieldnames=list(self._columns or rec),
+                                          extrasaction="ignore")
+            if not self._header_written:
+                self._writer.writeheader()
+        self._writer.writerow(rec)
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path: Path, columns: Optional[Sequence[str]] = None, append: bool = False,
+                 schema: Optional[Mapping[str, str]] = None):
+        self._fh = open(path, "a" if append else "w")
+
+    def write(self, rec: Mapping[str, Any]) -> None:
+        self._fh.write(json.dumps(rec) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _ParquetWriter:
+    # Buffers ``batch_size`` records per row group; memory is bounded by one batch.
+    # With ``schema`` the file layout is fixed up front, so a first batch of
+    # failed (all-null) records cannot lock in null-typed columns.
+    def __init__(self, path: Path, columns: Optional[Sequence[str]] = None, append: bool = False,
+                 schema: Optional[Mapping[str, str]] = None, batch_size: int = 256):
+        try:
+            import pyarrow  # type: ignore  # noqa: F401
+            import pyarrow.parquet  # type: ignore  # noqa: F401
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("Parquet output needs pyarrow: `pip install pyarrow`.") from exc
+        if append:
+            raise ValueError("Parquet output cannot be appended to; use CSV or JSONL.")
+        self._path = path
+        self._columns = list(schema) if schema is not None else columns
+        self._schema = schema
+        self._batch: List[Mapping[str, Any]] = []
+        self._batch_size = batch_size
+        self._writer = None
+
+    def write(self, rec: Mapping[str, Any]) -> None:
+        self._batch.append(rec)
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+        if not self._batch:
+            return
+        columns = self._columns or list(self._batch[0])
+        if self._writer is None:
+            schema = None
+            if self._schema is not None:
+                schema = pa.schema([(c, pa.type_for_alias(t)) for c, t in self._schema.items()])
+            data = {c: [r.get(c) for r in self._batch] for c in columns}
+            table = pa.Table.from_pydict(data, schema=schema)
+            self._writer = pq.ParquetWriter(str(self._path), table.schema)
+        else:
+            table = pa.Table.from_pydict({c: [r.get(c) for r in self._batch] for c in columns},
+                                         schema=self._writer.schema)
+        self._writer.write_table(table)
+        self._batch = []
+
+    def close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_writer(path: os.PathLike, fmt: Optional[str] = None, *,
+                columns: Optional[Sequence[str]] = None, append: bool = False,
+                schema: Optional[Mapping[str, str]] = None):
+    """
+    Streaming record writer for ``csv``, ``jsonl`` or ``parquet`` (inferred
+    from the suffix). ``columns`` fixes the tabular layout; records missing a
+    column leave it empty. ``schema`` (column -> type name, see
+    :func:`record_schema`) also fixes the Parquet column types.
+    """
+    path = Path(path)
+    fmt = (fmt or path.suffix.lstrip(".")).lower()
+    writers = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter, "pq": _ParquetWriter}
+    if fmt not in writers:
+        raise ValueError(f"Unsupported output format {fmt!r}; use csv, jsonl or parquet.")
+    return writers[fmt](path, columns=columns, append=append, schema=schema)
+
+
+# ---------- Runner ----------
+
+def iter_results(jobs: Iterable[Job], *, workers: int = 1) -> Iterator:
+    """
+    Yield ``(job, solution)`` as jobs finish, with at most ``2 * workers``
+    jobs submitted at a time so neither jobs nor results pile up in memory.
+    A job that raises yields its exception in place of the solution.
+    """
+    workers = max(1, int(workers))
+    jobs = iter(jobs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        for job in jobs:
+            pending[pool.submit(job.run)] = job
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                job = pending.pop(fut)
+                exc = fut.exception()
+                yield job, (exc if exc is not None else fut.result())
+                nxt = next(jobs, None)
+                if nxt is not None:
+                    pending[pool.submit(nxt.run)] = nxt
+
+
+def run_batch(cfg: Mapping[str, Any], *, output: Optional[os.PathLike] = None,
+              workers: Optional[int] = None, fmt: Optional[str] = None) -> int:
+    """
+    Run every job of ``cfg`` and stream records to ``output`` (default
+    ``cfg["output"]``). Failed jobs are recorded with ``status`` set to the
+    error. Returns the number of records written.
+    """
+    jobs, labels, mu, Sigma = build_jobs(cfg)
+    out = Path(output) if output is not None else _resolve(cfg, cfg["output"])
+    writer = open_writer(out, fmt or cfg.get("format"), columns=record_columns(jobs, labels),
+                         schema=record_schema(jobs, labels))
+    count = 0
+    try:
+        for job, result in iter_results(jobs, workers=workers or int(cfg.get("workers", 1))):
+            if isinstance(result, BaseException):
+                rec = {"job": job.job_id, "status": f"error: {result}", **job.meta}
+            else:
+                rec = solution_record(job, result, labels, mu, Sigma)
+            writer.write(rec)
+            count += 1
+    finally:
+        writer.close()
+    return count
+
+
+__all__ = [
+    "ESTIMATORS",
+    "Job",
+    "load_config",
+    "load_returns",
+    "build_jobs",
+    "record_columns",
+    "record_schema",
+    "solution_record",
+    "open_writer",
+    "iter_results",
+    "run_batch",
+]
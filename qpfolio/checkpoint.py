@@ -0,0 +1,244 @@
+# qpfolio/checkpoint.py
+"""
+Checkpointed solves for long batch and frontier runs.
+
+Every completed solve is written to a local directory, keyed by a
+fingerprint of the problem data and of the solver's settings. A rerun after a crash finds finished
+problems there and returns them without solving; unfinished problems are
+warm-started from the most recent stored solution with the same shape.
+
+Example
+-------
+.. code-block:: python
+
+   from qpfolio.checkpoint import CheckpointStore, CheckpointedSolver
+
+   solver = CheckpointedSolver(MathOptOSQP(), CheckpointStore("ckpt/"))
+   points = compute_frontier(mu, Sigma, targets, solver)   # resumable
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import tempfile
+import weakref
+from dataclasses import dataclass, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from qpfolio.core.types import Array, ProblemSpec, Solution
+from qpfolio.serialization import load_solution_npz, save_solution_npz
+
+
+# ---------- Fingerprints ----------
+
+# Digests of large arrays, keyed by object identity, so a covariance shared by
+# many problems (e.g. every point of a frontier) is hashed once. Arrays are
+# assumed not to be modified in place once handed to a solver.
+_DIGEST_CACHE: Dict[int, Tuple[Any, bytes]] = {}
+_CACHE_MIN_SIZE = 4096
+
+
+def _digest(value: Any) -> bytes:
+    h = hashlib.sha256()
+    if hasattr(value, "tocsc"):
+        M = value.tocsc()
+        M.sort_indices()
+        h.update(b"S" + repr(M.shape).encode())
+        h.update(np.ascontiguousarray(M.data, dtype=float))
+        # Index arrays are hashed in their own integer dtype, not cast to float.
+        for part in (M.indices, M.indptr):
+            h.update(part.dtype.str.encode())
+            h.update(np.ascontiguousarray(part))
+    else:
+        a = np.ascontiguousarray(value, dtype=float)
+        h.update(b"D" + repr(a.shape).encode())
+        h.update(a)
+    return h.digest()
+
+
+def _update(h, value: Any) -> None:
+    if value is None:
+        h.update(b"N")
+        return
+    size = value.nnz if hasattr(value, "nnz") else np.size(value)
+    if size < _CACHE_MIN_SIZE or not (isinstance(value, np.ndarray) or hasattr(value, "tocsc")):
+        h.update(_digest(value))
+        return
+    hit = _DIGEST_CACHE.get(id(value))
+    if hit is None or hit[0]() is not value:
+        hit = (weakref.ref(value), _digest(value))
+        _DIGEST_CACHE[id(value)] = hit
+        weakref.finalize(value, _DIGEST_CACHE.pop, id(value), None)
+    h.update(hit[1])
+
+
+def _bounds_array(bounds) -> Optional[Array]:
+    if bounds is None:
+        return None
+    return np.array([[np.nan, np.nan] if b is None else
+                     [np.nan if b[0] is None else b[0], np.nan if b[1] is None else b[1]]
+                     for b in bounds], dtype=float)
+
+
+def problem_fingerprint(problem: ProblemSpec) -> str:
+    """
+    SHA-256 over the numeric content of every ProblemSpec field.
+
+    Digests of large arrays are cached per array object, so problems that
+    share a covariance matrix hash it once; arrays must not be modified in
+    place after a solve.
+    """
+    h = hashlib.sha256()
+    for f in fields(ProblemSpec):
+        value = getattr(problem, f.name)
+        h.update(f.name.encode())
+        if f.name == "bounds":
+            value = _bounds_array(value)
+        elif f.name == "symmetric":
+            value = float(bool(value))
+        _update(h, value)
+    return h.hexdigest()
+
+
+def _settings(obj: Any) -> Any:
+    """Hashable settings of a solver: dataclass fields, else scalar/dataclass attributes."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return (type(obj).__qualname__, [(f.name, _settings(getattr(obj, f.name))) for f in fields(obj)])
+    if isinstance(obj, (type(None), bool, int, float, str, tuple)):
+        return obj
+    # Wrappers: keep configuration-like attributes, skip mutable state
+    # (call logs, caches) that would change the key between runs.
+    attrs = sorted((k, _settings(v)) for k, v in vars(obj).items()
+                   if isinstance(v, (type(None), bool, int, float, str, tuple)) or is_dataclass(v))
+    return (f"{type(obj).__module__}.{type(obj).__qualname__}", attrs)
+
+
+def solver_fingerprint(solver: Any) -> str:
+    """SHA-256 over the solver class and its settings (eps, max_iter, policy, ...)."""
+    return hashlib.sha256(repr(_settings(solver)).encode()).hexdigest()
+
+
+def checkpoint_key(problem: ProblemSpec, solver: Any) -> str:
+    """Store key of ``problem`` solved by ``solver``: both fingerprints combined."""
+    return hashlib.sha256((problem_fingerprint(problem) + solver_fingerprint(solver)).encode()).hexdigest()
+
+
+def structure_key(problem: ProblemSpec) -> str:
+    """
+    Key shared by problems with the same variable count and constraint row
+    layout, whose solutions are therefore valid warm starts for each other.
+    """
+    def rows(M):
+        return None if M is None else M.shape[0]
+    A_ineq = problem.A_ineq if problem.A_ineq is not None else problem.G
+    shape = (problem.Q.shape[0], rows(problem.A), rows(problem.A_eq), rows(A_ineq),
+             problem.bounds is not None)
+    return hashlib.sha256(repr(shape).encode()).hexdigest()[:16]
+
+
+# ---------- Store ----------
+
+class CheckpointStore:
+    """
+    Directory of completed solutions, one ``<key>.npz`` per problem and
+    solver configuration (see :func:`checkpoint_key`).
+
+    Writes go to a temporary file first and are renamed into place, so a
+    process killed mid-write never leaves a truncated checkpoint behind.
+    """
+
+    def __init__(self, directory: os.PathLike):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return self._path(fingerprint).exists()
+
+    def _write(self, path: Path, sol: Solution) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                save_solution_npz(fh, sol, compressed=False)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def _read(self, path: Path) -> Optional[Solution]:
+        try:
+            return load_solution_npz(path)[0]
+        except FileNotFoundError:
+            return None
+
+    def get(self, fingerprint: str) -> Optional[Solution]:
+        """Stored solution for ``fingerprint``, or None."""
+        return self._read(self._path(fingerprint))
+
+    def put(self, fingerprint: str, sol: Solution, *, structure: Optional[str] = None) -> None:
+        """Store ``sol``; with ``structure``, also record it as that shape's latest warm start."""
+        self._write(self._path(fingerprint), sol)
+        if structure is not None:
+            self._write(self._path(f"warm-{structure}"), Solution(x=sol.x, obj=sol.obj, status=sol.status, y=sol.y))
+
+    def warm_start(self, structure: str) -> Tuple[Optional[Array], Optional[Array]]:
+        """``(x0, y0)`` of the latest solution stored for ``structure``."""
+        sol = self._read(self._path(f"warm-{structure}"))
+        return (None, None) if sol is None else (sol.x, sol.y)
+
+
+# ---------- Solver wrapper ----------
+
+@dataclass
+class CheckpointedSolver:
+    """
+    Solver wrapper that consults ``store`` before solving.
+
+    Problems already solved with the same solver settings are returned from
+    the store; others are solved by
+    ``solver`` (warm-started from the store when the solver accepts ``x0`` /
+    ``y0``) and stored once solved. Works anywhere a solver is accepted, e.g.
+    ``compute_frontier`` and the personal-index optimizers.
+    """
+    solver: Any
+    store: CheckpointStore
+    warm_start: bool = True
+
+    def solve(self, problem: ProblemSpec, *, key: Optional[str] = None, **kwargs) -> Solution:
+        """
+        Solve ``problem`` or return its stored solution. ``key`` replaces
+        :func:`checkpoint_key` for callers that already know it; other keyword
+        arguments go to the wrapped solver.
+        """
+        fp = checkpoint_key(problem, self.solver) if key is None else key
+        done = self.store.get(fp)
+        if done is not None:
+            return done
+        skey = structure_key(problem)
+        params = inspect.signature(self.solver.solve).parameters
+        if self.warm_start and "x0" in params and "x0" not in kwargs:
+            x0, y0 = self.store.warm_start(skey)
+            kwargs["x0"] = x0
+            if "y0" in params:
+                kwargs["y0"] = y0
+        sol = self.solver.solve(problem, **kwargs)
+        if sol.solved:
+            self.store.put(fp, sol, structure=skey)
+        return sol
+
+
+__all__ = [
+    "problem_fingerprint",
+    "solver_fingerprint",
+    "checkpoint_key",
+    "structure_key",
+    "CheckpointStore",
+    "CheckpointedSolver",
+]
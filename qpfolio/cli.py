@@ -0,0 +1,37 @@
+# qpfolio/cli.py
+"""``qpfolio`` console script."""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="qpfolio", description="Quadratic programming portfolio optimization.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    solve = sub.add_parser("solve", help="Run a batch of solves described by a config file.")
+    solve.add_argument("--config", required=True, help="Job config (.json, .toml or .yaml).")
+    solve.add_argument("--output", help="Output file; overrides the config's 'output'.")
+    solve.add_argument("--format", choices=("csv", "jsonl", "parquet"),
+                       help="Output format; inferred from the output suffix by default.")
+    solve.add_argument("--workers", type=int, help="Parallel solves; overrides the config's 'workers'.")
+    solve.add_argument("--checkpoint", help="Checkpoint directory; finished solves are skipped on rerun.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    from qpfolio.batch import load_config, run_batch
+
+    cfg = load_config(args.config)
+    if args.checkpoint:
+        cfg["checkpoint"] = args.checkpoint
+    count = run_batch(cfg, output=args.output, workers=args.workers, fmt=args.format)
+    print(f"wrote {count} records", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
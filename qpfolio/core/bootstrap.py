@@ -0,0 +1,151 @@
+# qpfolio/core/bootstrap.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from qpfolio.core.types import Array
+
+METRICS = ("sharpe", "tracking_error", "diversification_ratio")
+
+
+@dataclass
+class BootstrapCI:
+    """
+    Bootstrap distribution of one metric for K portfolios.
+
+    - **estimate** (K,): metric on the original sample.
+    - **lower**, **upper** (K,): confidence bounds.
+    - **samples** (B, K): metric on every replicate.
+    """
+    estimate: Array
+    lower: Array
+    upper: Array
+    samples: Array
+
+
+def block_bootstrap_indices(
+    T: int,
+    n_boot: int,
+    block_length: Optional[int] = None,
+    *,
+    seed: Optional[int] = None,
+) -> Array:
+    """
+    Circular block-bootstrap index matrix of shape (n_boot, T).
+
+    Each row concatenates blocks of ``block_length`` consecutive periods
+    (wrapping around the end) starting at uniform random offsets, truncated
+    to T. ``block_length`` defaults to ``ceil(T ** (1/3))``; 1 gives the iid
+    bootstrap.
+    """
+    L = int(block_length or np.ceil(T ** (1.0 / 3.0)))
+    if not (1 <= L <= T):
+        raise ValueError("block_length must be in [1, T].")
+    n_blocks = -(-T // L)
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, T, size=(n_boot, n_blocks))
+    idx = (starts[:, :, None] + np.arange(L)) % T
+    return idx.reshape(n_boot, n_blocks * L)[:, :T]
+
+
+def _counts(idx: Array, T: int) -> Array:
+    """(B, T) matrix of how often each period appears in each replicate."""
+    B = idx.shape[0]
+    flat = (idx + T * np.arange(B)[:, None]).ravel()
+    return np.bincount(flat, minlength=B * T).reshape(B, T).astype(float)
+
+
+def _moments(C: Array, X: Array, T: int, ddof: int = 1):
+    # Mean and variance of every column of X in every replicate via two
+    # (B, T) @ (T, K) products; replicate order within T never matters for
+    # these moment-based metrics.
+    m = C @ X / T
+    var = (C @ (X * X) - T * m * m) / (T - ddof)
+    return m, np.clip(var, 0.0, None)
+
+
+def bootstrap_metrics(
+    returns: np.ndarray,
+    weights: np.ndarray,
+    *,
+    w_ref: Optional[np.ndarray] = None,
+    metrics: Sequence[str] = METRICS,
+    n_boot: int = 1000,
+    block_length: Optional[int] = None,
+    level: float = 0.95,
+    rf: float = 0.0,
+    freq: int = 1,
+    seed: Optional[int] = None,
+) -> Dict[str, BootstrapCI]:
+    """
+    Block-bootstrap confidence intervals for portfolio metrics.
+
+    Parameters
+    ~~~~~~~~~~
+    - **returns** (ndarray, shape (T, N)): Asset return history.
+    - **weights** (ndarray, shape (K, N) or (N,)): Portfolios to evaluate.
+    - **w_ref** (ndarray, shape (N,), optional): Benchmark; required for
+      ``"tracking_error"``.
+    - **metrics**: Any of ``"sharpe"``, ``"tracking_error"``,
+      ``"diversification_ratio"`` (same definitions as
+      :mod:`qpfolio.core.metrics`, with mu and Sigma re-estimated per replicate).
+    - **n_boot**, **block_length**, **seed**: See :func:`block_bootstrap_indices`.
+    - **level** (float): Two-sided confidence level of ``lower`` / ``upper``.
+    - **rf**, **freq**: Annual risk-free rate and annualization factor.
+
+    Returns
+    ~~~~~~~
+    - dict metric -> :class:`BootstrapCI`.
+
+    Notes
+    ~~~~~
+    The index matrix is drawn once and turned into a (B, T) count matrix,
+    so every statistic is a (B, T) @ (T, K) product on return series. No
+    replicate covariance matrix is formed: cost is O(B T (K + N)) instead of
+    O(B T N^2).
+    """
+    R = np.asarray(returns, dtype=float)
+    if R.ndim != 2:
+        raise ValueError(f"Expected 2D returns, got shape {R.shape}")
+    W = np.atleast_2d(np.asarray(weights, dtype=float))
+    T, N = R.shape
+    if W.shape[1] != N:
+        raise ValueError("weights must have N columns.")
+    unknown = set(metrics) - set(METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metrics {sorted(unknown)}; available: {list(METRICS)}.")
+    if "tracking_error" in metrics and w_ref is None:
+        raise ValueError("tracking_error requires w_ref.")
+
+    C = np.vstack([np.ones(T), _counts(block_bootstrap_indices(T, n_boot, block_length, seed=seed), T)])
+    P = R @ W.T  # (T, K) portfolio returns
+    m, v = _moments(C, P, T)
+    vol = np.sqrt(v * freq)
+
+    out: Dict[str, Array] = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "sharpe" in metrics:
+            out["sharpe"] = (m * freq - rf) / vol
+        if "tracking_error" in metrics:
+            active = P - (R @ np.asarray(w_ref, dtype=float))[:, None]
+            out["tracking_error"] = np.sqrt(_moments(C, active, T)[1] * freq)
+        if "diversification_ratio" in metrics:
+            _, v_assets = _moments(C, R, T)
+            out["diversification_ratio"] = (np.sqrt(v_assets * freq) @ W.T) / vol
+
+    q = [(1.0 - level) / 2.0, (1.0 + level) / 2.0]
+    result = {}
+    for name, vals in out.items():
+        lo, hi = np.nanquantile(vals[1:], q, axis=0)
+        result[name] = BootstrapCI(estimate=vals[0], lower=lo, upper=hi, samples=vals[1:])
+    return result
+
+
+__all__ = [
+    "BootstrapCI",
+    "block_bootstrap_indices",
+    "bootstrap_metrics",
+]
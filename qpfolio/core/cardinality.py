@@ -0,0 +1,161 @@
+# qpfolio/core/cardinality.py
+from __future__ import annotations
+
+import inspect
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from qpfolio.core.types import Array, CardinalitySpec, ProblemSpec, Solution, SolverInfo
+
+
+# ---------- Helpers ----------
+
+def restrict_problem(
+    problem: ProblemSpec,
+    keep: Array,
+    bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]] = None,
+) -> ProblemSpec:
+    """
+    Reduced problem over the variables ``keep`` with all others fixed at zero.
+
+    Columns of the dropped variables are removed from Q, c and every
+    constraint matrix; row bounds are unchanged (the dropped variables
+    contribute nothing at zero). ``bounds`` optionally replaces the bounds of
+    the kept variables.
+    """
+    keep = np.asarray(keep, dtype=np.int64)
+
+    def cols(M):
+        return None if M is None else M[:, keep]
+
+    Q = problem.Q.tocsr()[keep][:, keep] if hasattr(problem.Q, "tocsr") else problem.Q[np.ix_(keep, keep)]
+    if bounds is None and problem.bounds is not None:
+        bounds = [problem.bounds[i] for i in keep]
+    return ProblemSpec.trusted(
+        symmetric=problem.symmetric,
+        Q=Q,
+        c=problem.c[keep],
+        A=cols(problem.A),
+        l=problem.l,
+        u=problem.u,
+        bounds=bounds,
+        A_eq=cols(problem.A_eq),
+        b_eq=problem.b_eq,
+        A_ineq=cols(problem.A_ineq),
+        b_ineq=problem.b_ineq,
+        G=cols(problem.G),
+        h=problem.h,
+    )
+
+
+def solve_restricted(
+    solver,
+    problem: ProblemSpec,
+    keep: Array,
+    bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]] = None,
+    x0: Optional[Array] = None,
+) -> Solution:
+    """
+    Solve :func:`restrict_problem` ``(problem, keep, bounds)`` with ``solver``.
+
+    ``x0`` (length n, optional) warm-starts solvers that accept it (e.g.
+    MathOptOSQP) from its ``keep`` entries; others get a cold solve. The
+    returned Solution is over the kept variables only.
+    """
+    reduced = restrict_problem(problem, keep, bounds)
+    if x0 is not None and "x0" in inspect.signature(solver.solve).parameters:
+        return solver.solve(reduced, x0=np.asarray(x0, dtype=float)[keep])
+    return solver.solve(reduced)
+
+
+# ---------- Heuristic ----------
+
+def solve_cardinality_heuristic(
+    spec: CardinalitySpec,
+    solver,
+    *,
+    shrink: float = 0.5,
+    tol: float = 1e-6,
+) -> Solution:
+    """
+    Iterative-thresholding heuristic for cardinality and min-lot constraints.
+
+    1. Solve the continuous relaxation.
+    2. While more than ``max_names`` names are held, keep the largest
+       ``max(max_names, shrink * |support|)`` weights and re-solve the reduced
+       QP on that support, warm-started from the previous weights.
+    3. While a held name sits below ``min_weight``, drop the smallest and
+       re-solve; finally re-solve with lower bounds ``min_weight`` on the
+       support so every held name meets the lot.
+
+    Returns a Solution over all n variables; ``info["support"]`` lists the
+    held names and ``info["solves"]`` the number of QP solves. If a QP solve
+    fails, the status is ``"infeasible"`` (the solver's own status is in
+    ``info["inner_status"]``) and ``x`` is the last solved iterate cut down to
+    the ``max_names`` largest names that meet ``min_weight``; it respects the
+    name and lot limits but not necessarily the other constraints.
+    """
+    base = spec.base
+    n = base.Q.shape[0]
+    lo = np.array([b[0] if b[0] is not None else 0.0 for b in base.bounds], dtype=float)
+    hi = np.array([b[1] if b[1] is not None else np.inf for b in base.bounds], dtype=float)
+    if np.any(lo < 0):
+        raise ValueError("Cardinality heuristic requires nonnegative lower bounds.")
+
+    support = np.flatnonzero(hi > tol)  # fixed-to-zero names never enter
+    w = None
+    solves = 0
+
+    def solve_on(S: Array, floor: float) -> Solution:
+        nonlocal solves
+        solves += 1
+        bounds = [(max(floor, lo[i]), hi[i]) for i in S]
+        return solve_restricted(solver, base, S, bounds, w)
+
+    sol = solve_on(support, 0.0)
+    while True:
+        if not sol.solved:
+            break
+        w = np.zeros(n)
+        w[support] = sol.x
+        held = support[w[support] > tol]
+        if held.size > spec.max_names:
+            k = max(spec.max_names, int(np.ceil(shrink * held.size)))
+            support = held[np.argsort(-w[held], kind="stable")[:k]]
+        elif spec.min_weight > 0 and np.any(w[held] < spec.min_weight - tol):
+            below = held[w[held] < spec.min_weight - tol]
+            support = held[held != below[np.argmin(w[below])]]
+        else:
+            support = held
+            if spec.min_weight > 0:
+                sol = solve_on(support, spec.min_weight)
+                if sol.solved:
+                    w = np.zeros(n)
+                    w[support] = sol.x
+            break
+        if support.size == 0:
+            break
+        sol = solve_on(support, 0.0)
+
+    x = np.zeros(n) if w is None else w
+    status = sol.status
+    if not sol.solved:
+        # A reduced re-solve failed, so x is the last solved iterate and may
+        # still hold too many names or sub-lot weights: project it onto the
+        # limits and report it as infeasible rather than as a usable answer.
+        held = np.flatnonzero(x > tol)
+        held = held[np.argsort(-x[held], kind="stable")[:spec.max_names]]
+        held = held[x[held] >= spec.min_weight - tol]
+        x = np.where(np.isin(np.arange(n), held), x, 0.0)
+        support, status = np.sort(held), "infeasible"
+    obj = 0.5 * float(x @ (base.Q @ x)) + float(base.c @ x)
+    info = SolverInfo(status=status, support=support, solves=solves, inner_status=sol.status)
+    return Solution(x=x, obj=obj, status=status, info=info)
+
+
+__all__ = [
+    "restrict_problem",
+    "solve_restricted",
+    "solve_cardinality_heuristic",
+]
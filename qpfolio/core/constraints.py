@@ -0,0 +1,156 @@
+# qpfolio/core/constraints.py
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+
+from qpfolio.core.types import Array
+
+Limit = Union[None, float, Mapping[Hashable, float]]
+
+
+@lru_cache(maxsize=64)
+def _group_incidence(labels: Tuple[Hashable, ...]) -> Tuple[sp.csr_matrix, Tuple[Hashable, ...]]:
+    """
+    One sparse row per distinct label with a 1 for each member asset.
+    Cached by the label tuple, so repeated builds for the same universe reuse it.
+    """
+    names = tuple(dict.fromkeys(labels))
+    index = {g: k for k, g in enumerate(names)}
+    rows = np.fromiter((index[g] for g in labels), dtype=np.int64, count=len(labels))
+    cols = np.arange(len(labels))
+    M = sp.csr_matrix((np.ones(len(labels)), (rows, cols)), shape=(len(names), len(labels)))
+    return M, names
+
+
+def _limit_vector(names: Sequence[Hashable], limit: Limit, fill: float) -> Array:
+    if limit is None:
+        return np.full(len(names), fill)
+    if isinstance(limit, Mapping):
+        return np.array([float(limit.get(g, fill)) for g in names])
+    return np.full(len(names), float(limit))
+
+
+class ConstraintBuilder:
+    """
+    Assemble linear constraints ``l <= A w <= u`` as sparse rows.
+
+    Each ``add_*`` call appends a named block; :meth:`build` stacks them into a
+    CSC matrix once and caches it. Bounds of an existing block can be changed
+    with :meth:`set_limits` without re-assembling A, so rebalances that only
+    move caps or bands reuse the same structure (and OSQP sees a sparse A
+    instead of exposures folded into a dense P).
+
+    Example
+    -------
+    .. code-block:: python
+
+       cb = ConstraintBuilder(n)
+       cb.add_budget()
+       cb.add_group_limits(sectors, upper={"Tech": 0.30, "Energy": 0.05})
+       cb.add_exposure_band(E, lower=-0.1, upper=0.1)
+       A, l, u = cb.build()
+       spec = ProblemSpec(Q=Sigma, c=np.zeros(n), A=A, l=l, u=u, bounds=bounds)
+    """
+
+    def __init__(self, n: int):
+        self.n = int(n)
+        self._blocks: List[Tuple[str, sp.csr_matrix, Array, Array]] = []
+        self._A: Optional[sp.csc_matrix] = None
+
+    def _add(self, name: str, rows, lower: Array, upper: Array) -> "ConstraintBuilder":
+        if any(b[0] == name for b in self._blocks):
+            raise ValueError(f"Constraint block {name!r} already exists.")
+        rows = sp.csr_matrix(rows, dtype=float)
+        if rows.shape[1] != self.n:
+            raise ValueError(f"Block {name!r} must have {self.n} columns.")
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), (rows.shape[0],)).copy()
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), (rows.shape[0],)).copy()
+        if np.any(lower > upper):
+            raise ValueError(f"Block {name!r} has lower > upper.")
+        self._blocks.append((name, rows, lower, upper))
+        self._A = None
+        return self
+
+    def add_budget(self, total: float = 1.0, name: str = "budget") -> "ConstraintBuilder":
+        """Full-investment row ``sum(w) = total``."""
+        return self._add(name, np.ones((1, self.n)), total, total)
+
+    def add_group_limits(
+        self,
+        labels: Sequence[Hashable],
+        *,
+        lower: Limit = None,
+        upper: Limit = None,
+        name: str = "groups",
+    ) -> "ConstraintBuilder":
+        """
+        Group/sector rows ``lower_g <= sum_{i in g} w_i <= upper_g``.
+
+        ``labels`` gives each asset's group. ``lower``/``upper`` are a scalar
+        applied to every group or a mapping group -> limit; groups with
+        neither limit get no row.
+        """
+        if len(labels) != self.n:
+            raise ValueError("labels must have length n.")
+        M, names = _group_incidence(tuple(labels))
+        lo = _limit_vector(names, lower, -np.inf)
+        hi = _limit_vector(names, upper, np.inf)
+        keep = np.isfinite(lo) | np.isfinite(hi)
+        return self._add(name, M[keep], lo[keep], hi[keep])
+
+    def add_exposure_band(
+        self,
+        E,
+        *,
+        lower: Union[float, Array] = -np.inf,
+        upper: Union[float, Array] = np.inf,
+        name: str = "exposures",
+    ) -> "ConstraintBuilder":
+        """Factor/ESG exposure rows ``lower <= E w <= upper`` (E dense or sparse, shape (k, n))."""
+        return self._add(name, E, lower, upper)
+
+    def set_limits(
+        self,
+        name: str,
+        *,
+        lower: Optional[Union[float, Array]] = None,
+        upper: Optional[Union[float, Array]] = None,
+    ) -> "ConstraintBuilder":
+        """Change the bounds of an existing block, keeping the assembled A."""
+        for k, (b, rows, lo, hi) in enumerate(self._blocks):
+            if b == name:
+                if lower is not None:
+                    lo = np.broadcast_to(np.asarray(lower, dtype=float), lo.shape).copy()
+                if upper is not None:
+                    hi = np.broadcast_to(np.asarray(upper, dtype=float), hi.shape).copy()
+                self._blocks[k] = (b, rows, lo, hi)
+                return self
+        raise KeyError(name)
+
+    def block_rows(self) -> List[Tuple[str, int, int]]:
+        """``(name, start, stop)`` row ranges of each block in the built A."""
+        out, start = [], 0
+        for b, rows, _, _ in self._blocks:
+            out.append((b, start, start + rows.shape[0]))
+            start += rows.shape[0]
+        return out
+
+    def build(self) -> Tuple[sp.csc_matrix, Array, Array]:
+        """Return ``(A, l, u)`` with A in CSC form (assembled once, then cached)."""
+        if self._A is None:
+            if self._blocks:
+                self._A = sp.vstack([rows for _, rows, _, _ in self._blocks], format="csc")
+            else:
+                self._A = sp.csc_matrix((0, self.n))
+        l = np.concatenate([lo for _, _, lo, _ in self._blocks]) if self._blocks else np.zeros(0)
+        u = np.concatenate([hi for _, _, _, hi in self._blocks]) if self._blocks else np.zeros(0)
+        return self._A, l, u
+
+
+__all__ = [
+    "ConstraintBuilder",
+]
@@ -1,14 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, Tuple
+
 import numpy as np
-from typing import Tuple
+
+# Periods per random stream in simulate_mvn_returns. Part of the seed
+# contract: changing it changes every simulated return.
+STREAM_BLOCK = 1024
+
+
+def rng_stream(seed: Optional[int], *key: int) -> np.random.Generator:
+    """
+    Independent generator for the stream ``key`` under ``seed``.
+
+    Equivalent to following ``SeedSequence(seed).spawn`` children down the
+    path ``key`` (``rng_stream(s, 3)`` is the 4th child of ``s``), but any
+    stream can be built directly, so shards of a simulation on different
+    workers or nodes draw exactly what a single process would.
+    """
+    root = np.random.SeedSequence(seed)
+    return np.random.default_rng(
+        np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + tuple(key))
+    )
 
 
-def simulate_mvn_returns(n_assets: int, n_periods: int, seed: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Simulate multivariate normal returns and return (R, mu, Sigma)."""
-    rng = np.random.default_rng(seed)
-    mu = rng.normal(0.08, 0.05, size=n_assets)
-    A = rng.normal(size=(n_assets, n_assets))
+def map_streams(fn: Callable[[int], np.ndarray], keys: Sequence[int], workers: int = 1) -> list:
+    """``[fn(k) for k in keys]``, on ``workers`` threads when > 1 (order preserved)."""
+    if workers > 1 and len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, keys))
+    return [fn(k) for k in keys]
+
+
+def simulate_mvn_returns(
+    n_assets: int,
+    n_periods: int,
+    seed: Optional[int] = 1,
+    *,
+    start: int = 0,
+    workers: int = 1,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulate multivariate normal returns and return (R, mu, Sigma).
+
+    mu and Sigma come from stream 0 of ``seed``; returns are drawn in fixed
+    blocks of ``STREAM_BLOCK`` periods, block b from its own stream (1, b).
+    ``R`` holds periods ``start .. start + n_periods - 1`` of that sequence,
+    so shards computed separately (or on any number of ``workers``)
+    concatenate to the bit-identical single-run result.
+    """
+    if seed is None:
+        # Fix the entropy once so parameters and all blocks share one root.
+        seed = np.random.SeedSequence().entropy
+    params = rng_stream(seed, 0)
+    mu = params.normal(0.08, 0.05, size=n_assets)
+    A = params.normal(size=(n_assets, n_assets))
     Sigma = A @ A.T
     # scale covariance to reasonable annualized volatility
     Sigma = Sigma / np.max(np.linalg.eigvalsh(Sigma)) * 0.15 ** 2
-    R = rng.multivariate_normal(mean=mu / 252.0, cov=Sigma / 252.0, size=n_periods)
+    L = np.linalg.cholesky(Sigma / 252.0 + 1e-14 * np.eye(n_assets))
+
+    def block(b: int) -> np.ndarray:
+        Z = rng_stream(seed, 1, b).standard_normal((STREAM_BLOCK, n_assets))
+        return mu / 252.0 + Z @ L.T
+
+    stop = start + n_periods
+    first, last = start // STREAM_BLOCK, -(-stop // STREAM_BLOCK)
+    blocks = map_streams(block, range(first, last), workers)
+    if not blocks:
+        return np.empty((0, n_assets)), mu, Sigma
+    off = first * STREAM_BLOCK
+    R = np.concatenate(blocks)[start - off:stop - off]
     return R, mu, Sigma
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
 import numpy as np
-from typing import Tuple
 
 
 def sample_mean_cov(
@@ -9,6 +11,7 @@ def sample_mean_cov(
     *,
     freq: int = 1,
     ddof: int = 1,
+    chunk_size: Optional[int] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Estimate sample mean vector and covariance matrix for asset returns.
@@ -18,6 +21,8 @@ def sample_mean_cov(
     - **x** (ndarray, shape (T, N)): Return observations. Rows = time, columns = assets.
     - **freq** (int, default 1): Scaling factor (e.g., 252 for daily→annualized).
     - **ddof** (int, default 1): Degrees of freedom for covariance (passed to ``numpy.cov``).
+    - **chunk_size** (int, optional): Read ``x`` in row chunks of this size
+      (two passes), so a memory-mapped panel is never loaded whole.
 
     Returns
     ~~~~~~~
@@ -43,6 +48,8 @@ def sample_mean_cov(
 
     if x.ndim != 2:
         raise ValueError(f"Expected 2D array, got shape {x.shape}")
+    if chunk_size is not None:
+        return _chunked_mean_cov(x, freq=freq, ddof=ddof, chunk_size=chunk_size)
 
     # Mean vector
     mu = np.mean(x, axis=0)
@@ -54,3 +61,125 @@ def sample_mean_cov(
     Sigma *= freq
 
     return mu, Sigma
+
+
+@dataclass
+class FactorModel:
+    """
+    Statistical factor model ``Sigma = B F B^T + diag(d)``.
+
+    - **mu** (N,): mean returns.
+    - **B** (N, k): loadings (orthonormal principal directions).
+    - **F** (k, k): factor covariance (diagonal, descending).
+    - **d** (N,): specific variances.
+    """
+    mu: np.ndarray
+    B: np.ndarray
+    F: np.ndarray
+    d: np.ndarray
+
+    def covariance(self) -> np.ndarray:
+        """Dense N x N covariance (only for moderate N)."""
+        return (self.B * np.diag(self.F)) @ self.B.T + np.diag(self.d)
+
+    def matvec(self, v: np.ndarray) -> np.ndarray:
+        """``Sigma @ v`` in O(N k) without forming Sigma."""
+        return self.B @ (self.F @ (self.B.T @ v)) + self.d * v
+
+
+def _row_chunks(x: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    for start in range(0, x.shape[0], chunk_size):
+        yield np.asarray(x[start:start + chunk_size], dtype=float)
+
+
+def _chunked_mean_cov(x: np.ndarray, *, freq: int, ddof: int, chunk_size: int):
+    T, N = x.shape
+    total = np.zeros(N)
+    for chunk in _row_chunks(x, chunk_size):
+        total += chunk.sum(axis=0)
+    mu = total / T
+    S = np.zeros((N, N))
+    for chunk in _row_chunks(x, chunk_size):
+        chunk = chunk - mu
+        S += chunk.T @ chunk
+    return mu * freq, S / (T - ddof) * freq
+
+
+def factor_model_from_returns(
+    x: np.ndarray,
+    k: int,
+    *,
+    freq: int = 1,
+    ddof: int = 1,
+    n_iter: int = 4,
+    oversample: int = 10,
+    chunk_size: int = 4096,
+    seed: Optional[int] = None,
+) -> FactorModel:
+    """
+    Extract a k-factor model directly from a (T, N) return panel by
+    randomized subspace iteration, without forming the N x N covariance.
+
+    Parameters
+    ~~~~~~~~~~
+    - **x** (ndarray or memmap, shape (T, N)): Return observations; read in
+      row chunks of ``chunk_size``, so a ``np.load(..., mmap_mode="r")``
+      panel never has to fit in memory.
+    - **k** (int): Number of factors.
+    - **freq**, **ddof**: As in :func:`sample_mean_cov`.
+    - **n_iter** (int): Power iterations; more sharpens the factors when the
+      spectrum decays slowly.
+    - **oversample** (int): Extra subspace dimensions for accuracy.
+    - **seed** (int, optional): Seed of the random start.
+
+    Returns
+    ~~~~~~~
+    - **FactorModel** with loadings ``B`` (the top-k principal directions of
+      the centered returns), diagonal factor covariance ``F`` and specific
+      variances ``d`` (the residual diagonal, floored at zero) such that
+      ``B F B^T + diag(d)`` matches the sample covariance on its diagonal.
+
+    Notes
+    ~~~~~
+    Makes ``n_iter + 2`` passes over the data, each costing O(T N (k + oversample)).
+    """
+    if x.ndim != 2:
+        raise ValueError(f"Expected 2D array, got shape {x.shape}")
+    T, N = x.shape
+    if not (1 <= k <= min(T - ddof, N)):
+        raise ValueError("k must be in [1, min(T - ddof, N)].")
+    ell = min(k + oversample, N)
+
+    # Pass 1: column means.
+    total = np.zeros(N)
+    for chunk in _row_chunks(x, chunk_size):
+        total += chunk.sum(axis=0)
+    mu = total / T
+
+    # Subspace iteration on the Gram matrix G = Xc^T Xc, one pass per product;
+    # the last pass also accumulates the centered column variances.
+    rng = np.random.default_rng(seed)
+    Q, _ = np.linalg.qr(rng.standard_normal((N, ell)))
+    for it in range(n_iter + 1):
+        Z = np.zeros((N, ell))
+        H = np.zeros((ell, ell))
+        sq = np.zeros(N)
+        for chunk in _row_chunks(x, chunk_size):
+            chunk = chunk - mu
+            Y = chunk @ Q
+            if it < n_iter:
+                Z += chunk.T @ Y
+            else:
+                H += Y.T @ Y
+                sq += np.einsum("ij,ij->j", chunk, chunk)
+        if it < n_iter:
+            Q, _ = np.linalg.qr(Z)
+    var = sq / (T - ddof)
+
+    # Rayleigh-Ritz on the final subspace: H = Q^T G Q.
+    lam, W = np.linalg.eigh(H)
+    top = np.argsort(lam)[::-1][:k]
+    B = Q @ W[:, top]
+    f = np.clip(lam[top], 0.0, None) / (T - ddof)
+    d = np.clip(var - (B * B) @ f, 0.0, None)
+    return FactorModel(mu=mu * freq, B=B, F=np.diag(f * freq), d=d * freq)
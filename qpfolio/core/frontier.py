@@ -1,20 +1,99 @@
-from typing import Iterable, List, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
 from .models import build_mvo_problem
-from .types import Solution
+from .types import Solution, SolverInfo
+
+
+def _active_set_key(x: np.ndarray, mu: np.ndarray, r_target: float, tol: float) -> bytes:
+    """
+    Active-set signature of a long-only MVO solution: which weights sit at 0,
+    which sit at 1, and whether the return constraint binds.
+    """
+    at_lo = x <= tol
+    at_hi = x >= 1.0 - tol
+    ret_binds = np.array([float(x @ mu) <= r_target + tol])
+    return np.concatenate([at_lo, at_hi, ret_binds]).tobytes()
+
+
+def feasible_return_range(
+    mu: np.ndarray,
+    lower: Union[float, np.ndarray] = 0.0,
+    upper: Union[float, np.ndarray] = 1.0,
+) -> Tuple[float, float]:
+    """
+    Closed-form range of attainable portfolio returns ``mu @ w`` over
+    ``{w : sum(w) = 1, lower <= w <= upper}``.
+
+    This is a continuous knapsack, so each end is reached greedily: start every
+    weight at its lower bound and spend the remaining budget on the highest (or
+    lowest) returning assets up to their caps. No solver call is needed.
+    """
+    mu = np.asarray(mu, dtype=float)
+    lo = np.broadcast_to(np.asarray(lower, dtype=float), mu.shape)
+    hi = np.broadcast_to(np.asarray(upper, dtype=float), mu.shape)
+    budget = 1.0 - lo.sum()
+    if budget < 0.0 or hi.sum() < 1.0:
+        raise ValueError("Bounds admit no fully-invested portfolio.")
+
+    cap = hi - lo
+
+    def greedy(order: np.ndarray) -> float:
+        before = np.cumsum(cap[order]) - cap[order]
+        take = np.clip(budget - before, 0.0, cap[order])
+        return float(lo @ mu + take @ mu[order])
+
+    order = np.argsort(mu)
+    return greedy(order), greedy(order[::-1])
+
+
+def _interpolated_solution(x: np.ndarray, Sigma: np.ndarray) -> Solution:
+    obj = 0.5 * float(x @ Sigma @ x)
+    return Solution(x=x, obj=obj, status="solved", info=SolverInfo(status="solved", interpolated=True))
 
 
 # noinspection PyCompatibility
-def compute_frontier(mu: np.ndarray, Sigma: np.ndarray, targets: Iterable[float], solver) -> List[Tuple[float, float, Solution]]:
-    """Return list of (risk, ret, solution) along frontier."""
+def compute_frontier(
+    mu: np.ndarray,
+    Sigma: np.ndarray,
+    targets: Iterable[float],
+    solver,
+    *,
+    interpolate: bool = True,
+    n_anchors: int = 5,
+    active_tol: float = 1e-6,
+    infeasible: str = "drop",
+) -> List[Tuple[float, float, Solution]]:
+    """
+    Return list of (risk, ret, solution) along frontier.
+
+    With ``interpolate=True`` (default), only a sparse set of ``n_anchors``
+    targets is solved up front. The long-only MVO weights are piecewise linear
+    in the target return, with breakpoints where the active set changes, so
+    between two solved neighbours that share an active set every intermediate
+    target is filled by exact linear interpolation. Where the active sets
+    differ, the interval is bisected and solved further. Interpolated points
+    carry ``info["interpolated"] = True``.
+
+    With ``interpolate=False``, every target is solved independently.
+
+    Targets above the largest attainable return (see
+    :func:`feasible_return_range`) are handled before any solve according to
+    ``infeasible``: ``"drop"`` (default) skips them, ``"clip"`` clamps them to
+    the maximum attainable return, and ``"raise"`` raises ``ValueError``.
+    Targets below the minimum are always feasible (the return constraint is
+    simply slack) and are kept.
+    """
+    targets = _screen_targets(np.asarray(list(targets), dtype=float), mu, infeasible)
+    if interpolate:
+        sols = _frontier_solutions_interpolated(mu, Sigma, np.sort(targets), solver, n_anchors, active_tol)
+    else:
+        sols = [solver.solve(build_mvo_problem(mu, Sigma, r_target=R, long_only=True)) for R in targets]
+
     points = []
-    for R in targets:
-        prob = build_mvo_problem(mu, Sigma, r_target=R, long_only=True)
-        sol = solver.solve(prob)
-        status = (sol.status or "").lower()
-        if not status.startswith("solved"):
+    for sol in sols:
+        if sol is None or not sol.solved:
             continue  # skip infeasible or non-optimal points
         risk = float(np.sqrt(sol.x @ Sigma @ sol.x))
         ret = float(sol.x @ mu)
@@ -22,3 +101,61 @@ def compute_frontier(mu: np.ndarray, Sigma: np.ndarray, targets: Iterable[float]
     # ensure increasing risk order (tiny jitter possible)
     points.sort(key=lambda t: t[0])
     return points
+
+
+def _screen_targets(targets: np.ndarray, mu: np.ndarray, infeasible: str) -> np.ndarray:
+    if infeasible not in ("drop", "clip", "raise"):
+        raise ValueError("infeasible must be one of 'drop', 'clip', 'raise'.")
+    _, r_max = feasible_return_range(mu)
+    over = targets > r_max + 1e-12 * max(1.0, abs(r_max))
+    if not over.any():
+        return targets
+    if infeasible == "raise":
+        raise ValueError(f"Targets {targets[over].tolist()} exceed the maximum attainable return {r_max:.6g}.")
+    if infeasible == "clip":
+        return np.where(over, r_max, targets)
+    return targets[~over]
+
+
+def _frontier_solutions_interpolated(
+    mu: np.ndarray,
+    Sigma: np.ndarray,
+    targets: np.ndarray,
+    solver,
+    n_anchors: int,
+    active_tol: float,
+) -> List[Optional[Solution]]:
+    """Solve anchors, bisect across active-set changes, interpolate the rest."""
+    K = targets.size
+    sols: List[Optional[Solution]] = [None] * K
+    keys: List[Optional[bytes]] = [None] * K
+    if K == 0:
+        return sols
+
+    def solve_at(k: int) -> None:
+        sol = solver.solve(build_mvo_problem(mu, Sigma, r_target=targets[k], long_only=True))
+        sols[k] = sol
+        if sol.solved:
+            keys[k] = _active_set_key(sol.x, mu, targets[k], active_tol)
+
+    anchors = np.unique(np.linspace(0, K - 1, max(2, min(n_anchors, K))).round().astype(int))
+    for k in anchors:
+        solve_at(int(k))
+
+    stack = [(int(i), int(j)) for i, j in zip(anchors[:-1], anchors[1:])]
+    while stack:
+        i, j = stack.pop()
+        if j - i <= 1:
+            continue
+        if keys[i] is not None and keys[i] == keys[j]:
+            xi, xj = sols[i].x, sols[j].x
+            span = targets[j] - targets[i]
+            for k in range(i + 1, j):
+                t = (targets[k] - targets[i]) / span if span > 0 else 0.0
+                sols[k] = _interpolated_solution(xi + t * (xj - xi), Sigma)
+        else:
+            m = (i + j) // 2
+            solve_at(m)
+            stack.append((i, m))
+            stack.append((m, j))
+    return sols
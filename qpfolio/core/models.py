@@ -1,11 +1,25 @@
+from typing import Optional, Sequence, Tuple, Union
+
 import numpy as np
+import scipy.sparse as sp
+
 from .types import ProblemSpec
 
 
-def build_mvo_problem(mu: np.ndarray, Sigma: np.ndarray, r_target: float, long_only: bool = True) -> ProblemSpec:
-    """Min-variance subject to target return and full investment."""
+def _make_spec(trusted: bool, **kwargs) -> ProblemSpec:
+    return ProblemSpec.trusted(**kwargs) if trusted else ProblemSpec(**kwargs)
+
+
+def build_mvo_problem(mu: np.ndarray, Sigma: np.ndarray, r_target: float, long_only: bool = True,
+                      *, trusted: bool = False) -> ProblemSpec:
+    """
+    Min-variance subject to target return and full investment.
+
+    With ``trusted=True``, Sigma is taken by reference (no copy) and assumed
+    symmetric, and the spec skips validation.
+    """
     n = Sigma.shape[0]
-    Q = Sigma.copy()
+    Q = Sigma if trusted else Sigma.copy()
     c = np.zeros(n)
 
     # Equality: sum w = 1
@@ -17,13 +31,14 @@ def build_mvo_problem(mu: np.ndarray, Sigma: np.ndarray, r_target: float, long_o
     b_ineq = np.array([-r_target])
 
     bounds = [(0.0, 1.0) if long_only else (-1.0, 1.0) for _ in range(n)]
-    return ProblemSpec(Q=Q, c=c, A_eq=A_eq, b_eq=b_eq, A_ineq=A_ineq, b_ineq=b_ineq, bounds=bounds)
+    return _make_spec(trusted, Q=Q, c=c, A_eq=A_eq, b_eq=b_eq, A_ineq=A_ineq, b_ineq=b_ineq, bounds=bounds)
 
 
-def build_mdp_problem(sigmas: np.ndarray, Sigma: np.ndarray, long_only: bool = True) -> ProblemSpec:
+def build_mdp_problem(sigmas: np.ndarray, Sigma: np.ndarray, long_only: bool = True,
+                      *, trusted: bool = False) -> ProblemSpec:
     """MDP via variance-min with normalization w^T sigma = 1."""
     n = Sigma.shape[0]
-    Q = Sigma.copy()
+    Q = Sigma if trusted else Sigma.copy()
     c = np.zeros(n)
 
     A_eq = sigmas.reshape(1, -1)
@@ -33,11 +48,227 @@ def build_mdp_problem(sigmas: np.ndarray, Sigma: np.ndarray, long_only: bool = T
     b_ineq = None
 
     bounds = [(0.0, 1.0) if long_only else (-1.0, 1.0) for _ in range(n)]
-    return ProblemSpec(Q=Q, c=c, A_eq=A_eq, b_eq=b_eq, A_ineq=A_ineq, b_ineq=b_ineq, bounds=bounds)
+    return _make_spec(trusted, Q=Q, c=c, A_eq=A_eq, b_eq=b_eq, A_ineq=A_ineq, b_ineq=b_ineq, bounds=bounds)
 
 
 def build_dro_lite_problem(mu: np.ndarray, Sigma: np.ndarray, r_target: float, gamma: float = 0.0,
-                           long_only: bool = True) -> ProblemSpec:
+                           long_only: bool = True, *, trusted: bool = False) -> ProblemSpec:
     """Moment-robust MVO: inflate covariance by gamma*diag(Sigma)."""
     Sigma_robust = Sigma + gamma * np.diag(np.diag(Sigma))
-    return build_mvo_problem(mu, Sigma_robust, r_target, long_only=long_only)
+    return build_mvo_problem(mu, Sigma_robust, r_target, long_only=long_only, trusted=trusted)
+
+
+def build_transaction_cost_problem(
+    Q: np.ndarray,
+    c: np.ndarray,
+    w_prev: np.ndarray,
+    *,
+    buy_cost: Union[float, np.ndarray],
+    sell_cost: Union[float, np.ndarray],
+    turnover_budget: Optional[float] = None,
+    A=None,
+    l: Optional[np.ndarray] = None,
+    u: Optional[np.ndarray] = None,
+    bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]] = None,
+) -> ProblemSpec:
+    """
+    Lift a QP in w to one with linear buy/sell costs via split trade variables.
+
+    Variables are z = [w, b, s] (3n) with w = w_prev + b - s and b, s >= 0:
+
+        minimize 0.5 w^T Q w + c^T w + buy_cost^T b + sell_cost^T s
+        s.t.     w - b + s = w_prev
+                 l <= A w <= u                    (optional, e.g. sum(w) = 1)
+                 sum(b) + sum(s) <= turnover_budget  (optional)
+                 bounds on w; b, s >= 0
+
+    With positive costs, at most one of b_i, s_i is nonzero at the optimum,
+    so ``buy_cost^T b + sell_cost^T s`` is the exact L1 trading cost. The
+    result is a sparse triplet ProblemSpec; slice ``x[:n]`` for weights,
+    ``x[n:2n]`` for buys and ``x[2n:]`` for sells.
+    """
+    n = Q.shape[0]
+    w_prev = np.asarray(w_prev, dtype=float)
+    if w_prev.shape != (n,):
+        raise ValueError("w_prev must have shape (n,).")
+    cb = np.broadcast_to(np.asarray(buy_cost, dtype=float), (n,))
+    cs = np.broadcast_to(np.asarray(sell_cost, dtype=float), (n,))
+    if np.any(cb < 0) or np.any(cs < 0):
+        raise ValueError("Transaction costs must be nonnegative.")
+
+    Qsp = sp.csc_matrix(Q)
+    P = sp.block_diag([Qsp, sp.csc_matrix((2 * n, 2 * n))], format="csc")
+    q = np.concatenate([np.asarray(c, dtype=float), cb, cs])
+
+    I = sp.identity(n, format="csr")
+    rows = [sp.hstack([I, -I, I])]
+    lo = [w_prev]
+    hi = [w_prev]
+    if A is not None:
+        A = sp.csr_matrix(A)
+        rows.append(sp.hstack([A, sp.csr_matrix((A.shape[0], 2 * n))]))
+        lo.append(np.asarray(l, dtype=float))
+        hi.append(np.asarray(u, dtype=float))
+    if turnover_budget is not None:
+        rows.append(sp.hstack([sp.csr_matrix((1, n)), sp.csr_matrix(np.ones((1, 2 * n)))]))
+        lo.append(np.array([-np.inf]))
+        hi.append(np.array([float(turnover_budget)]))
+
+    A_z = sp.vstack(rows, format="csc")
+    w_bounds = list(bounds) if bounds is not None else [(None, None)] * n
+    z_bounds = w_bounds + [(0.0, None)] * (2 * n)
+    return ProblemSpec(Q=P, c=q, A=A_z, l=np.concatenate(lo), u=np.concatenate(hi), bounds=z_bounds)
+
+
+def build_cvar_problem(
+    scenarios,
+    *,
+    beta: float = 0.95,
+    probabilities: Optional[np.ndarray] = None,
+    mu: Optional[np.ndarray] = None,
+    r_target: Optional[float] = None,
+    long_only: bool = True,
+    reg: float = 0.0,
+) -> ProblemSpec:
+    """
+    Mean-CVaR problem over return scenarios (Rockafellar-Uryasev LP).
+
+    Variables are z = [w, alpha, t] (n + 1 + S):
+
+        minimize alpha + 1/(1 - beta) * sum_s p_s t_s  (+ 0.5 reg ||w||^2)
+        s.t.     r_s^T w + alpha + t_s >= 0,  t >= 0
+                 sum(w) = 1
+                 mu^T w >= r_target                 (optional)
+
+    At the optimum ``alpha`` is the beta-VaR and the objective the beta-CVaR
+    of the portfolio loss. ``scenarios`` (S, n) may be dense or scipy.sparse.
+    Float CSR input is used as-is: its entries are written once, unnegated,
+    straight into a CSR constraint matrix of nnz(scenarios) + 2S + 2n entries
+    (no dense S x (n + 1 + S) block, no intermediate copies). ``mu`` defaults
+    to the probability-weighted scenario mean. ``reg > 0`` adds a small ridge
+    term so the problem is a strictly convex QP. Slice ``x[:n]`` for weights
+    and ``x[n]`` for VaR.
+
+    Use :func:`qpfolio.core.scenarios.reduce_scenarios` first to bound S. As
+    a pure LP (``reg=0``) it converges much faster under OSQP with a looser
+    ``eps_abs``/``eps_rel`` (around 1e-5) and polishing than at the defaults.
+    """
+    Rsp = sp.csr_matrix(scenarios, dtype=float)  # no conversion for float CSR input
+    S, n = Rsp.shape
+    if not (0.0 < beta < 1.0):
+        raise ValueError("beta must be in (0, 1).")
+    p = np.full(S, 1.0 / S) if probabilities is None else np.asarray(probabilities, dtype=float)
+    if p.shape != (S,) or np.any(p < 0):
+        raise ValueError("probabilities must be a nonnegative vector of length S.")
+    p = p / p.sum()
+
+    Q = sp.diags(np.concatenate([np.full(n, float(reg)), np.zeros(1 + S)]), format="csc")
+    c = np.concatenate([np.zeros(n), [1.0], p / (1.0 - beta)])
+
+    # Assemble A in CSR in one pass: S loss rows [r_s, 1, e_s], the budget
+    # row and the optional return row.
+    extra = 1 if r_target is None else 2
+    counts = np.concatenate([np.diff(Rsp.indptr) + 2, np.full(extra, n)])
+    indptr = np.zeros(S + extra + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    data = np.ones(indptr[-1])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    pos = np.arange(Rsp.nnz) + 2 * np.repeat(np.arange(S), np.diff(Rsp.indptr))
+    data[pos] = Rsp.data
+    indices[pos] = Rsp.indices
+    ends = indptr[1:S + 1]
+    indices[ends - 2] = n
+    indices[ends - 1] = n + 1 + np.arange(S)
+    indices[indptr[S]:] = np.tile(np.arange(n), extra)
+    lo = np.concatenate([np.zeros(S), [1.0]])
+    hi = np.concatenate([np.full(S, np.inf), [1.0]])
+    if r_target is not None:
+        m = np.asarray(Rsp.T @ p).ravel() if mu is None else np.asarray(mu, dtype=float)
+        data[indptr[S + 1]:] = m
+        lo = np.append(lo, float(r_target))
+        hi = np.append(hi, np.inf)
+    A = sp.csr_matrix((data, indices, indptr), shape=(S + extra, n + 1 + S))
+
+    w_bounds = [(0.0, 1.0) if long_only else (None, None)] * n
+    bounds = w_bounds + [(None, None)] + [(0.0, None)] * S
+    return ProblemSpec(Q=Q, c=c, A=A, l=lo, u=hi, bounds=bounds)
+
+
+def build_multi_period_problem(
+    mus: Sequence[np.ndarray],
+    Sigmas: Sequence[np.ndarray],
+    w0: np.ndarray,
+    *,
+    risk_aversion: Union[float, Sequence[float]] = 1.0,
+    buy_cost: Union[float, np.ndarray] = 0.0,
+    sell_cost: Union[float, np.ndarray] = 0.0,
+    turnover_budget: Optional[float] = None,
+    long_only: bool = True,
+) -> ProblemSpec:
+    """
+    Time-coupled mean-variance problem over T periods with trading costs.
+
+    Variables are z = [w_1, b_1, s_1, ..., w_T, b_T, s_T] (3nT), with w_t the
+    holdings after trading b_t (buys) and s_t (sells) at the start of period t:
+
+        minimize sum_t 0.5 gamma_t w_t^T Sigma_t w_t - mu_t^T w_t
+                       + buy_cost^T b_t + sell_cost^T s_t
+        s.t.     w_t - w_{t-1} - b_t + s_t = 0   (w_0 given)
+                 sum(w_t) = 1
+                 sum(b_t) + sum(s_t) <= turnover_budget   (optional, per period)
+                 b_t, s_t >= 0; w_t in [0, 1] when long_only
+
+    Variables are ordered period by period, so Q is block diagonal and A
+    block bidiagonal: only the turnover link touches two consecutive periods.
+    The KKT matrix is block-banded, and the fill-reducing ordering of the
+    sparse LDL^T factorization in OSQP keeps it that way, so setup and
+    per-iteration cost grow linearly in T. Use :func:`multi_period_weights`
+    to read the (T, n) holdings from the solution.
+    """
+    T = len(mus)
+    if T == 0 or len(Sigmas) != T:
+        raise ValueError("mus and Sigmas must be nonempty sequences of equal length T.")
+    w0 = np.asarray(w0, dtype=float)
+    n = w0.size
+    gam = np.broadcast_to(np.asarray(risk_aversion, dtype=float), (T,))
+    cb = np.broadcast_to(np.asarray(buy_cost, dtype=float), (n,))
+    cs = np.broadcast_to(np.asarray(sell_cost, dtype=float), (n,))
+    if np.any(cb < 0) or np.any(cs < 0):
+        raise ValueError("Transaction costs must be nonnegative.")
+    for mu, Sigma in zip(mus, Sigmas):
+        if np.shape(mu) != (n,) or np.shape(Sigma) != (n, n):
+            raise ValueError("Each mu must have shape (n,) and each Sigma (n, n), with n = len(w0).")
+
+    zero = sp.csc_matrix((2 * n, 2 * n))
+    Q = sp.block_diag(
+        [blk for g, S in zip(gam, Sigmas) for blk in (g * sp.csc_matrix(S), zero)], format="csc"
+    )
+    c = np.concatenate([np.concatenate([-np.asarray(mu, dtype=float), cb, cs]) for mu in mus])
+
+    # Rows of period t: [dynamics (n); budget (1); turnover (0/1)]
+    I = sp.identity(n, format="csr")
+    local = [sp.hstack([I, -I, I]), sp.hstack([np.ones((1, n)), sp.csr_matrix((1, 2 * n))])]
+    lo_t = [np.zeros(n), np.array([1.0])]
+    hi_t = [np.zeros(n), np.array([1.0])]
+    if turnover_budget is not None:
+        local.append(sp.hstack([sp.csr_matrix((1, n)), np.ones((1, 2 * n))]))
+        lo_t.append(np.array([-np.inf]))
+        hi_t.append(np.array([float(turnover_budget)]))
+    D = sp.vstack(local, format="csr")
+    m = D.shape[0]
+    # -w_{t-1} in the dynamics rows of period t (the only off-diagonal block)
+    L = sp.csr_matrix((-np.ones(n), (np.arange(n), np.arange(n))), shape=(m, 3 * n))
+    A = sp.kron(sp.identity(T), D, format="csc") + sp.kron(sp.eye(T, k=-1), L, format="csc")
+
+    lo = np.tile(np.concatenate(lo_t), T)
+    hi = np.tile(np.concatenate(hi_t), T)
+    lo[:n] = hi[:n] = w0  # w_1 - b_1 + s_1 = w_0
+
+    w_bounds = [(0.0, 1.0) if long_only else (None, None)] * n
+    bounds = (w_bounds + [(0.0, None)] * (2 * n)) * T
+    return ProblemSpec(Q=Q, c=c, A=A, l=lo, u=hi, bounds=bounds)
+
+
+def multi_period_weights(x: np.ndarray, n: int) -> np.ndarray:
+    """(T, n) holdings from a solution of :func:`build_multi_period_problem`."""
+    return np.asarray(x).reshape(-1, 3, n)[:, 0, :]
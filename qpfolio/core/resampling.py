@@ -0,0 +1,169 @@
+# qpfolio/core/resampling.py
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from qpfolio.core.frontier import feasible_return_range
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.core.types import Array, Solution, SolverInfo
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+@dataclass
+class ResampledFrontier:
+    """
+    Result of :func:`resampled_frontier`.
+
+    - **weights** (P, N): rank-associated average weights (the resampled frontier).
+    - **risk**, **ret** (P,): risk and return of ``weights`` under the input mu/Sigma.
+    - **resampled_weights** (R, P, N): frontier weights of every resample.
+    - **resampled_risk**, **resampled_ret** (R, P): each resample's frontier
+      evaluated under the input mu/Sigma (NaN where a point did not solve).
+    - **solved** (R, P): which points solved.
+    """
+    weights: Array
+    risk: Array
+    ret: Array
+    resampled_weights: Array
+    resampled_risk: Array
+    resampled_ret: Array
+    solved: Array
+
+    def points(self) -> List[Tuple[float, float, Solution]]:
+        """``(risk, ret, Solution)`` triples, as returned by ``compute_frontier``."""
+        return [
+            (float(r), float(m), Solution(x=w, obj=0.5 * r * r, status="solved",
+                                           info=SolverInfo(status="solved", resampled=True)))
+            for r, m, w in zip(self.risk, self.ret, self.weights)
+        ]
+
+    def curves(self) -> Array:
+        """(R, P, 2) risk/return array for :func:`qpfolio.core.visualize.plot_frontiers`."""
+        return np.stack([self.resampled_risk, self.resampled_ret], axis=2)
+
+
+# ---------- Helpers ----------
+
+def _batched_mean_cov(X: Array, freq: int) -> Tuple[Array, Array]:
+    """Means (R, N) and covariances (R, N, N) of R return samples X (R, T, N) in two batched ops."""
+    mu = X.mean(axis=1)
+    Xc = X - mu[:, None, :]
+    S = np.matmul(Xc.transpose(0, 2, 1), Xc) / (X.shape[1] - 1)
+    return mu * freq, S * freq
+
+
+def _frontier_path(mu: Array, Sigma: Array, n_points: int, solver) -> List[Solution]:
+    """
+    Rank-associated frontier of one sample: ``n_points`` targets equally
+    spaced from the minimum-variance return to the maximum attainable return.
+    """
+    r_lo, r_hi = feasible_return_range(mu)
+    prob = build_mvo_problem(mu, Sigma, r_target=r_lo, trusted=True)
+    if not hasattr(solver, "path_session"):
+        gmv = solver.solve(prob)
+        targets = np.linspace(float(gmv.x @ mu), r_hi, n_points)
+        return [solver.solve(build_mvo_problem(mu, Sigma, r_target=t, trusted=True)) for t in targets]
+
+    # One OSQP setup for the whole path: the minimum-variance point (return
+    # row relaxed), then the targets it determines, each warm-started.
+    session = solver.path_session(prob)
+    row = next(b for name, b, _ in session.blocks if name == "ineq")  # -mu^T w <= -r
+    u = session.u.copy()
+    u[row] = np.inf
+    gmv = session.solve(u=u)
+    r_gmv = float(np.clip(gmv.x @ mu, r_lo, r_hi))
+    path = []
+    for t in np.linspace(r_gmv, r_hi, n_points):
+        u[row] = -t
+        path.append(session.solve(u=u))
+    return path
+
+
+def _resample_batch(seeds, mu, L, n_periods, freq, n_points, solver) -> Tuple[Array, Array]:
+    # One independent stream per resample, so results do not depend on how
+    # resamples are grouped into batches or spread over workers.
+    N = mu.size
+    Z = np.stack([np.random.default_rng(s).standard_normal((n_periods, N)) for s in seeds])
+    X = Z @ (L.T / np.sqrt(freq)) + mu / freq
+    mus, Sigmas = _batched_mean_cov(X, freq)
+    W = np.full((len(seeds), n_points, N), np.nan)
+    ok = np.zeros((len(seeds), n_points), dtype=bool)
+    for r in range(len(seeds)):
+        for p, sol in enumerate(_frontier_path(mus[r], Sigmas[r], n_points, solver)):
+            if sol.solved:
+                W[r, p] = sol.x
+                ok[r, p] = True
+    return W, ok
+
+
+# ---------- Public API ----------
+
+def resampled_frontier(
+    mu: np.ndarray,
+    Sigma: np.ndarray,
+    *,
+    n_periods: int,
+    n_resamples: int = 100,
+    n_points: int = 20,
+    freq: int = 252,
+    solver=None,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    batch_size: int = 16,
+) -> ResampledFrontier:
+    """
+    Resampled (Michaud) efficient frontier.
+
+    Draws ``n_resamples`` return histories of ``n_periods`` observations from
+    N(mu / freq, Sigma / freq), re-estimates (mu, Sigma) for each in batched
+    operations, solves each sample's long-only frontier at ``n_points``
+    rank-associated targets (from its minimum-variance return to its maximum
+    attainable return), and averages the weights rank by rank.
+
+    Each frontier is solved through ``solver.path_session`` when available
+    (one OSQP setup per sample; every point warm-started from the previous
+    one). Batches of ``batch_size`` resamples run on ``workers`` threads.
+    Every resample draws from its own ``SeedSequence(seed).spawn`` child, so
+    the output is identical for any ``workers`` / ``batch_size``.
+    """
+    mu = np.asarray(mu, dtype=float)
+    Sigma = np.asarray(Sigma, dtype=float)
+    n = mu.size
+    if Sigma.shape != (n, n):
+        raise ValueError("Sigma must be square (n x n).")
+    if solver is None:
+        solver = MathOptOSQP()
+    L = np.linalg.cholesky(Sigma + 1e-12 * np.trace(Sigma) / n * np.eye(n))
+    seeds = np.random.SeedSequence(seed).spawn(n_resamples)
+    batches = [seeds[i:i + batch_size] for i in range(0, n_resamples, batch_size)]
+
+    def run(batch):
+        return _resample_batch(batch, mu, L, n_periods, freq, n_points, solver)
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run, batches))
+    else:
+        results = [run(b) for b in batches]
+    W = np.concatenate([w for w, _ in results])
+    ok = np.concatenate([o for _, o in results])
+
+    counts = ok.sum(axis=0)
+    avg = np.where(ok[..., None], W, 0.0).sum(axis=0) / np.maximum(counts, 1)[:, None]
+    avg[counts == 0] = np.nan
+    risk = np.sqrt(np.einsum("pi,ij,pj->p", avg, Sigma, avg))
+    ret = avg @ mu
+    r_risk = np.sqrt(np.einsum("rpi,ij,rpj->rp", W, Sigma, W))
+    r_ret = W @ mu
+    return ResampledFrontier(weights=avg, risk=risk, ret=ret, resampled_weights=W,
+                             resampled_risk=r_risk, resampled_ret=r_ret, solved=ok)
+
+
+__all__ = [
+    "ResampledFrontier",
+    "resampled_frontier",
+]
@@ -0,0 +1,224 @@
+# qpfolio/core/risk_parity.py
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from qpfolio.core.types import Array, ProblemSpec, Solution, SolverInfo
+
+# Eigenpairs of Sigma in the Newton-CG preconditioner; covers typical
+# factor counts, beyond which CG needs more iterations but still converges.
+PRECOND_RANK = 48
+
+
+# ---------- Helpers ----------
+
+def _check_budgets(n: int, budgets: Optional[Array]) -> Array:
+    if budgets is None:
+        return np.full(n, 1.0 / n)
+    b = np.asarray(budgets, dtype=float)
+    if b.shape != (n,):
+        raise ValueError("budgets must have shape (n,).")
+    if np.any(b <= 0):
+        raise ValueError("budgets must be strictly positive.")
+    return b / b.sum()
+
+
+def _pcg(matvec, rhs: Array, psolve, rtol: float, max_iter: int) -> Tuple[Array, int]:
+    """
+    Preconditioned conjugate gradients for an SPD operator; ``psolve(r)``
+    applies M^-1. Returns the solution and the number of operator products.
+    """
+    x = np.zeros_like(rhs)
+    r = rhs.copy()
+    z = psolve(r)
+    p = z.copy()
+    rz = r @ z
+    stop = rtol * np.linalg.norm(rhs)
+    k = 0
+    for k in range(1, max_iter + 1):
+        Ap = matvec(p)
+        alpha = rz / (p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+        if np.linalg.norm(r) <= stop:
+            break
+        z = psolve(r)
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+    return x, k
+
+
+def _low_rank(Sigma: Array, k: int, seed: int = 0):
+    """
+    Top-``k`` eigenpairs of Sigma by randomized subspace iteration (three
+    N x (k + 8) products), plus the diagonal Sigma - U diag(lam) U^T leaves.
+    """
+    n = Sigma.shape[0]
+    Y = Sigma @ np.random.default_rng(seed).standard_normal((n, min(n, k + 8)))
+    Y = Sigma @ np.linalg.qr(Y)[0]
+    Qb = np.linalg.qr(Y)[0]
+    lam, V = np.linalg.eigh(Qb.T @ (Sigma @ Qb))
+    lam, U = lam[::-1][:k], (Qb @ V[:, ::-1])[:, :k]
+    keep = lam > 0
+    lam, U = lam[keep], U[:, keep]
+    resid = np.clip(np.diag(Sigma) - (U * U) @ lam, 0.0, None)
+    return U, lam, resid
+
+
+def _woodbury(U: Array, lam: Array, D: Array):
+    """Applies (D + U diag(lam) U^T)^-1 for positive D in O(N k) per call."""
+    if lam.size == 0:
+        return lambda r: r / D
+    UD = U / D[:, None]
+    C = np.linalg.cholesky(np.diag(1.0 / lam) + U.T @ UD)
+
+    def solve(r: Array) -> Array:
+        t = np.linalg.solve(C.T, np.linalg.solve(C, UD.T @ r))
+        return r / D - UD @ t
+
+    return solve
+
+
+def _initial_point(Sigma: Array, b: Array) -> Array:
+    # Inverse-vol guess, rescaled to the optimal length along that ray
+    # (minimizer of f(t y) has t^2 y^T Sigma y = sum(b)).
+    y = np.sqrt(b) / np.sqrt(np.diag(Sigma))
+    return y * np.sqrt(b.sum() / (y @ Sigma @ y))
+
+
+def _barrier_newton(Sigma: Array, b: Array, tol: float, max_iter: int, solver=None):
+    """
+    Damped Newton on f(y) = 0.5 y^T Sigma y - b^T log(y), whose minimizer
+    normalized to sum one is the risk-budgeting portfolio.
+
+    Without ``solver``, each Newton step is computed matrix-free by CG, so the
+    only O(N^2) work is one ``Sigma @ v`` per CG iteration. CG is
+    preconditioned with the top eigenpairs of Sigma plus the remaining
+    diagonal (Woodbury), which captures factor structure, so most steps take
+    a few CG iterations. With ``solver``, each step is the bound-constrained
+    QP
+        min 0.5 d^T H d + g^T d   s.t.  d >= -0.9 y
+    solved through the generic Solver interface.
+    """
+    if solver is None:
+        U, lam, resid = _low_rank(Sigma, min(PRECOND_RANK, Sigma.shape[0] - 1))
+    y = _initial_point(Sigma, b)
+    g_stop = tol * np.linalg.norm(b)
+    g_norm = np.inf
+    it = cg_iter = 0
+    for it in range(1, max_iter + 1):
+        Sy = Sigma @ y
+        g = Sy - b / y
+        g_norm = float(np.linalg.norm(g))
+        if g_norm <= g_stop:
+            break
+        h_diag = b / (y * y)
+        if solver is None:
+            dy, k = _pcg(lambda v: Sigma @ v + h_diag * v, g, _woodbury(U, lam, resid + h_diag),
+                      rtol=min(0.5, np.sqrt(g_norm)), max_iter=4 * y.size)
+            step = -dy
+            cg_iter += k
+        else:
+            H = Sigma + np.diag(h_diag)
+            spec = ProblemSpec.trusted(Q=H, c=g, bounds=[(-0.9 * yi, None) for yi in y])
+            step = np.asarray(solver.solve(spec).x, dtype=float)
+        lam2 = float(-(g @ step))  # squared Newton decrement
+        t = 1.0 if lam2 < 0.0625 else 1.0 / (1.0 + np.sqrt(max(lam2, 0.0)))
+        y = np.maximum(y + t * step, 1e-12 * y)
+    return y, it, g_norm, g_norm <= g_stop, cg_iter
+
+
+def _ccd(Sigma: Array, b: Array, tol: float, max_iter: int):
+    """
+    Cyclical coordinate descent on the same barrier objective; each coordinate
+    has a closed-form minimizer and Sigma @ y is updated by one column.
+    """
+    d_sigma = np.diag(Sigma)
+    y = _initial_point(Sigma, b)
+    Sy = Sigma @ y
+    delta = np.inf
+    it = 0
+    for it in range(1, max_iter + 1):
+        y_old = y.copy()
+        for i in range(y.size):
+            a = Sy[i] - d_sigma[i] * y[i]
+            yi = (-a + np.sqrt(a * a + 4.0 * d_sigma[i] * b[i])) / (2.0 * d_sigma[i])
+            Sy += (yi - y[i]) * Sigma[:, i]
+            y[i] = yi
+        delta = float(np.max(np.abs(y - y_old)) / np.max(y))
+        if delta <= tol:
+            break
+    return y, it, delta, delta <= tol
+
+
+# ---------- Public API ----------
+
+def risk_parity_weights(
+    Sigma: np.ndarray,
+    budgets: Optional[np.ndarray] = None,
+    *,
+    method: str = "newton",
+    tol: float = 1e-10,
+    max_iter: Optional[int] = None,
+    solver=None,
+) -> Solution:
+    """
+    Equal-risk-contribution (or budgeted risk-parity) long-only portfolio.
+
+    Finds w > 0, sum(w) = 1 with risk contributions
+    ``w_i (Sigma w)_i / (w^T Sigma w) = budgets_i``.
+
+    Parameters
+    ~~~~~~~~~~
+    - **Sigma** (ndarray, shape (N, N)): Covariance matrix (PD).
+    - **budgets** (ndarray, shape (N,), optional): Positive risk budgets,
+      normalized to sum one. Defaults to equal risk contributions.
+    - **method** (str): ``"newton"`` (default; matrix-free damped Newton,
+      one ``Sigma @ v`` per inner CG step, suited to thousands of assets),
+      ``"ccd"`` (cyclical coordinate descent), or ``"qp"`` (Newton steps
+      solved as bound-constrained QPs through ``solver``).
+    - **tol** (float): Stopping tolerance (relative gradient norm for the
+      Newton methods, relative max coordinate change for ``"ccd"``).
+    - **solver**: Solver used by ``method="qp"``; defaults to ``MathOptOSQP``.
+
+    Returns
+    ~~~~~~~
+    - **Solution** with ``x`` = weights and ``obj`` = 0.5 w^T Sigma w; for
+      ``"newton"``, ``info["cg_iter"]`` counts the inner CG products.
+
+    Use :func:`qpfolio.core.metrics.risk_contributions` to check the result.
+    """
+    Sigma = np.asarray(Sigma, dtype=float)
+    n = int(Sigma.shape[0])
+    if Sigma.shape != (n, n):
+        raise ValueError("Sigma must be square (n x n).")
+    if np.any(np.diag(Sigma) <= 0):
+        raise ValueError("Sigma must have a strictly positive diagonal.")
+    b = _check_budgets(n, budgets)
+
+    extra = {}
+    if method == "newton":
+        y, it, res, ok, cg_iter = _barrier_newton(Sigma, b, tol, max_iter or 100)
+        extra["cg_iter"] = cg_iter
+    elif method == "qp":
+        if solver is None:
+            from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+            solver = MathOptOSQP()
+        y, it, res, ok, _ = _barrier_newton(Sigma, b, tol, max_iter or 100, solver=solver)
+    elif method == "ccd":
+        y, it, res, ok = _ccd(Sigma, b, tol, max_iter or 10000)
+    else:
+        raise ValueError("method must be one of 'newton', 'ccd', 'qp'.")
+
+    w = y / y.sum()
+    status = "solved" if ok else "maximum iterations reached"
+    obj = 0.5 * float(w @ Sigma @ w)
+    return Solution(x=w, obj=obj, status=status, info=SolverInfo(status=status, iter=it, dua_res=res, **extra))
+
+
+__all__ = [
+    "risk_parity_weights",
+]
@@ -0,0 +1,132 @@
+# qpfolio/core/scenarios.py
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from qpfolio.core.types import Array
+
+METHODS = ("kmeans", "importance")
+
+
+def scenarios_from_paths(paths: Dict[int, "pd.DataFrame"], *, per_step: bool = False) -> Array:
+    """
+    Turn ``simulate_gbm_paths`` output into a scenario matrix.
+
+    By default each path gives one scenario, its simple return over the whole
+    horizon, for a (n_paths, N) matrix. ``per_step=True`` stacks every
+    one-step simple return of every path instead ((n_paths * steps, N)).
+    """
+    prices = [np.asarray(df, dtype=float) for _, df in sorted(paths.items())]
+    if per_step:
+        return np.concatenate([p[1:] / p[:-1] - 1.0 for p in prices])
+    return np.stack([p[-1] / p[0] - 1.0 for p in prices])
+
+
+# ---------- Helpers ----------
+
+def _assign(R: Array, C: Array, chunk: int = 8192) -> Array:
+    # Nearest centroid through ||c||^2 - 2 r.c (||r||^2 is constant per row),
+    # as chunked matrix products.
+    cc = np.einsum("ij,ij->i", C, C)
+    return np.concatenate([np.argmin(cc - 2.0 * (R[i:i + chunk] @ C.T), axis=1)
+                           for i in range(0, R.shape[0], chunk)])
+
+
+def _kmeans(R: Array, p: Array, k: int, n_iter: int, seed: Optional[int]) -> Tuple[Array, Array]:
+    rng = np.random.default_rng(seed)
+    C = R[rng.choice(R.shape[0], size=k, replace=False, p=p)]
+    for _ in range(n_iter):
+        labels = _assign(R, C)
+        # Probability-weighted centroids, so the reduced set matches the mean.
+        M = sp.csr_matrix((p, (labels, np.arange(p.size))), shape=(C.shape[0], p.size))
+        mass = np.asarray(M.sum(axis=1)).ravel()
+        keep = mass > 0
+        C = np.asarray(M @ R)[keep] / mass[keep, None]
+        mass = mass[keep]
+    return C, mass
+
+
+def _importance(R, p: Array, k: int, beta: float, w_ref: Array, seed: Optional[int]):
+    # Half the draws target the beta-tail of the reference portfolio's loss;
+    # self-normalized weights p / q keep the estimator consistent.
+    loss = -np.asarray(R @ w_ref).ravel()
+    tail = loss >= np.quantile(loss, beta)
+    q = 0.5 * p + 0.5 * np.where(tail, p, 0.0) / p[tail].sum()
+    rng = np.random.default_rng(seed)
+    draws = rng.choice(p.size, size=k, replace=True, p=q / q.sum())
+    idx, counts = np.unique(draws, return_counts=True)
+    wts = counts * p[idx] / q[idx]
+    return R[idx], wts / wts.sum()
+
+
+# ---------- Public API ----------
+
+def reduce_scenarios(
+    scenarios,
+    k: int,
+    *,
+    method: str = "kmeans",
+    probabilities: Optional[np.ndarray] = None,
+    beta: float = 0.95,
+    w_ref: Optional[np.ndarray] = None,
+    n_iter: int = 10,
+    seed: Optional[int] = None,
+) -> Tuple[Array, Array]:
+    """
+    Reduce S return scenarios to at most ``k`` weighted ones.
+
+    Parameters
+    ~~~~~~~~~~
+    - **scenarios** (ndarray or scipy.sparse, shape (S, N)): Return scenarios.
+    - **k** (int): Target number of scenarios.
+    - **method** (str):
+        - ``"kmeans"``: ``n_iter`` Lloyd iterations started from ``k``
+          scenarios drawn by probability; each cluster becomes its
+          probability-weighted centroid carrying the cluster's mass. Keeps the
+          mean exactly and the shape of the distribution approximately.
+        - ``"importance"``: draws ``k`` original scenarios, half of them from the
+          ``beta``-tail of the loss of ``w_ref`` (equal weight by default), and
+          reweights them by likelihood ratio. Rows are selected, not averaged,
+          so sparse input stays sparse and extreme scenarios survive.
+    - **probabilities** (ndarray, shape (S,), optional): Scenario
+      probabilities; uniform by default.
+    - **seed** (int, optional): Seed for the clustering start or the draws.
+
+    Returns
+    ~~~~~~~
+    - **scenarios** (shape (k', N), k' <= k) and **probabilities** (k',)
+      summing to one, ready for :func:`qpfolio.core.models.build_cvar_problem`.
+
+    Notes
+    ~~~~~
+    Assignment runs in row chunks as matrix products, so a k-means iteration
+    costs a few GEMMs of size S x N x k and never materializes S x k distances
+    at once.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; available: {list(METHODS)}.")
+    S, n = scenarios.shape
+    if k < 1:
+        raise ValueError("k must be positive.")
+    p = np.full(S, 1.0 / S) if probabilities is None else np.asarray(probabilities, dtype=float)
+    if p.shape != (S,) or np.any(p < 0):
+        raise ValueError("probabilities must be a nonnegative vector of length S.")
+    p = p / p.sum()
+    if k >= S:
+        return scenarios, p
+
+    if method == "kmeans":
+        R = scenarios.toarray() if sp.issparse(scenarios) else np.asarray(scenarios, dtype=float)
+        return _kmeans(R, p, k, n_iter, seed)
+    R = scenarios.tocsr() if sp.issparse(scenarios) else np.asarray(scenarios, dtype=float)
+    w = np.full(n, 1.0 / n) if w_ref is None else np.asarray(w_ref, dtype=float)
+    return _importance(R, p, k, beta, w, seed)
+
+
+__all__ = [
+    "scenarios_from_paths",
+    "reduce_scenarios",
+]
@@ -0,0 +1,152 @@
+# qpfolio/core/sensitivity.py
+from __future__ import annotations
+
+from typing import Mapping, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from qpfolio.core.types import Array, ProblemSpec, Solution
+from qpfolio.solvers.mathopt_osqp import stack_problem
+
+
+def _block_rows(blocks, name: str) -> slice:
+    for b, start, stop in blocks:
+        if b == name:
+            return slice(start, stop)
+    raise KeyError(f"Problem has no constraint block {name!r}; available: {[b for b, _, _ in blocks]}")
+
+
+def _solve_kkt_sparse(problem: ProblemSpec, A_S, rhs: Array, refine: int = 5) -> Array:
+    """
+    Solve [[Q, A_S^T], [A_S, 0]] z = rhs by sparse LU of the regularized,
+    quasi-definite [[Q + d I, A_S^T], [A_S, -d I]] plus iterative refinement
+    against the exact matrix. The regularization keeps the factorization
+    valid for degenerate active sets (dependent rows, singular Q); for a
+    nonsingular KKT matrix the refinement recovers the exact solution.
+    """
+    Q = sp.csr_matrix(problem.Q)
+    if not problem.symmetric:
+        Q = (Q + Q.T) / 2.0
+    k = A_S.shape[0]
+    K = sp.bmat([[Q, A_S.T], [A_S, sp.csr_matrix((k, k))]], format="csc")
+    scale = 1.0 + (abs(K).max() if K.nnz else 0.0)
+    d = 1e-10 * scale
+    reg = sp.diags(np.concatenate([np.full(Q.shape[0], d), np.full(k, -d)]))
+    lu = splu((K + reg).tocsc())
+    z = lu.solve(rhs)
+    for _ in range(refine):
+        z = z + lu.solve(rhs - K @ z)
+    return z
+
+
+def weight_sensitivity(
+    problem: ProblemSpec,
+    solution: Solution,
+    *,
+    dc: Optional[Array] = None,
+    dA: Optional[Mapping[str, Array]] = None,
+    dl: Optional[Mapping[str, Array]] = None,
+    du: Optional[Mapping[str, Array]] = None,
+) -> Array:
+    """
+    First-order change of the optimal x for a small perturbation of the
+    problem data, from a single solve.
+
+    Holding the active set of ``solution`` fixed, differentiates the KKT system
+
+        Q x + c + A^T y = 0,    A_S x = b_S
+
+    (S = binding rows, b_S their binding bounds) and solves for dx. This is
+    exact while the perturbation does not change the active set. Dense
+    problems solve the KKT system by least squares; when Q or the stacked A
+    is sparse (e.g. the lifted transaction-cost, CVaR and multi-period
+    problems), it is factored with a sparse LU instead.
+
+    Parameters
+    ~~~~~~~~~~
+    - **dc** (ndarray, shape (n,)): change of the linear term.
+    - **dA** (dict): block name -> change of that block's rows of A.
+    - **dl**, **du** (dict): block name -> change of that block's lower/upper
+      row bounds. Rows with ``l == u`` (equalities) read ``du``.
+
+    Block names follow ``solution.blocks`` (``"eq"``, ``"ineq"``, ``"A"``,
+    ``"bounds"``).
+
+    Returns
+    ~~~~~~~
+    - **dx** (ndarray, shape (n,)): predicted change in weights.
+    """
+    if solution.y is None or solution.active is None or solution.blocks is None:
+        raise ValueError("Solution carries no duals; solve with a dual-aware solver such as MathOptOSQP.")
+
+    _, A, l, u, blocks = stack_problem(problem)
+    if blocks != solution.blocks:
+        raise ValueError("Solution does not belong to this problem (constraint blocks differ).")
+
+    x = np.asarray(solution.x, dtype=float)
+    y = np.asarray(solution.y, dtype=float)
+    n, m = x.size, A.shape[0]
+
+    # Perturbations enter only through dA^T y and dA x, built block by block.
+    dAty = np.zeros(n)
+    dAx = np.zeros(m)
+    dl_full = np.zeros(m)
+    du_full = np.zeros(m)
+    for name, value in (dA or {}).items():
+        rows = _block_rows(blocks, name)
+        dAty += value.T @ y[rows]
+        dAx[rows] = value @ x
+    for perturb, full in ((dl, dl_full), (du, du_full)):
+        for name, value in (perturb or {}).items():
+            full[_block_rows(blocks, name)] = value
+
+    S = np.flatnonzero(solution.active)
+    Ax = A @ x
+    at_upper = np.abs(u[S] - Ax[S]) <= np.abs(l[S] - Ax[S])
+    db = np.where(at_upper, du_full[S], dl_full[S])
+
+    rhs_x = -np.asarray(dAty).ravel()
+    if dc is not None:
+        rhs_x = rhs_x - np.asarray(dc, dtype=float)
+    rhs = np.concatenate([rhs_x, db - dAx[S]])
+
+    if sp.issparse(A) or sp.issparse(problem.Q):
+        return _solve_kkt_sparse(problem, sp.csr_matrix(A)[S], rhs)[:n]
+
+    A_S = np.asarray(A, dtype=float)[S]
+    Q = np.asarray(problem.Q, dtype=float)
+    if not problem.symmetric:
+        Q = (Q + Q.T) / 2.0
+    K = np.block([[Q, A_S.T], [A_S, np.zeros((S.size, S.size))]])
+    # lstsq tolerates degenerate (linearly dependent) active rows.
+    sol, *_ = np.linalg.lstsq(K, rhs, rcond=None)
+    return sol[:n]
+
+
+def sensitivity_to_target(problem: ProblemSpec, solution: Solution) -> Array:
+    """
+    dw/dr for an MVO problem from :func:`qpfolio.core.models.build_mvo_problem`
+    (return row ``-mu^T w <= -r_target``).
+    """
+    return weight_sensitivity(problem, solution, du={"ineq": np.array([-1.0])})
+
+
+def sensitivity_to_mu(problem: ProblemSpec, solution: Solution, dmu: Array) -> Array:
+    """Predicted weight change of an MVO problem when ``mu`` moves by ``dmu``."""
+    dmu = np.asarray(dmu, dtype=float)
+    return weight_sensitivity(problem, solution, dA={"ineq": -dmu.reshape(1, -1)})
+
+
+def sensitivity_to_caps(problem: ProblemSpec, solution: Solution, dcap: Array) -> Array:
+    """Predicted weight change when the per-asset upper bounds move by ``dcap``."""
+    return weight_sensitivity(problem, solution, du={"bounds": np.asarray(dcap, dtype=float)})
+
+
+__all__ = [
+    "weight_sensitivity",
+    "sensitivity_to_target",
+    "sensitivity_to_mu",
+    "sensitivity_to_caps",
+]
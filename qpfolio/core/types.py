@@ -1,6 +1,7 @@
 # qpfolio/core/types.py
-from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple, Mapping, Any
+from collections.abc import Mapping as _MappingABC
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Optional, Sequence, Tuple, Mapping, Any, Iterator, Dict
 import numpy as np
 
 Array = np.ndarray
@@ -29,6 +30,8 @@ class ProblemSpec:
           will prefer (1) and ignore (2).
         - Bounds are allowed with either form. When using the triplet, bounds
           are folded into (A,l,u) before calling OSQP.
+        - Use :meth:`ProblemSpec.trusted` to skip validation (and the solver's
+          symmetrization of Q) for inputs that are already known to be valid.
     """
     # Objective
     Q: Array  # (n, n) PSD / symmetric
@@ -53,6 +56,27 @@ class ProblemSpec:
     G: Optional[Array] = None  # alias for A_ineq (if ever used)
     h: Optional[Array] = None  # alias for b_ineq (if ever used)
 
+    # True when Q is known to be symmetric; solvers may then use it as-is.
+    symmetric: bool = field(default=False, repr=False, compare=False)
+
+    @classmethod
+    def trusted(cls, *, symmetric: bool = True, **kwargs: Any) -> "ProblemSpec":
+        """
+        Build a spec without validation or copies.
+
+        Intended for builders whose inputs are already shape-checked, with Q
+        symmetric (the default assumption). Arrays are stored by reference.
+        """
+        spec = cls.__new__(cls)
+        for f in fields(cls):
+            if f.name not in kwargs and f.default is MISSING:
+                raise TypeError(f"ProblemSpec.trusted() missing required field: {f.name!r}")
+            setattr(spec, f.name, kwargs.pop(f.name, f.default))
+        if kwargs:
+            raise TypeError(f"Unexpected ProblemSpec fields: {sorted(kwargs)}")
+        spec.symmetric = symmetric
+        return spec
+
     def __post_init__(self):
         # Validate Q, c
         if self.Q.ndim != 2 or self.Q.shape[0] != self.Q.shape[1]:
@@ -108,24 +132,160 @@ class ProblemSpec:
                 raise ValueError("b_ineq/h must have shape (p,).")
 
 
+@dataclass
+class CardinalitySpec:
+    """
+    Mixed-integer extension of a ProblemSpec (MIQP-ready description).
+
+    The continuous problem ``base`` is augmented with
+        - at most ``max_names`` nonzero variables, and
+        - a minimum lot: every nonzero x_i satisfies x_i >= ``min_weight``.
+
+    Variables must have finite, nonnegative bounds (long-only). Heuristic and
+    exact (branch-and-bound) backends both consume this spec.
+    """
+    base: ProblemSpec
+    max_names: int
+    min_weight: float = 0.0
+
+    def __post_init__(self):
+        n = self.base.Q.shape[0]
+        if self.base.bounds is None:
+            raise ValueError("CardinalitySpec requires variable bounds on base.")
+        if not (1 <= self.max_names <= n):
+            raise ValueError("max_names must be in [1, n].")
+        if self.min_weight < 0:
+            raise ValueError("min_weight must be nonnegative.")
+
+
+# Fixed solver statistics carried by every Solution. Anything else a backend
+# reports lands in SolverInfo.extra.
+_SOLVER_INFO_FIELDS = (
+    "status",
+    "status_val",
+    "iter",
+    "obj_val",
+    "pri_res",
+    "dua_res",
+    "setup_time",
+    "solve_time",
+    "polish_time",
+    "run_time",
+    "rho",
+)
+
+
+class SolverInfo(_MappingABC):
+    """
+    Compact, read-only solver statistics.
+
+    Stores a fixed set of fields in ``__slots__`` (no per-object ``__dict__``)
+    but behaves like a ``Mapping``, so ``info["iter"]``, ``info.get("rho")``
+    and ``dict(info)`` keep working. Unknown keyword fields are kept in the
+    optional ``extra`` dict, which stays ``None`` when unused.
+    """
+    __slots__ = _SOLVER_INFO_FIELDS + ("extra",)
+
+    def __init__(self, **fields: Any):
+        for k in _SOLVER_INFO_FIELDS:
+            object.__setattr__(self, k, fields.pop(k, None))
+        object.__setattr__(self, "extra", fields or None)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("SolverInfo is read-only.")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SOLVER_INFO_FIELDS:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _SOLVER_INFO_FIELDS
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(_SOLVER_INFO_FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __reduce__(self):
+        return _rebuild_solver_info, (dict(self),)
+
+    def __repr__(self) -> str:
+        body = ", ".join(f"{k}={v!r}" for k, v in self.items() if v is not None)
+        return f"SolverInfo({body})"
+
+
+def _rebuild_solver_info(fields: Mapping[str, Any]) -> "SolverInfo":
+    return SolverInfo(**fields)
+
+
+def _add_slots(cls):
+    """
+    Rebuild dataclass ``cls`` with ``__slots__`` for its fields, as
+    ``@dataclass(slots=True)`` does on Python 3.10+.
+    """
+    names = tuple(f.name for f in fields(cls))
+    body = {k: v for k, v in cls.__dict__.items() if k not in names + ("__dict__", "__weakref__")}
+    body["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, body)
+
+
+@_add_slots
 @dataclass
 class Solution:
     """
     Standardized QP solution container.
+
+    A dataclass with ``__slots__`` (no per-instance ``__dict__``), so that
+    large batches of solutions stay cheap to hold in memory while
+    ``==``, ``dataclasses.replace`` and ``asdict`` keep working.
+
+    Solvers that expose duals also fill ``y`` (multipliers of the stacked
+    constraint rows ``l <= A x <= u``, OSQP sign convention: positive when the
+    upper side binds), ``active`` (boolean mask of binding rows) and ``blocks``
+    (``(name, start, stop)`` row ranges, e.g. ``"eq"``, ``"ineq"``,
+    ``"bounds"``). Use :attr:`duals` and :attr:`active_set` for per-block views.
     """
     x: Array  # optimal variable vector (n,)
     obj: float  # objective value at x (0.5 x^T Q x + c^T x)
     status: str  # e.g., "solved", "optimal", "infeasible", etc.
     info: Optional[Mapping[str, Any]] = None  # raw solver stats/timings/etc.
+    y: Optional[Array] = field(default=None, repr=False)  # stacked constraint duals (m,)
+    active: Optional[Array] = field(default=None, repr=False)  # binding-row mask (m,)
+    blocks: Optional[Tuple[Tuple[str, int, int], ...]] = field(default=None, repr=False)  # row ranges of y/active
 
     # Backward-compat alias for older code/tests expecting .obj_value
     @property
     def obj_value(self) -> float:
         return self.obj
 
+    @property
+    def solved(self) -> bool:
+        """True when ``status`` reports success (``"solved"``, ``"solved inaccurate"``)."""
+        return (self.status or "").lower().startswith("solved")
+
+    def _split(self, v: Optional[Array]) -> Dict[str, Array]:
+        if v is None or self.blocks is None:
+            return {}
+        return {name: v[start:stop] for name, start, stop in self.blocks}
+
+    @property
+    def duals(self) -> Dict[str, Array]:
+        """Dual values per constraint block (views into ``y``)."""
+        return self._split(self.y)
+
+    @property
+    def active_set(self) -> Dict[str, Array]:
+        """Binding-row masks per constraint block (views into ``active``)."""
+        return self._split(self.active)
+
 
 __all__ = [
     "Array",
+    "CardinalitySpec",
     "ProblemSpec",
     "Solution",
+    "SolverInfo",
 ]
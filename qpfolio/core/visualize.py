@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 import numpy as np
 import matplotlib.pyplot as plt
@@ -8,11 +9,147 @@ from matplotlib.axes import Axes  # <-- add
 if TYPE_CHECKING:
     import pandas as pd
 
+# Universes larger than this switch to aggregated (top-k / block) views.
+LARGE_UNIVERSE = 200
+
+def _aggregate(values: np.ndarray, names: Sequence[str], *, groups: Optional[Sequence] = None,
+               top_k: Optional[int] = None) -> tuple[np.ndarray, list]:
+    """
+    Collapse the last axis of ``values`` (shape (..., N)) by summing over
+    ``groups`` labels, or by keeping the ``top_k`` columns with the largest
+    absolute value and summing the rest into ``"other"``.
+    """
+    values = np.asarray(values, dtype=float)
+    if groups is not None:
+        uniq, inv = np.unique(np.asarray(groups).astype(str), return_inverse=True)
+        M = np.zeros((values.shape[-1], uniq.size))
+        M[np.arange(values.shape[-1]), inv] = 1.0
+        return values @ M, list(uniq)
+    if top_k is None or values.shape[-1] <= top_k:
+        return values, list(names)
+    score = np.abs(values).reshape(-1, values.shape[-1]).max(axis=0)
+    keep = np.sort(np.argpartition(-score, top_k)[:top_k])
+    rest = np.ones(values.shape[-1], dtype=bool)
+    rest[keep] = False
+    out = np.concatenate([values[..., keep], values[..., rest].sum(axis=-1, keepdims=True)], axis=-1)
+    return out, [names[i] for i in keep] + ["other"]
+
+def _spectral_order(Sigma: np.ndarray, d: np.ndarray) -> np.ndarray:
+    # Order assets by their loading on the leading non-market eigenvector of
+    # the correlation matrix D^-1 Sigma D^-1, which places strongly correlated
+    # names next to each other. Large problems use a few passes of block
+    # subspace iteration (one GEMM over Sigma each), never forming it.
+    n = Sigma.shape[0]
+    if n < 3:
+        return np.arange(n)
+    if n <= 500:
+        vecs = np.linalg.eigh(Sigma / np.outer(d, d))[1][:, -2:]
+    else:
+        V = np.random.default_rng(0).standard_normal((n, 8))
+        for _ in range(4):
+            V = np.linalg.qr((Sigma @ (V / d[:, None])) / d[:, None])[0]
+        T = V.T @ ((Sigma @ (V / d[:, None])) / d[:, None])
+        vals, U = np.linalg.eigh((T + T.T) / 2.0)
+        vecs = V @ U[:, -2:]
+    return np.argsort(vecs[:, 0], kind="stable")  # eigenpairs ascending: column 0 is the second largest
+
+def _block_average(Sigma: np.ndarray, d: np.ndarray, members: list) -> np.ndarray:
+    """Mean correlation between each pair of member sets, as M Sigma M^T."""
+    import scipy.sparse as sp
+
+    rows = np.repeat(np.arange(len(members)), [len(m) for m in members])
+    cols = np.concatenate(members)
+    counts = np.array([len(m) for m in members], dtype=float)
+    M = sp.csr_matrix((1.0 / (d[cols] * counts[rows]), (rows, cols)), shape=(len(members), Sigma.shape[0]))
+    return np.asarray(M @ (M @ Sigma).T).T
+
+def _points_array(points) -> np.ndarray:
+    """(P, 2) array of (risk, return) from ``compute_frontier`` points."""
+    return np.array([(p[0], p[1]) for p in points], dtype=float).reshape(-1, 2)
+
+def _curves(frontiers) -> list:
+    """
+    List of (P_k, 2) risk/return arrays from a (K, P, 2) array, a sequence
+    of point lists / arrays, or a long frame with ``frontier``, ``risk`` and
+    ``return`` columns.
+    """
+    if hasattr(frontiers, "groupby"):
+        return [g[["risk", "return"]].to_numpy(dtype=float) for _, g in frontiers.groupby("frontier", sort=False)]
+    if isinstance(frontiers, np.ndarray):
+        if frontiers.ndim != 3 or frontiers.shape[2] != 2:
+            raise ValueError("frontiers array must have shape (K, P, 2).")
+        return list(frontiers.astype(float, copy=False))
+    return [np.asarray(c, dtype=float) if isinstance(c, np.ndarray) else _points_array(c) for c in frontiers]
+
+def _return_quantiles(curves: list, grid: np.ndarray, q: Sequence[float]) -> np.ndarray:
+    # Each curve's return interpolated on the common risk grid (NaN outside
+    # its own risk range), then quantiles across curves per grid point.
+    R = np.full((len(curves), grid.size), np.nan)
+    for k, c in enumerate(curves):
+        c = c[np.argsort(c[:, 0], kind="stable")]
+        R[k] = np.interp(grid, c[:, 0], c[:, 1], left=np.nan, right=np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN grid columns
+        return np.nanquantile(R, q, axis=0)
+
+def plot_frontiers(
+    frontiers,
+    *,
+    ax=None,
+    color: str = "C0",
+    alpha: Optional[float] = None,
+    linewidth: float = 0.6,
+    bands: Optional[Sequence[float]] = None,
+    median: bool = False,
+    grid_size: int = 200,
+    rasterized: bool = True,
+) -> Axes:
+    """
+    Overlay many frontiers (e.g. resampled or per-scenario) in one call.
+
+    All curves are drawn as a single ``LineCollection``, so thousands of
+    frontiers cost one artist. ``frontiers`` is a (K, P, 2) array of
+    (risk, return), a sequence of ``compute_frontier`` point lists or
+    (P_k, 2) arrays, or a long DataFrame with ``frontier``, ``risk`` and
+    ``return`` columns.
+
+    ``alpha`` defaults to ``min(1, 20 / K)``. ``bands`` is a pair of
+    quantiles, e.g. ``(0.05, 0.95)``, shaded across curves on a common risk
+    grid; ``median=True`` adds the median curve.
+    """
+    from matplotlib.collections import LineCollection
+
+    if ax is None:
+        _, ax = plt.subplots()
+    curves = _curves(frontiers)
+    if alpha is None:
+        alpha = min(1.0, 20.0 / max(len(curves), 1))
+    lc = LineCollection(curves, colors=color, alpha=alpha, linewidths=linewidth, rasterized=rasterized)
+    ax.add_collection(lc)
+    if curves:
+        ax.autoscale_view()
+    if (bands is not None or median) and curves:
+        lo = min(float(np.min(c[:, 0])) for c in curves)
+        hi = max(float(np.max(c[:, 0])) for c in curves)
+        grid = np.linspace(lo, hi, grid_size)
+        qs = list(bands or ()) + ([0.5] if median else [])
+        Q = _return_quantiles(curves, grid, qs)
+        if bands is not None:
+            ax.fill_between(grid, Q[0], Q[1], color=color, alpha=0.25, linewidth=0,
+                            label=f"{bands[0]:.0%}–{bands[1]:.0%} band")
+        if median:
+            ax.plot(grid, Q[-1], color=color, linewidth=1.8, label="median")
+        ax.legend(loc="best")
+    ax.set_xlabel("Risk (stdev)")
+    ax.set_ylabel("Expected Return")
+    ax.set_title("Efficient Frontiers")
+    ax.grid(True)
+    return ax
+
 def plot_frontier(points: Iterable[tuple[float, float, object]], *, ax=None) -> Axes:  # <-- annotate
     if ax is None:
         _, ax = plt.subplots()
-    risks = [float(p[0]) for p in points]
-    rets = [float(p[1]) for p in points]
+    risks, rets = _points_array(points).T
     ax.plot(risks, rets, marker="o", linewidth=1.5)
     ax.set_xlabel("Risk (stdev)")
     ax.set_ylabel("Expected Return")
@@ -23,8 +160,7 @@ def plot_frontier(points: Iterable[tuple[float, float, object]], *, ax=None) ->
 def plot_frontier_with_cml(points: Iterable[tuple[float, float, object]], *, rf: float = 0.0, ax=None) -> Axes:
     if ax is None:
         _, ax = plt.subplots()
-    risks = np.asarray([float(p[0]) for p in points], dtype=float)
-    rets  = np.asarray([float(p[1]) for p in points], dtype=float)
+    risks, rets = _points_array(points).T
     ax.plot(risks, rets, marker="o", linewidth=1.5, label="Frontier")
     with np.errstate(divide="ignore", invalid="ignore"):
         sharpe = (rets - rf) / risks
@@ -37,22 +173,43 @@ def plot_frontier_with_cml(points: Iterable[tuple[float, float, object]], *, rf:
     ax.legend(loc="best")
     return ax
 
-def plot_weights_along_frontier(weights: "pd.DataFrame", *, ax=None, labels: Optional[Sequence[str]] = None) -> Axes:
+def plot_weights_along_frontier(weights: "pd.DataFrame", *, ax=None, labels: Optional[Sequence[str]] = None,
+                                groups: Optional[Sequence] = None, top_k: Optional[int] = None) -> Axes:
+    """
+    Stacked weights per frontier point.
+
+    For large universes pass ``groups`` (one label per column, e.g. sectors)
+    to stack group totals, or ``top_k`` to keep the largest names and stack
+    the rest as ``"other"``. Above ``LARGE_UNIVERSE`` columns, ``top_k``
+    defaults to 20. Bands are rasterized.
+    """
     if ax is None:
         _, ax = plt.subplots()
+    names = list(labels) if labels else [str(c) for c in weights.columns]
+    W = weights.to_numpy(dtype=float)
+    if top_k is None and groups is None and W.shape[1] > LARGE_UNIVERSE:
+        top_k = 20
+    W, names = _aggregate(W, names, groups=groups, top_k=top_k)
     x = np.arange(len(weights), dtype=float)
-    series = [weights[c].to_numpy(dtype=float) for c in weights.columns]
-    ax.stackplot(x, *series, labels=(labels if labels else list(weights.columns)))  # <-- splat
+    ax.stackplot(x, *W.T, labels=names, rasterized=True)  # <-- splat
     ax.set_xlabel("Frontier Index")
     ax.set_ylabel("Weight")
     ax.set_ylim(0.0, 1.0)
     ax.set_title("Weights Along Frontier")
-    if labels or len(weights.columns) <= 12:
+    if labels or groups is not None or top_k is not None or len(names) <= 12:
         ax.legend(loc="upper right", ncols=3)
     ax.grid(True, axis="y", alpha=0.2)
     return ax
 
-def plot_risk_contributions(w, Sigma, labels: Optional[Sequence[str]] = None, *, ax=None) -> Axes:
+def plot_risk_contributions(w, Sigma, labels: Optional[Sequence[str]] = None, *, ax=None,
+                            groups: Optional[Sequence] = None, top_k: Optional[int] = None) -> Axes:
+    """
+    Bar chart of total risk contributions (fractions of portfolio σ).
+
+    ``groups`` sums contributions per group; ``top_k`` shows the largest
+    contributors plus an ``"other"`` bar (default 30 above ``LARGE_UNIVERSE``
+    assets).
+    """
     if ax is None:
         _, ax = plt.subplots()
     w = np.asarray(w, dtype=float)
@@ -61,22 +218,57 @@ def plot_risk_contributions(w, Sigma, labels: Optional[Sequence[str]] = None, *,
     trc = w * mrc
     vol = float(np.sqrt(max(w @ Sigma @ w, 0.0)))
     frac = trc / vol if vol > 0 else trc
-    idx = np.arange(len(w))
+    if top_k is None and groups is None and len(w) > LARGE_UNIVERSE:
+        top_k = 30
+    aggregated = groups is not None or (top_k is not None and len(w) > top_k)
+    names = list(labels) if labels else [str(i) for i in range(len(w))]
+    frac, names = _aggregate(frac, names, groups=groups, top_k=top_k)
+    idx = np.arange(len(frac))
     ax.bar(idx, frac)
-    if labels:
-        ax.set_xticks(idx, labels, rotation=0)
+    if labels or aggregated:
+        ax.set_xticks(idx, names, rotation=0 if len(names) <= 12 else 90)
     ax.set_ylabel("Risk Contribution (fraction of σ)")
     ax.set_title("Total Risk Contributions")
     ax.grid(True, axis="y", alpha=0.3)
     return ax
 
-def plot_corr_heatmap(Sigma, labels: Optional[Sequence[str]] = None, *, ax=None) -> Axes:
+def plot_corr_heatmap(Sigma, labels: Optional[Sequence[str]] = None, *, ax=None,
+                      groups: Optional[Sequence] = None, max_blocks: int = LARGE_UNIVERSE) -> Axes:
+    """
+    Correlation heatmap.
+
+    With ``groups``, shows the average correlation within and between
+    groups. Otherwise, above ``max_blocks`` assets the matrix is ordered
+    spectrally, block-averaged to ``max_blocks`` x ``max_blocks``, and the
+    blocks are arranged by hierarchical clustering (optimal leaf order), so
+    a 5,000-asset universe draws one small rasterized image. The full
+    correlation matrix is never formed: ordering and block means work on
+    ``Sigma`` directly.
+    """
     if ax is None:
         _, ax = plt.subplots()
     Sigma = np.asarray(Sigma, dtype=float)
     d = np.sqrt(np.clip(np.diag(Sigma), 1e-12, None))
-    Corr = Sigma / np.outer(d, d)
-    im = ax.imshow(Corr, interpolation="nearest")
+    n = Sigma.shape[0]
+    if groups is not None:
+        uniq, inv = np.unique(np.asarray(groups).astype(str), return_inverse=True)
+        Corr = _block_average(Sigma, d, [np.flatnonzero(inv == g) for g in range(uniq.size)])
+        labels = list(uniq)
+    elif n > max_blocks:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+
+        members = np.array_split(_spectral_order(Sigma, d), max_blocks)
+        Corr = _block_average(Sigma, d, members)
+        dist = np.clip(1.0 - Corr, 0.0, None)
+        np.fill_diagonal(dist, 0.0)
+        leaves = leaves_list(linkage(squareform((dist + dist.T) / 2.0, checks=False),
+                                     method="average", optimal_ordering=True))
+        Corr = Corr[np.ix_(leaves, leaves)]
+        labels = None
+    else:
+        Corr = Sigma / np.outer(d, d)
+    im = ax.imshow(Corr, interpolation="nearest", rasterized=True)
     ax.set_title("Correlation Heatmap")
     if labels:
         ax.set_xticks(range(len(labels)))
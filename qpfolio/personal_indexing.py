@@ -5,7 +5,11 @@ from typing import Iterable, Optional, Sequence, Tuple
 
 import numpy as np
 
-from qpfolio.core.types import ProblemSpec, Solution
+from qpfolio.core.cardinality import solve_cardinality_heuristic
+from qpfolio.core.constraints import ConstraintBuilder
+from qpfolio.core.models import build_transaction_cost_problem
+from qpfolio.core.types import CardinalitySpec, ProblemSpec, Solution, SolverInfo
+from qpfolio.solvers.base import CardinalityBackend
 from qpfolio.solvers.mathopt_osqp import MathOptOSQP
 
 
@@ -65,8 +69,9 @@ def personal_index_optimizer(
     if w_bench.shape != (n,):
         raise ValueError("w_bench must have shape (n,).")
 
-    Q = np.array(Sigma, dtype=float)
-    c = -Q @ np.array(w_bench, dtype=float)
+    # Q is never mutated in place below, so avoid copying Sigma.
+    Q = np.asarray(Sigma, dtype=float)
+    c = -Q @ np.asarray(w_bench, dtype=float)
 
     A, l, u = _sum_to_one_constraint_A_l_u(n)
     bounds = _apply_exclusions_and_caps(n, max_weight, exclude)
@@ -83,6 +88,7 @@ def personal_index_optimizer_esg(
     exposure_matrix: Optional[np.ndarray] = None,   # rows = exposures, cols = assets
     exposure_targets: Optional[np.ndarray] = None,  # length = n_exposures
     exposure_penalty: float = 1.0,                  # λ for L2 exposure penalty
+    exposure_band: Optional[float] = None,          # if set, |E w - t| <= band as constraints
     max_weight: float = 0.05,
     exclude: Optional[Iterable[int]] = None,
     solver: Optional[MathOptOSQP] = None,
@@ -100,6 +106,9 @@ def personal_index_optimizer_esg(
     -----
     - L2 exposure penalties keep the problem a convex QP.
     - If `exposure_matrix` is provided without `exposure_targets`, targets default to E @ w_bench.
+    - With `exposure_band` set, exposures are instead constrained to
+      t - band <= E w <= t + band as sparse rows of (A, l, u) and no penalty is
+      added, so Q stays Σ (no dense λ EᵀE term).
     """
     n = int(Sigma.shape[0])
     if Sigma.shape != (n, n):
@@ -107,10 +116,11 @@ def personal_index_optimizer_esg(
     if w_bench.shape != (n,):
         raise ValueError("w_bench must have shape (n,).")
 
-    Q = np.array(Sigma, dtype=float)
-    c = -Q @ np.array(w_bench, dtype=float)
+    Q = np.asarray(Sigma, dtype=float)
+    c = -Q @ np.asarray(w_bench, dtype=float)
 
-    if exposure_matrix is not None and exposure_penalty > 0.0:
+    constraints = ConstraintBuilder(n).add_budget()
+    if exposure_matrix is not None and (exposure_band is not None or exposure_penalty > 0.0):
         E = np.array(exposure_matrix, dtype=float)
         if E.shape[1] != n:
             raise ValueError("exposure_matrix must have shape (k, n).")
@@ -120,11 +130,15 @@ def personal_index_optimizer_esg(
             t = np.array(exposure_targets, dtype=float)
             if t.shape != (E.shape[0],):
                 raise ValueError("exposure_targets must have shape (k,).")
-        lam = float(exposure_penalty)
-        Q = Q + lam * (E.T @ E)
-        c = c - lam * (E.T @ t)
+        if exposure_band is not None:
+            band = float(exposure_band)
+            constraints.add_exposure_band(E, lower=t - band, upper=t + band)
+        else:
+            lam = float(exposure_penalty)
+            Q = Q + lam * (E.T @ E)
+            c = c - lam * (E.T @ t)
 
-    A, l, u = _sum_to_one_constraint_A_l_u(n)
+    A, l, u = constraints.build()
     bounds = _apply_exclusions_and_caps(n, max_weight, exclude)
 
     problem = ProblemSpec(Q=Q, c=c, A=A, l=l, u=u, bounds=bounds)
@@ -160,8 +174,8 @@ def personal_index_optimizer_taxaware(
     if w_prev.shape != (n,):
         raise ValueError("w_prev must have shape (n,).")
 
-    Q = np.array(Sigma, dtype=float)
-    c = -Q @ np.array(w_bench, dtype=float)
+    Q = np.asarray(Sigma, dtype=float)
+    c = -Q @ np.asarray(w_bench, dtype=float)
 
     if turnover_penalty > 0.0:
         eta = float(turnover_penalty)
@@ -183,3 +197,116 @@ def personal_index_optimizer_taxaware(
     problem = ProblemSpec(Q=Q, c=c, A=A, l=lower, u=upper, bounds=bounds)
     use_solver = solver or MathOptOSQP()
     return use_solver.solve(problem)
+
+
+def personal_index_optimizer_tcost(
+    Sigma: np.ndarray,
+    w_bench: np.ndarray,
+    *,
+    w_prev: np.ndarray,
+    buy_cost: float | np.ndarray = 0.001,   # linear cost per unit bought
+    sell_cost: float | np.ndarray = 0.001,  # linear cost per unit sold (e.g. incl. tax)
+    turnover_budget: Optional[float] = None,  # cap on sum |w - w_prev|
+    max_weight: float = 0.05,
+    exclude: Optional[Iterable[int]] = None,
+    solver: Optional[MathOptOSQP] = None,
+) -> Solution:
+    """
+    Tracking with **linear (L1) transaction costs** and an optional turnover budget.
+
+    Objective:
+        0.5 (w - w_bench)^T Σ (w - w_bench) + buy_cost^T b + sell_cost^T s
+
+    with w = w_prev + b - s, b, s ≥ 0, sum(w) = 1, 0 ≤ w_i ≤ max_weight and
+    optionally sum(b + s) ≤ turnover_budget. Solved as a sparse lifted QP in
+    3n variables (see :func:`qpfolio.core.models.build_transaction_cost_problem`).
+
+    Returns a Solution over the weights; the trades are in
+    ``info["buy"]`` and ``info["sell"]``. ``y`` / ``active`` / ``blocks``
+    keep the lifted problem's constraint rows (trade dynamics, budget,
+    turnover) and the bound rows of the weights.
+    """
+    n = int(Sigma.shape[0])
+    if Sigma.shape != (n, n):
+        raise ValueError("Sigma must be square (n x n).")
+    if w_bench.shape != (n,):
+        raise ValueError("w_bench must have shape (n,).")
+    if w_prev.shape != (n,):
+        raise ValueError("w_prev must have shape (n,).")
+
+    Q = np.asarray(Sigma, dtype=float)
+    c = -Q @ np.asarray(w_bench, dtype=float)
+
+    A, l, u = _sum_to_one_constraint_A_l_u(n)
+    bounds = _apply_exclusions_and_caps(n, max_weight, exclude)
+
+    problem = build_transaction_cost_problem(
+        Q, c, w_prev,
+        buy_cost=buy_cost, sell_cost=sell_cost, turnover_budget=turnover_budget,
+        A=A, l=l, u=u, bounds=bounds,
+    )
+    use_solver = solver or MathOptOSQP()
+    sol = use_solver.solve(problem)
+
+    z = sol.x
+    info = dict(sol.info) if sol.info is not None else {}
+    info.update(buy=z[n:2 * n], sell=z[2 * n:])
+    y, active, blocks = sol.y, sol.active, sol.blocks
+    if blocks is not None:
+        # Keep every constraint row; of the 3n bound rows keep those of w.
+        keep, new_blocks, start = [], [], 0
+        for name, lo, hi in blocks:
+            hi = lo + n if name == "bounds" else hi
+            keep.append(np.arange(lo, hi))
+            new_blocks.append((name, start, start + hi - lo))
+            start += hi - lo
+        rows = np.concatenate(keep)
+        y = None if y is None else y[rows]
+        active = None if active is None else active[rows]
+        blocks = tuple(new_blocks)
+    return Solution(x=z[:n], obj=sol.obj, status=sol.status, info=SolverInfo(**info),
+                    y=y, active=active, blocks=blocks)
+
+
+def personal_index_optimizer_cardinality(
+    Sigma: np.ndarray,
+    w_bench: np.ndarray,
+    *,
+    max_names: int,
+    min_weight: float = 0.0,          # minimum position size for held names
+    max_weight: float = 0.05,
+    exclude: Optional[Iterable[int]] = None,
+    solver: Optional[MathOptOSQP] = None,
+    exact: Optional[CardinalityBackend] = None,
+) -> Solution:
+    """
+    Tracking-error QP holding at most ``max_names`` names, each at least ``min_weight``.
+
+    Solved by :func:`qpfolio.core.cardinality.solve_cardinality_heuristic`
+    (warm-started reduced QPs over shrinking supports). If ``exact`` is given
+    (e.g. :class:`qpfolio.solvers.miqp.BranchAndBoundCardinality`), the
+    heuristic result is passed to it as the incumbent and its answer is
+    returned instead.
+    """
+    n = int(Sigma.shape[0])
+    if Sigma.shape != (n, n):
+        raise ValueError("Sigma must be square (n x n).")
+    if w_bench.shape != (n,):
+        raise ValueError("w_bench must have shape (n,).")
+
+    Q = np.asarray(Sigma, dtype=float)
+    c = -Q @ np.asarray(w_bench, dtype=float)
+
+    A, l, u = _sum_to_one_constraint_A_l_u(n)
+    bounds = _apply_exclusions_and_caps(n, max_weight, exclude)
+
+    spec = CardinalitySpec(
+        base=ProblemSpec(Q=Q, c=c, A=A, l=l, u=u, bounds=bounds),
+        max_names=int(max_names),
+        min_weight=float(min_weight),
+    )
+    use_solver = solver or MathOptOSQP()
+    sol = solve_cardinality_heuristic(spec, use_solver)
+    if exact is not None:
+        sol = exact.solve(spec, incumbent=sol)
+    return sol
@@ -0,0 +1,261 @@
+# qpfolio/reporting/artifacts.py
+"""
+Binary artifacts for audit and reproduction.
+
+- :func:`save_frontier` / :func:`load_frontier` and :func:`save_solution` /
+  :func:`load_solution` write one compressed ``.npz`` per result, with
+  weights as a single (K, N) float64 array and solver info plus provenance
+  as embedded JSON.
+- :class:`ArtifactLog` is an append-only directory for batch runs: weights
+  go to a raw float64 file that :func:`open_log` memory-maps lazily, and
+  per-row metadata to a JSON-lines index.
+- :func:`save_frontier_csv` / :func:`save_solution_json` remain for small,
+  human-readable exports.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import json
+import os
+import platform
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from qpfolio.core.types import Array, Solution, SolverInfo
+from qpfolio.serialization import dumps, info_dict, load_solution_npz, save_solution_npz
+
+FORMAT_VERSION = 1
+
+
+# ---------- Helpers ----------
+
+def provenance(**extra: Any) -> Dict[str, Any]:
+    """Library versions, platform and UTC timestamp, plus any ``extra`` keys."""
+    import qpfolio
+
+    out = {
+        "qpfolio": qpfolio.__version__,
+        "numpy": np.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": _dt.datetime.now(_dt.timezone.utc).isoformat(),
+        "format_version": FORMAT_VERSION,
+    }
+    out.update(extra)
+    return out
+
+
+# ---------- Single-file artifacts ----------
+
+@dataclass
+class FrontierArtifact:
+    """Frontier loaded from :func:`save_frontier`; ``weights`` has shape (K, N)."""
+    risk: Array
+    ret: Array
+    obj: Array
+    status: List[str]
+    weights: Array
+    info: List[Optional[Dict[str, Any]]]
+    labels: Optional[List[str]] = None
+    provenance: Dict[str, Any] = field(default_factory=dict)
+
+    def to_points(self) -> List[Tuple[float, float, Solution]]:
+        """Rebuild the ``(risk, ret, Solution)`` list of ``compute_frontier``."""
+        return [
+            (float(r), float(m), Solution(x=w, obj=float(o), status=s,
+                                           info=None if i is None else SolverInfo(**i)))
+            for r, m, o, s, w, i in zip(self.risk, self.ret, self.obj, self.status, self.weights, self.info)
+        ]
+
+
+def save_frontier(
+    path: os.PathLike,
+    points: Sequence[Tuple[float, float, Solution]],
+    *,
+    labels: Optional[Sequence[str]] = None,
+    meta: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """
+    Write frontier ``points`` (as returned by ``compute_frontier``) to a
+    compressed ``.npz``. ``meta`` is merged into the stored provenance.
+    """
+    header = {
+        "status": [sol.status for _, _, sol in points],
+        "info": [info_dict(sol) for _, _, sol in points],
+        "labels": None if labels is None else [str(s) for s in labels],
+        "provenance": provenance(**(meta or {})),
+    }
+    weights = np.array([np.asarray(sol.x, dtype=float) for _, _, sol in points]) if points else np.zeros((0, 0))
+    np.savez_compressed(
+        path,
+        risk=np.array([p[0] for p in points], dtype=float),
+        ret=np.array([p[1] for p in points], dtype=float),
+        obj=np.array([float(p[2].obj) for p in points], dtype=float),
+        weights=weights,
+        header=np.array(dumps(header)),
+    )
+
+
+def load_frontier(path: os.PathLike) -> FrontierArtifact:
+    """Load a frontier written by :func:`save_frontier`."""
+    with np.load(path) as data:
+        header = json.loads(str(data["header"]))
+        return FrontierArtifact(
+            risk=data["risk"], ret=data["ret"], obj=data["obj"], weights=data["weights"],
+            status=header["status"], info=header["info"], labels=header["labels"],
+            provenance=header["provenance"],
+        )
+
+
+def save_solution(path: os.PathLike, sol: Solution, *, meta: Optional[Mapping[str, Any]] = None) -> None:
+    """Write one Solution (x, duals, active set, info, provenance) to a compressed ``.npz``."""
+    save_solution_npz(path, sol, header={"provenance": provenance(**(meta or {}))})
+
+
+def load_solution(path: os.PathLike) -> Solution:
+    """Load a Solution written by :func:`save_solution`."""
+    return load_solution_npz(path)[0]
+
+
+# ---------- Append-only logs ----------
+
+_WEIGHTS = "weights.f64"
+_INDEX = "index.jsonl"
+_HEADER = "header.json"
+
+
+class ArtifactLog:
+    """
+    Append-only result log for batch runs.
+
+    Each :meth:`append` writes one row of N float64 weights to
+    ``weights.f64`` and one JSON line (status, obj, info, caller metadata) to
+    ``index.jsonl``; both files are only ever appended to, so reopening an
+    existing log continues it. Use as a context manager or call
+    :meth:`close`.
+    """
+
+    def __init__(self, directory: os.PathLike, n: int, *, labels: Optional[Sequence[str]] = None,
+                 meta: Optional[Mapping[str, Any]] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.n = int(n)
+        head = self.directory / _HEADER
+        if head.exists():
+            if json.loads(head.read_text())["n"] != self.n:
+                raise ValueError(f"Existing log at {self.directory} has a different n.")
+        else:
+            head.write_text(dumps({"n": self.n, "labels": None if labels is None else list(map(str, labels)),
+                                    "provenance": provenance(**(meta or {}))}))
+        _truncate_partial(self.directory, self.n)
+        self._w = open(self.directory / _WEIGHTS, "ab")
+        self._idx = open(self.directory / _INDEX, "a")
+
+    def append(self, sol: Solution, **meta: Any) -> None:
+        x = np.ascontiguousarray(sol.x, dtype="<f8")
+        if x.shape != (self.n,):
+            raise ValueError(f"Solution must have {self.n} weights.")
+        self._w.write(x.tobytes())
+        self._w.flush()
+        rec = {"status": sol.status, "obj": float(sol.obj), "info": info_dict(sol)}
+        rec.update(meta)
+        self._idx.write(dumps(rec) + "\n")
+        self._idx.flush()
+
+    def close(self) -> None:
+        self._w.close()
+        self._idx.close()
+
+    def __enter__(self) -> "ArtifactLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _truncate_partial(directory: Path, n: int) -> None:
+    # After a crash, keep only rows present in both files.
+    w, idx = directory / _WEIGHTS, directory / _INDEX
+    rows_w = w.stat().st_size // (8 * n) if w.exists() else 0
+    lines = idx.read_text().splitlines(keepends=True) if idx.exists() else []
+    complete = [ln for ln in lines if ln.endswith("\n")]
+    k = min(rows_w, len(complete))
+    if w.exists() and w.stat().st_size != 8 * n * k:
+        with open(w, "r+b") as fh:
+            fh.truncate(8 * n * k)
+    if len(lines) != k:
+        idx.write_text("".join(complete[:k]))
+
+
+@dataclass
+class LogView:
+    """Lazy view of an :class:`ArtifactLog`; ``weights`` is a read-only memmap of shape (K, N)."""
+    weights: Array
+    records: List[Dict[str, Any]]
+    labels: Optional[List[str]]
+    provenance: Dict[str, Any]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def solution(self, i: int) -> Solution:
+        rec = self.records[i]
+        info = rec.get("info")
+        return Solution(x=np.array(self.weights[i]), obj=rec["obj"], status=rec["status"],
+                        info=None if info is None else SolverInfo(**info))
+
+
+def open_log(directory: os.PathLike) -> LogView:
+    """Open an :class:`ArtifactLog` for reading; weights are memory-mapped, not loaded."""
+    directory = Path(directory)
+    head = json.loads((directory / _HEADER).read_text())
+    n = int(head["n"])
+    records = [json.loads(ln) for ln in (directory / _INDEX).read_text().splitlines() if ln]
+    k = len(records)
+    if k == 0:
+        weights = np.zeros((0, n))
+    else:
+        weights = np.memmap(directory / _WEIGHTS, dtype="<f8", mode="r", shape=(k, n))
+    return LogView(weights=weights, records=records, labels=head["labels"], provenance=head["provenance"])
+
+
+# ---------- Text exports ----------
+
+def save_frontier_csv(df, path: os.PathLike) -> None:
+    """
+    Write a frame from :func:`qpfolio.core.metrics.frontier_to_frame` as CSV,
+    keeping its ``idx`` index as the first column
+    (``pd.read_csv(path, index_col="idx")`` reads it back).
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=True)
+
+
+def save_solution_json(sol: Solution, path: os.PathLike) -> None:
+    """Write a Solution as human-readable JSON."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    doc = {
+        "x": np.asarray(sol.x, dtype=float).tolist(),
+        "obj": float(sol.obj),
+        "status": sol.status,
+        "info": info_dict(sol),
+    }
+    Path(path).write_text(dumps(doc))
+
+
+__all__ = [
+    "FrontierArtifact",
+    "save_frontier",
+    "load_frontier",
+    "save_solution",
+    "load_solution",
+    "ArtifactLog",
+    "LogView",
+    "open_log",
+    "provenance",
+    "save_frontier_csv",
+    "save_solution_json",
+]
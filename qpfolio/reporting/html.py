@@ -1,5 +1,184 @@
-def render_report(frontier_df, images: dict[str, str] | None, out_html: str):
+# qpfolio/reporting/html.py
+from __future__ import annotations
+
+import base64
+import html
+import io
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, TextIO, Union
+
+_CSS = """
+body{font-family:system-ui,sans-serif;margin:2em;color:#222}
+table{border-collapse:collapse;font-size:12px}
+th,td{border:1px solid #ddd;padding:2px 6px;text-align:right}
+th{background:#f4f4f4;position:sticky;top:0}
+tbody.page{display:none}tbody.page.on{display:table-row-group}
+figure{margin:1em 0}figure img,figure svg{max-width:100%;height:auto}
+.pager{margin:.5em 0}
+"""
+
+_PAGER_JS = """
+<script>
+(function(){
+  var pages=document.querySelectorAll('tbody.page'),k=0,label=document.getElementById('pg');
+  function show(i){if(!pages.length)return;pages[k].classList.remove('on');
+    k=Math.max(0,Math.min(pages.length-1,i));pages[k].classList.add('on');
+    label.textContent=(k+1)+' / '+pages.length;}
+  document.getElementById('prev').onclick=function(){show(k-1)};
+  document.getElementById('next').onclick=function(){show(k+1)};
+  show(0);
+})();
+</script>
+"""
+
+_MIME = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".gif": "image/gif"}
+_B64_CHUNK = 3 * 16384  # multiple of 3, so chunks encode without padding
+# id definitions and references in matplotlib SVG output
+_SVG_ID_RE = re.compile(r'(\bid="|href="#|url\(#)')
+
+
+# ---------- Helpers ----------
+
+def _cell(v) -> str:
+    if isinstance(v, float):
+        return f"{v:.6g}"
+    return html.escape(str(v))
+
+
+def _chunks(frontier_df, page_size: int) -> Iterator:
+    # A DataFrame is paged by slicing; any other iterable is taken as a
+    # stream of DataFrame chunks (e.g. from pd.read_csv(..., chunksize=...)).
+    if hasattr(frontier_df, "iloc"):
+        for start in range(0, len(frontier_df), page_size):
+            yield frontier_df.iloc[start:start + page_size]
+    else:
+        yield from frontier_df
+
+
+def _write_image(out: TextIO, name: str, data: Union[bytes, str], ext: str, prefix: str = "") -> None:
+    out.write(f'<figure id="{html.escape(name)}">')
+    if ext == ".svg":
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        start = text.find("<svg")  # drop XML prolog / doctype
+        text = text[start:] if start >= 0 else text
+        # Inline SVGs share one id namespace; matplotlib reuses ids such as
+        # "patch_1" or content hashes in every figure, so prefix them.
+        out.write(_SVG_ID_RE.sub(lambda m: m.group(1) + prefix, text) if prefix else text)
+    else:
+        out.write(f'<img alt="{html.escape(name)}" src="data:{_MIME.get(ext, "application/octet-stream")};base64,')
+        for i in range(0, len(data), _B64_CHUNK):
+            out.write(base64.b64encode(data[i:i + _B64_CHUNK]).decode("ascii"))
+        out.write('">')
+    out.write(f"<figcaption>{html.escape(name)}</figcaption></figure>\n")
+
+
+def _render_figure(draw: Callable, fmt: str) -> bytes:
+    # Figure objects without pyplot carry no global state, so they can be
+    # drawn from worker threads.
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(7, 4.5))
+    draw(fig)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, bbox_inches="tight")
+    return buf.getvalue()
+
+
+def _write_table(out: TextIO, chunks: Iterable, page_size: int) -> int:
+    rows = 0
+    header = False
+    for chunk in chunks:
+        if not header:
+            out.write('<div class="pager"><button id="prev">&lsaquo;</button> <span id="pg"></span> '
+                      '<button id="next">&rsaquo;</button></div>\n<table><thead><tr>')
+            out.write("".join(f"<th>{html.escape(str(c))}</th>" for c in chunk.columns))
+            out.write("</tr></thead>\n")
+            header = True
+        for start in range(0, len(chunk), page_size):
+            out.write('<tbody class="page">')
+            for row in chunk.iloc[start:start + page_size].itertuples(index=False, name=None):
+                out.write("<tr>" + "".join(f"<td>{_cell(v)}</td>" for v in row) + "</tr>")
+            out.write("</tbody>\n")
+        rows += len(chunk)
+    if header:
+        out.write("</table>\n" + _PAGER_JS)
+    return rows
+
+
+# ---------- Public API ----------
+
+def render_report(
+    frontier_df,
+    images: Optional[Dict[str, str]],
+    out_html: str,
+    *,
+    figures: Optional[Mapping[str, Callable]] = None,
+    figure_format: str = "png",
+    title: str = "qpfolio report",
+    page_size: int = 500,
+    max_workers: Optional[int] = None,
+) -> int:
     """
-    images: dict keys like {"frontier_png": ".../frontier.png", "weights_png": ".../weights.png"}
-    Writes a self-contained HTML with summary tables and embedded images by <img src>.
+    Write a self-contained HTML report, streaming it to ``out_html``.
+
+    Parameters
+    ~~~~~~~~~~
+    - **frontier_df**: A DataFrame (e.g. from :func:`qpfolio.core.metrics.frontier_to_frame`)
+      or an iterable of DataFrame chunks with identical columns. Rows are
+      written as they are read, ``page_size`` per page, with a small inline
+      pager, so only one chunk is held in memory.
+    - **images** (dict, optional): name -> path of an existing figure
+      (e.g. ``{"frontier_png": ".../frontier.png"}``). PNG/JPEG files are
+      inlined as base64 data URIs, SVG files as inline markup.
+    - **figures** (dict, optional): name -> ``draw(fig)`` callable that draws on
+      a fresh ``matplotlib.figure.Figure``. Figures are rendered concurrently
+      on ``max_workers`` threads, with at most ``max_workers`` rendered or in
+      progress at a time, and written in order as they complete, inlined in
+      ``figure_format`` (``"png"`` or ``"svg"``). Inline SVG ids are prefixed
+      per figure so they stay unique in the document.
+
+    Returns
+    ~~~~~~~
+    - **rows** (int): Number of table rows written.
     """
+    if figure_format not in ("png", "svg"):
+        raise ValueError("figure_format must be 'png' or 'svg'.")
+    with open(out_html, "w", encoding="utf-8") as out:
+        out.write(f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+                  f"<style>{_CSS}</style></head><body>\n<h1>{html.escape(title)}</h1>\n")
+
+        for i, (name, path) in enumerate((images or {}).items()):
+            ext = os.path.splitext(path)[1].lower()
+            with open(path, "rb") as fh:
+                _write_image(out, name, fh.read(), ext, prefix=f"img{i}-")
+
+        if figures:
+            workers = max_workers or min(32, (os.cpu_count() or 1) + 4)  # ThreadPoolExecutor's default
+            items = iter(enumerate(figures.items()))
+            pending: deque = deque()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # At most ``workers`` figures in flight; each is written and
+                # dropped in order before the next one is submitted.
+                for i, (name, draw) in items:
+                    pending.append((i, name, pool.submit(_render_figure, draw, figure_format)))
+                    if len(pending) >= workers:
+                        break
+                while pending:
+                    i, name, fut = pending.popleft()
+                    _write_image(out, name, fut.result(), "." + figure_format, prefix=f"fig{i}-")
+                    nxt = next(items, None)
+                    if nxt is not None:
+                        j, (name, draw) = nxt
+                        pending.append((j, name, pool.submit(_render_figure, draw, figure_format)))
+
+        rows = _write_table(out, _chunks(frontier_df, page_size), page_size)
+        out.write("</body></html>\n")
+    return rows
+
+
+__all__ = [
+    "render_report",
+]
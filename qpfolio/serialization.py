@@ -0,0 +1,88 @@
+# qpfolio/serialization.py
+"""
+On-disk layout shared by :mod:`qpfolio.checkpoint` and
+:mod:`qpfolio.reporting.artifacts`.
+
+A Solution is one ``.npz`` with arrays ``x`` and, when present, ``y`` and
+``active``, plus a JSON ``header`` holding ``obj``, ``status``, ``info``,
+``blocks`` and any caller-supplied keys (e.g. provenance).
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, BinaryIO, Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from qpfolio.core.types import Solution, SolverInfo
+
+PathOrFile = Union[os.PathLike, str, BinaryIO]
+
+
+def jsonable(v: Any) -> Any:
+    """``json.dumps`` fallback for numpy scalars and arrays."""
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    return str(v)
+
+
+def dumps(obj: Any) -> str:
+    return json.dumps(obj, default=jsonable)
+
+
+def info_dict(sol: Solution) -> Optional[Dict[str, Any]]:
+    """``sol.info`` as a plain dict without unset (None) fields."""
+    if sol.info is None:
+        return None
+    return {k: v for k, v in dict(sol.info).items() if v is not None}
+
+
+def save_solution_npz(
+    file: PathOrFile,
+    sol: Solution,
+    *,
+    header: Optional[Mapping[str, Any]] = None,
+    compressed: bool = True,
+) -> None:
+    """Write ``sol`` to ``file``; ``header`` keys are stored next to the solution metadata."""
+    arrays = {"x": np.asarray(sol.x, dtype=float)}
+    if sol.y is not None:
+        arrays["y"] = np.asarray(sol.y, dtype=float)
+    if sol.active is not None:
+        arrays["active"] = np.asarray(sol.active, dtype=bool)
+    head = dict(header or {})
+    head.update({
+        "obj": float(sol.obj),
+        "status": sol.status,
+        "info": info_dict(sol),
+        "blocks": None if sol.blocks is None else [list(b) for b in sol.blocks],
+    })
+    (np.savez_compressed if compressed else np.savez)(file, header=np.array(dumps(head)), **arrays)
+
+
+def load_solution_npz(file: PathOrFile) -> Tuple[Solution, Dict[str, Any]]:
+    """Read a file written by :func:`save_solution_npz`; returns ``(solution, header)``."""
+    with np.load(file) as data:
+        header = json.loads(str(data["header"]))
+        sol = Solution(
+            x=data["x"],
+            obj=header["obj"],
+            status=header["status"],
+            info=None if header["info"] is None else SolverInfo(**header["info"]),
+            y=data["y"] if "y" in data.files else None,
+            active=data["active"] if "active" in data.files else None,
+            blocks=None if header["blocks"] is None else tuple(tuple(b) for b in header["blocks"]),
+        )
+    return sol, header
+
+
+__all__ = [
+    "jsonable",
+    "dumps",
+    "info_dict",
+    "save_solution_npz",
+    "load_solution_npz",
+]
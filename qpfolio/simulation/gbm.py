@@ -6,6 +6,8 @@ from typing import Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from qpfolio.core.data import map_streams, rng_stream
+
 
 @dataclass(frozen=True)
 class GBMParams:
@@ -37,6 +39,8 @@ def simulate_gbm_paths(
     s0: np.ndarray | float = 100.0,
     n_paths: int = 1,
     seed: Optional[int] = None,
+    start: int = 0,
+    workers: int = 1,
 ) -> pd.Panel | dict[int, pd.DataFrame]:
     """
     Simulate (vector) GBM price paths for N assets over [0, T].
@@ -45,30 +49,37 @@ def simulate_gbm_paths(
 
     Returns a dict: {path_index: DataFrame(time_index, assets)}.
     (pandas.Panel is deprecated; returning dict keeps dependencies light.)
+
+    Path p draws from its own stream ``rng_stream(seed, p)``, so paths
+    ``start .. start + n_paths - 1`` (keyed by their global index) are
+    bit-identical whether simulated in one call, in shards, or on several
+    ``workers`` threads.
     """
-    rng = np.random.default_rng(seed)
     mus, sigmas, s0s = _as_arrays(mus, sigmas, s0)
+    if seed is None:
+        # Fix the entropy once so every path of this call shares one root.
+        seed = np.random.SeedSequence().entropy
 
     n_assets = mus.size
     n_steps = int(T * steps_per_year)
     dt = 1.0 / steps_per_year
     times = np.linspace(0.0, T, n_steps + 1)
+    index = pd.Index(times, name="t")
+    drift = (mus - 0.5 * sigmas**2) * times[:, None]
 
-    out: dict[int, pd.DataFrame] = {}
-    for p in range(n_paths):
+    def path(p: int) -> pd.DataFrame:
         # standard Brownian increments ~ N(0, dt)
-        Z = rng.standard_normal(size=(n_steps, n_assets))
+        Z = rng_stream(seed, p).standard_normal(size=(n_steps, n_assets))
         dW = np.sqrt(dt) * Z
         W = np.vstack([np.zeros((1, n_assets)), np.cumsum(dW, axis=0)])
 
-        drift = (mus - 0.5 * sigmas**2) * times[:, None]
         diff  = sigmas * W
         X = drift + diff
         S = s0s * np.exp(X)  # (n_steps+1, n_assets)
+        return pd.DataFrame(S, index=index)
 
-        df = pd.DataFrame(S, index=pd.Index(times, name="t"))
-        out[p] = df
-    return out
+    keys = range(start, start + n_paths)
+    return dict(zip(keys, map_streams(path, keys, workers)))
 
 
 def simulate_prices_and_returns(
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Protocol
-from qpfolio.core.types import ProblemSpec, Solution
+from typing import Optional, Protocol
+from qpfolio.core.types import CardinalitySpec, ProblemSpec, Solution
 
 
 class Solver(ABC):
@@ -12,3 +12,8 @@ class Solver(ABC):
 
 class HasSolve(Protocol):
     def solve(self, problem: ProblemSpec) -> Solution: ...
+
+
+class CardinalityBackend(Protocol):
+    """Exact (e.g. branch-and-bound) solver for cardinality/min-lot problems."""
+    def solve(self, spec: CardinalitySpec, incumbent: Optional[Solution] = None) -> Solution: ...
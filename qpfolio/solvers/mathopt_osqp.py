@@ -1,8 +1,9 @@
 # qpfolio/solvers/mathopt_osqp.py
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 
 try:
@@ -12,46 +13,57 @@ except Exception:  # pragma: no cover
 
 import scipy.sparse as sp
 
-from qpfolio.core.types import ProblemSpec, Solution, Array
+from qpfolio.core.types import ProblemSpec, Solution, SolverInfo, Array
+from qpfolio.solvers.presolve import presolve_fixed
+from qpfolio.solvers.scaling import ruiz_equilibrate
 
 
 # ---------- Helpers ----------
 
-def _osqp_info_to_dict(info_ns) -> dict:
+def _osqp_info_to_struct(info_ns, **overrides) -> SolverInfo:
     """
-    Convert OSQP info (often a SimpleNamespace) to a plain dict, tolerating
-    version differences in field names.
-    """
-    base = {}
-    try:
-        base.update(vars(info_ns))
-    except Exception:
-        pass
-
-    # Normalize common residual fields if missing on this OSQP version
-    if "pri_res" not in base:
-        base["pri_res"] = getattr(info_ns, "pri_res", getattr(info_ns, "pri_res_norm", None))
-    if "dua_res" not in base:
-        base["dua_res"] = getattr(info_ns, "dua_res", getattr(info_ns, "dua_res_norm", None))
-
-    # Common extras (populate if present, otherwise None)
-    for k in ("iter", "status_val", "setup_time", "solve_time", "rho"):
-        if k not in base:
-            base[k] = getattr(info_ns, k, None)
-
-    return base
-
+    Capture the OSQP info fields qpfolio relies on into a compact SolverInfo.
 
-def _bounds_to_triplet(n: int, bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]]):
+    Only a fixed set of fields is probed (tolerating the names used by
+    different OSQP versions); ``overrides`` replace probed fields or add
+    extra keys.
+    """
+    def pick(*names):
+        for name in names:
+            v = getattr(info_ns, name, None)
+            if v is not None:
+                return v
+        return None
+
+    fields = dict(
+        status=pick("status"),
+        status_val=pick("status_val"),
+        iter=pick("iter"),
+        obj_val=pick("obj_val"),
+        pri_res=pick("pri_res", "prim_res", "pri_res_norm"),
+        dua_res=pick("dua_res", "dual_res", "dua_res_norm"),
+        setup_time=pick("setup_time"),
+        solve_time=pick("solve_time"),
+        polish_time=pick("polish_time"),
+        run_time=pick("run_time"),
+        rho=pick("rho", "rho_estimate"),
+    )
+    fields.update(overrides)
+    return SolverInfo(**fields)
+
+
+def _bounds_to_triplet(n: int, bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]],
+                       sparse: bool = False):
     """
     Convert variable bounds into an OSQP-style triplet (A_b, l_b, u_b),
     where A_b = I (n x n), l_b[i] <= x_i <= u_b[i].
-    None maps to +/- inf appropriately.
+    None maps to +/- inf appropriately. With ``sparse=True`` A_b is a sparse
+    identity, so large lifted problems never allocate a dense n x n block.
     """
     if bounds is None:
         return None, None, None
 
-    I = np.eye(n)
+    I = sp.identity(n, format="csc") if sparse else np.eye(n)
     l = np.empty(n, dtype=float)
     u = np.empty(n, dtype=float)
 
@@ -75,10 +87,14 @@ def _stack_osqp_system(
     A_ineq: Optional[Array],
     b_ineq: Optional[Array],
     bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]],
+    symmetric: bool = False,
 ):
     """
     Build OSQP system P, q, A, l, u from legacy (A_eq, b_eq, A_ineq, b_ineq, bounds).
 
+    If ``symmetric`` is True, Q is trusted to be symmetric and returned as P
+    without a copy.
+
     Returns:
         P (n,n)  : quadratic matrix (symmetrized)
         q (n,)   : linear vector
@@ -119,27 +135,64 @@ def _stack_osqp_system(
         l = np.concatenate(blocks_l)
         u = np.concatenate(blocks_u)
 
-    P = (Q + Q.T) / 2.0
+    P = Q if symmetric else (Q + Q.T) / 2.0
     q = c.astype(float, copy=False)
 
     return P, q, A, l, u
 
 
+def _objective_to_csc(Q, symmetric: bool = False) -> sp.csc_matrix:
+    """
+    Upper-triangular CSC form of the symmetric part of Q.
+
+    OSQP only reads triu(P); handing it an upper-triangular CSC directly avoids
+    OSQP's own tril/triu pass on top of our dense-to-sparse conversion. When
+    ``symmetric`` is True, Q is used as-is instead of forming (Q + Q^T) / 2.
+    """
+    P = Q if symmetric else (Q + Q.T) / 2.0
+    if sp.issparse(P):
+        return sp.triu(P, format="csc")
+    return _dense_triu_csc(np.asarray(P, dtype=float))
+
+
+def _dense_triu_csc(P: Array) -> sp.csc_matrix:
+    # Fill the CSC arrays of triu(P) column by column, so the only N x N-sized
+    # allocation is the result itself (no dense triu copy, no COO indices).
+    n = P.shape[0]
+    indptr = np.zeros(n + 1, dtype=np.int64 if n * (n + 1) // 2 > np.iinfo(np.int32).max else np.int32)
+    np.cumsum(np.arange(1, n + 1), out=indptr[1:])
+    data = np.empty(int(indptr[-1]))
+    indices = np.empty(int(indptr[-1]), dtype=indptr.dtype)
+    for j in range(n):
+        data[indptr[j]:indptr[j + 1]] = P[:j + 1, j]
+        indices[indptr[j]:indptr[j + 1]] = np.arange(j + 1)
+    M = sp.csc_matrix((data, indices, indptr), shape=(n, n))
+    M.has_sorted_indices = True
+    M.eliminate_zeros()
+    return M
+
+
 def _merge_triplet_with_bounds(
     A: Array, l: Array, u: Array,
     bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]]
 ):
     """
     Append variable-bounds rows to an existing (A, l, u) triplet.
+    A may be dense or scipy.sparse; sparse input stays sparse.
     """
     if bounds is None:
         return A, l, u
 
     n = A.shape[1]
-    A_b, l_b, u_b = _bounds_to_triplet(n, bounds)
+    A_b, l_b, u_b = _bounds_to_triplet(n, bounds, sparse=sp.issparse(A))
     if A_b is None:
         return A, l, u
 
+    if sp.issparse(A):
+        # Keep sparse constraint rows sparse; bounds become a sparse identity.
+        A2 = sp.vstack([A, A_b], format="csc")
+        return A2, np.concatenate([l, l_b]), np.concatenate([u, u_b])
+
     A2 = np.vstack([A, A_b])
     l2 = np.concatenate([l, l_b])
     u2 = np.concatenate([u, u_b])
@@ -166,97 +219,397 @@ def _clip_to_bounds(x: Array, bounds: Optional[Sequence[Tuple[Optional[float], O
     return np.minimum(np.maximum(x, lo), hi)
 
 
+def stack_problem(problem: ProblemSpec):
+    """
+    Stack a ProblemSpec's constraints into OSQP form.
+
+    Returns ``(q, A, l, u, blocks)`` where ``blocks`` names the row ranges of A
+    as ``(name, start, stop)``: ``"A"`` for triplet rows, or ``"eq"`` and
+    ``"ineq"`` for the legacy form, followed by ``"bounds"`` (one row per
+    variable) when bounds are given.
+    """
+    n = problem.Q.shape[0]
+    sizes = []
+    # Prefer the triplet if present
+    if (problem.A is not None) and (problem.l is not None) and (problem.u is not None):
+        q = problem.c.astype(float, copy=False)
+        A, l, u = _merge_triplet_with_bounds(problem.A, problem.l, problem.u, problem.bounds)
+        sizes.append(("A", problem.A.shape[0]))
+    else:
+        # Fallback to legacy path
+        A_ineq = problem.A_ineq if problem.A_ineq is not None else problem.G
+        b_ineq = problem.b_ineq if problem.b_ineq is not None else problem.h
+
+        _, q, A, l, u = _stack_osqp_system(
+            Q=problem.Q,
+            c=problem.c,
+            A_eq=problem.A_eq,
+            b_eq=problem.b_eq,
+            A_ineq=A_ineq,
+            b_ineq=b_ineq,
+            bounds=problem.bounds,
+            symmetric=True,  # P is formed separately; skip the dense symmetrization here
+        )
+        if problem.A_eq is not None and problem.b_eq is not None:
+            sizes.append(("eq", problem.A_eq.shape[0]))
+        if A_ineq is not None and b_ineq is not None:
+            sizes.append(("ineq", A_ineq.shape[0]))
+    if problem.bounds is not None:
+        sizes.append(("bounds", n))
+
+    blocks = []
+    start = 0
+    for name, size in sizes:
+        blocks.append((name, start, start + size))
+        start += size
+    return q, A, l, u, tuple(blocks)
+
+
+def _primal_dual(res) -> Tuple[Optional[Array], Optional[Array]]:
+    # Copy: OSQP may reuse its result buffers on the next solve.
+    x = np.array(res.x) if res.x is not None else None
+    y = np.array(res.y) if getattr(res, "y", None) is not None else None
+    return x, y
+
+
+def _active_rows(Ax: Array, l: Array, u: Array, tol: float = 1e-6) -> Array:
+    """Rows of l <= A x <= u that hold with equality (within a relative tolerance)."""
+    # Infinite sides never bind (inf <= tol * inf would otherwise hold).
+    with np.errstate(invalid="ignore"):
+        at_lo = np.isfinite(l) & (np.abs(Ax - l) <= tol * (1.0 + np.abs(l)))
+        at_hi = np.isfinite(u) & (np.abs(u - Ax) <= tol * (1.0 + np.abs(u)))
+    return at_lo | at_hi
+
+
+def _residuals(P_triu: sp.csc_matrix, q: Array, A: sp.csc_matrix, l: Array, u: Array,
+               x: Array, y: Optional[Array]) -> Tuple[float, Optional[float]]:
+    """OSQP's primal / dual residuals (inf-norms) of ``(x, y)`` on the given data."""
+    Ax = A @ x
+    pri = float(np.max(np.abs(Ax - np.clip(Ax, l, u)), initial=0.0))
+    if y is None:
+        return pri, None
+    Px = P_triu @ x + P_triu.T @ x - P_triu.diagonal() * x
+    return pri, float(np.max(np.abs(Px + q + A.T @ y), initial=0.0))
+
+
+def _scaled_warm_start(x0: Optional[Array], y0: Optional[Array], scaling) -> dict:
+    out = {}
+    if x0 is not None:
+        x0 = np.asarray(x0, dtype=float)
+        out["x"] = x0 / scaling.D if scaling is not None else x0
+    if y0 is not None:
+        y0 = np.asarray(y0, dtype=float)
+        out["y"] = y0 * scaling.c / scaling.E if scaling is not None else y0
+    return out
+
+
+def _status_of(info_ns) -> str:
+    return str(getattr(info_ns, "status", "") or "").lower()
+
+
 # ---------- Solver wrapper ----------
 
+@dataclass(frozen=True)
+class TolerancePolicy:
+    """
+    Loose-first accuracy schedule for :class:`MathOptOSQP`.
+
+    The problem is set up once and solved at ``eps_schedule[0]`` (applied to
+    both eps_abs and eps_rel). Each later entry tightens the tolerances and
+    re-solves warm-started from the previous iterate, but only until one of the
+    portfolio-level stopping rules holds:
+
+    - ``weight_tol``: max |Δw| between consecutive passes is below it
+      (e.g. well under a tradeable lot size);
+    - ``gap_tol``: the reported duality gap is below ``gap_tol * |obj|``
+      (only on OSQP versions that report it; relative, since portfolio
+      variances are often far below 1);
+    - the pass was successfully polished, which already yields an exact
+      solution on the identified active set.
+
+    Later passes resume from the previous pass's x, y and rho rather than
+    redoing work: rho adapts every ``rho_interval`` iterations (OSQP's default
+    time-based rule would keep a stale rho for a whole refinement pass), and
+    refinement passes check termination every ``refine_check`` iterations so
+    a pass that is already nearly converged stops after a few steps.
+    """
+    eps_schedule: Tuple[float, ...] = (1e-4, 1e-6, 1e-8)
+    weight_tol: float = 1e-5
+    gap_tol: Optional[float] = 1e-7
+    rho_interval: int = 25
+    refine_check: int = 5
+
+    def converged(self, x: Array, x_prev: Optional[Array], info_ns) -> bool:
+        if getattr(info_ns, "status_polish", None) == 1:
+            return True
+        gap = getattr(info_ns, "duality_gap", None)
+        obj = getattr(info_ns, "obj_val", None)
+        if self.gap_tol is not None and gap is not None and obj is not None:
+            if abs(gap) <= self.gap_tol * abs(obj):
+                return True
+        return x_prev is not None and float(np.max(np.abs(x - x_prev), initial=0.0)) < self.weight_tol
+
+
 @dataclass
 class MathOptOSQP:
     """
     Thin OSQP wrapper that understands either:
       (a) OSQP triplet (A, l, u) [preferred], plus optional bounds
       (b) Legacy (A_eq, b_eq, A_ineq, b_ineq) plus bounds
+
+    With ``policy`` set, ``eps_abs``/``eps_rel`` are ignored in favour of the
+    policy's loose-to-tight schedule (see :class:`TolerancePolicy`).
+
+    With ``precondition=True``, the system is Ruiz-equilibrated by qpfolio
+    before it reaches OSQP (see :func:`qpfolio.solvers.scaling.ruiz_equilibrate`)
+    and the solution is unscaled afterwards; the achieved conditioning is
+    reported as ``info["cond_before"]`` / ``info["cond_after"]``. Tolerances
+    then apply to the scaled problem, while ``info["pri_res"]`` /
+    ``info["dua_res"]`` are recomputed on the original data.
+
+    With ``presolve=True`` (default), variables fixed by their bounds
+    (exclusions, zero caps) are removed before setup and scattered back into
+    the returned Solution (see :func:`qpfolio.solvers.presolve.presolve_fixed`);
+    ``info["presolve_fixed"]`` counts them.
     """
     verbose: bool = False
     eps_abs: float = 1e-7
     eps_rel: float = 1e-7
     max_iter: int = 100000
     polish: bool = True  # enable OSQP polishing by default for tighter feasibility
-
-    def solve(self, problem: ProblemSpec) -> Solution:
+    policy: Optional[TolerancePolicy] = None
+    precondition: bool = False
+    precondition_iter: int = 10
+    presolve: bool = True
+
+    def solve(
+        self,
+        problem: ProblemSpec,
+        *,
+        time_limit: Optional[float] = None,
+        max_iter: Optional[int] = None,
+        x0: Optional[Array] = None,
+        y0: Optional[Array] = None,
+    ) -> Solution:
+        """
+        Solve ``problem``.
+
+        ``time_limit`` (seconds) and ``max_iter`` are per-call budgets shared by
+        all passes of the tolerance policy; ``max_iter`` defaults to the
+        instance setting. ``x0`` / ``y0`` warm-start OSQP from a previous
+        primal / dual solution (``y0`` in the stacked row order of
+        ``Solution.y``).
+        """
+        if self.presolve:
+            reduced, post = presolve_fixed(problem)
+            if post is not None:
+                sol = self._solve(reduced, time_limit=time_limit, max_iter=max_iter,
+                                  x0=post.reduce_x(x0), y0=post.reduce_y(y0))
+                return post.scatter(sol)
+        return self._solve(problem, time_limit=time_limit, max_iter=max_iter, x0=x0, y0=y0)
+
+    def solve_path(
+        self,
+        problem: ProblemSpec,
+        *,
+        q: Optional[Array] = None,
+        l: Optional[Array] = None,
+        u: Optional[Array] = None,
+        x0: Optional[Array] = None,
+        y0: Optional[Array] = None,
+    ) -> List[Solution]:
+        """
+        Solve a sequence of problems that share ``problem``'s Q and A and
+        differ only in the linear term and/or the row bounds.
+
+        ``q`` has shape (K, n); ``l`` / ``u`` have shape (K, m) in the stacked
+        row order of ``Solution.y`` (see ``Solution.blocks``); ``None`` keeps the
+        base problem's vector. OSQP is set up and factorized once (see
+        :meth:`path_session`), and each step is warm-started from the previous
+        one (the first from ``x0`` / ``y0``). Steps use ``eps_abs`` /
+        ``eps_rel``; ``policy``, ``precondition`` and ``presolve`` do not apply.
+        """
+        steps = [np.atleast_2d(np.asarray(v, dtype=float)) for v in (q, l, u) if v is not None]
+        if not steps:
+            raise ValueError("solve_path needs at least one of q, l, u.")
+        K = steps[0].shape[0]
+        if any(v.shape[0] != K for v in steps):
+            raise ValueError("q, l and u must have the same number of steps.")
+        session = self.path_session(problem, x0=x0, y0=y0)
+        return [
+            session.solve(q=None if q is None else q[k], l=None if l is None else l[k],
+                          u=None if u is None else u[k])
+            for k in range(K)
+        ]
+
+    def path_session(
+        self,
+        problem: ProblemSpec,
+        *,
+        x0: Optional[Array] = None,
+        y0: Optional[Array] = None,
+    ) -> "PathSession":
+        """
+        Set up OSQP once for ``problem`` and return a :class:`PathSession`
+        whose ``solve`` re-solves it with new ``q`` / ``l`` / ``u``. Use it
+        when later steps depend on earlier results; :meth:`solve_path` is the
+        same loop over precomputed steps.
+        """
         if osqp is None:
             raise RuntimeError(
                 "osqp is not installed. Install with `pip install osqp` or include the 'solver' extra."
             )
-
-        # Prefer the triplet if present
-        if (problem.A is not None) and (problem.l is not None) and (problem.u is not None):
-            P = (problem.Q + problem.Q.T) / 2.0
-            q = problem.c.astype(float, copy=False)
-
-            A, l, u = _merge_triplet_with_bounds(problem.A, problem.l, problem.u, problem.bounds)
-
-            Psp = sp.csc_matrix(P)
-            Asp = sp.csc_matrix(A)
-
-            prob = osqp.OSQP()
-            prob.setup(
-                P=Psp,
-                q=q,
-                A=Asp,
-                l=l,
-                u=u,
-                verbose=self.verbose,
-                eps_abs=self.eps_abs,
-                eps_rel=self.eps_rel,
-                max_iter=self.max_iter,
-                polish=self.polish,
+        return PathSession(self, problem, x0=x0, y0=y0)
+
+    def _solve(
+        self,
+        problem: ProblemSpec,
+        *,
+        time_limit: Optional[float],
+        max_iter: Optional[int],
+        x0: Optional[Array],
+        y0: Optional[Array],
+    ) -> Solution:
+        if osqp is None:
+            raise RuntimeError(
+                "osqp is not installed. Install with `pip install osqp` or include the 'solver' extra."
             )
-            res = prob.solve()
-
-            x = res.x if res.x is not None else np.zeros_like(q)
-            # Final small safety: clip to bounds to avoid 1e-7 overshoots.
-            x = _clip_to_bounds(x, problem.bounds)
-
-            obj = float(res.info.obj_val) if getattr(res.info, "obj_val", None) is not None else np.nan
-            status = str(res.info.status).lower() if getattr(res.info, "status", None) is not None else "unknown"
-            info = _osqp_info_to_dict(res.info)
-            return Solution(x=x, obj=obj, status=status, info=info)
 
-        # Fallback to legacy path
-        A_ineq = problem.A_ineq if problem.A_ineq is not None else problem.G
-        b_ineq = problem.b_ineq if problem.b_ineq is not None else problem.h
-
-        P, q, A, l, u = _stack_osqp_system(
-            Q=problem.Q,
-            c=problem.c,
-            A_eq=problem.A_eq,
-            b_eq=problem.b_eq,
-            A_ineq=A_ineq,
-            b_ineq=b_ineq,
-            bounds=problem.bounds,
-        )
-
-        Psp = sp.csc_matrix(P)
-        Asp = sp.csc_matrix(A)
+        q, A, l, u, blocks = stack_problem(problem)
+        Psp = _objective_to_csc(problem.Q, symmetric=problem.symmetric)
+        Asp = A_orig = sp.csc_matrix(A)
+        P_orig, q_orig, l_orig, u_orig = Psp, q, l, u
+        scaling = None
+        if self.precondition:
+            Psp, q, Asp, l, u, scaling = ruiz_equilibrate(Psp, q, Asp, l, u, iters=self.precondition_iter)
+        # Policy checks compare weights in the original (unscaled) units.
+        weights = scaling.unscale_x if scaling is not None else (lambda v: v)
+
+        if self.policy is None:
+            schedule = [(self.eps_abs, self.eps_rel)]
+        else:
+            schedule = [(eps, eps) for eps in self.policy.eps_schedule]
+        iter_budget = self.max_iter if max_iter is None else int(max_iter)
+        deadline = None if time_limit is None else time.perf_counter() + float(time_limit)
 
-        prob = osqp.OSQP()
-        prob.setup(
-            P=Psp,
-            q=q,
-            A=Asp,
-            l=l,
-            u=u,
+        settings = dict(
             verbose=self.verbose,
-            eps_abs=self.eps_abs,
-            eps_rel=self.eps_rel,
-            max_iter=self.max_iter,
+            eps_abs=schedule[0][0],
+            eps_rel=schedule[0][1],
+            max_iter=iter_budget,
             polish=self.polish,
         )
-        res = prob.solve()
+        if time_limit is not None:
+            settings["time_limit"] = float(time_limit)
+        if self.policy is not None:
+            settings["adaptive_rho_interval"] = self.policy.rho_interval
 
-        x = res.x if res.x is not None else np.zeros_like(q)
+        prob = osqp.OSQP()
+        prob.setup(P=Psp, q=q, A=Asp, l=l, u=u, **settings)
+        if x0 is not None or y0 is not None:
+            prob.warm_start(**_scaled_warm_start(x0, y0, scaling))
+        res = prob.solve()
+        x, y = _primal_dual(res)
+        iters = int(getattr(res.info, "iter", 0) or 0)
+        passes = 1
+        fallback: Optional[SolverInfo] = None
+
+        for eps_abs, eps_rel in schedule[1:]:
+            if x is None or not _status_of(res.info).startswith("solved"):
+                break
+            if self.policy.converged(weights(x), None, res.info):
+                break
+            update = dict(eps_abs=eps_abs, eps_rel=eps_rel, max_iter=iter_budget - iters,
+                          check_termination=self.policy.refine_check)
+            if update["max_iter"] <= 0:
+                break
+            if deadline is not None:
+                update["time_limit"] = deadline - time.perf_counter()
+                if update["time_limit"] <= 0:
+                    break
+            prob.update_settings(**update)
+            prob.warm_start(x=x, y=y)  # resume from the previous pass; rho is kept
+            prev_x, prev_y, prev_info = x, y, _osqp_info_to_struct(res.info)
+            res = prob.solve()
+            x, y = _primal_dual(res)
+            iters += int(getattr(res.info, "iter", 0) or 0)
+            passes += 1
+            if x is None or not _status_of(res.info).startswith("solved"):
+                # Refinement ran out of budget; keep the last solved pass.
+                x, y, fallback = prev_x, prev_y, prev_info
+                break
+            if self.policy.converged(weights(x), weights(prev_x), res.info):
+                break
+
+        if x is None:
+            x = np.zeros_like(q)
+        x = weights(x)
+        # Final small safety: clip to bounds to avoid 1e-7 overshoots.
         x = _clip_to_bounds(x, problem.bounds)
+        if y is not None and scaling is not None:
+            y = scaling.unscale_y(y)
+        active = _active_rows(A_orig @ x, l_orig, u_orig)
+
+        overrides = {"iter": iters}
+        if self.policy is not None:
+            overrides["passes"] = passes
+        if fallback is not None:
+            info = SolverInfo(**{**dict(fallback), **overrides})
+        else:
+            info = _osqp_info_to_struct(res.info, **overrides)
+        if scaling is not None:
+            # OSQP's residuals refer to the scaled problem; report them on the original data.
+            obj_val = info["obj_val"]
+            pri_res, dua_res = _residuals(P_orig, q_orig, A_orig, l_orig, u_orig, x, y)
+            info = SolverInfo(**{
+                **dict(info),
+                "obj_val": scaling.unscale_obj(obj_val) if obj_val is not None else None,
+                "pri_res": pri_res,
+                "dua_res": dua_res,
+                "cond_before": scaling.cond_before,
+                "cond_after": scaling.cond_after,
+            })
+        obj = float(info["obj_val"]) if info["obj_val"] is not None else np.nan
+        status = str(info["status"]).lower() if info["status"] is not None else "unknown"
+        return Solution(x=x, obj=obj, status=status, info=info, y=y, active=active, blocks=blocks)
+
+
+class PathSession:
+    """
+    One OSQP workspace for a sequence of problems that share Q and A.
+
+    Created by :meth:`MathOptOSQP.path_session`. ``q``, ``A``, ``l``, ``u`` and
+    ``blocks`` are the base problem in stacked form (as from
+    :func:`stack_problem`); each :meth:`solve` updates the vectors it is given
+    (others revert to the base) and warm-starts from the previous step.
+    """
 
-        obj = float(res.info.obj_val) if getattr(res.info, "obj_val", None) is not None else np.nan
-        status = str(res.info.status).lower() if getattr(res.info, "status", None) is not None else "unknown"
-        info = _osqp_info_to_dict(res.info)
-        return Solution(x=x, obj=obj, status=status, info=info)
+    def __init__(self, solver: MathOptOSQP, problem: ProblemSpec, *, x0: Optional[Array] = None,
+                 y0: Optional[Array] = None):
+        self.q, A, self.l, self.u, self.blocks = stack_problem(problem)
+        self.A = sp.csc_matrix(A)
+        self._prob = osqp.OSQP()
+        self._prob.setup(P=_objective_to_csc(problem.Q, symmetric=problem.symmetric), q=self.q, A=self.A,
+                         l=self.l, u=self.u, verbose=solver.verbose, eps_abs=solver.eps_abs,
+                         eps_rel=solver.eps_rel, max_iter=solver.max_iter, polish=solver.polish)
+        if x0 is not None or y0 is not None:
+            self._prob.warm_start(**_scaled_warm_start(x0, y0, None))
+        self._bound_rows = next((slice(b, e) for name, b, e in self.blocks if name == "bounds"), None)
+
+    def solve(self, *, q: Optional[Array] = None, l: Optional[Array] = None,
+              u: Optional[Array] = None) -> Solution:
+        qk = self.q if q is None else np.asarray(q, dtype=float)
+        lk = self.l if l is None else np.asarray(l, dtype=float)
+        uk = self.u if u is None else np.asarray(u, dtype=float)
+        self._prob.update(q=qk, l=lk, u=uk)
+        res = self._prob.solve()  # warm-started from the previous step
+        x, y = _primal_dual(res)
+        info = _osqp_info_to_struct(res.info)
+        status = str(info["status"]).lower() if info["status"] is not None else "unknown"
+        if x is None:
+            x = np.zeros_like(self.q)
+        if self._bound_rows is not None:
+            x = np.minimum(np.maximum(x, lk[self._bound_rows]), uk[self._bound_rows])
+        obj = float(info["obj_val"]) if info["obj_val"] is not None else np.nan
+        return Solution(x=x, obj=obj, status=status, info=info, y=y,
+                        active=_active_rows(self.A @ x, lk, uk), blocks=self.blocks)
@@ -0,0 +1,105 @@
+# qpfolio/solvers/miqp.py
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from qpfolio.core.cardinality import solve_restricted
+from qpfolio.core.types import Array, CardinalitySpec, Solution, SolverInfo
+
+
+@dataclass
+class BranchAndBoundCardinality:
+    """
+    Exact best-first branch-and-bound for :class:`CardinalitySpec`.
+
+    Each node fixes some names out (x_i = 0) and some in (x_i >= min_weight);
+    its relaxation drops the cardinality limit and the lot on free names,
+    which is a valid lower bound. A node is branched on the free name whose
+    relaxed weight violates the lot most, or on the smallest held free name
+    when too many names are held. Runs locally on any QP solver (defaults to
+    MathOptOSQP); worst-case cost is exponential, so use it for small
+    universes or with a good ``incumbent`` (e.g. from the heuristic).
+    """
+    solver: Optional[object] = None
+    max_nodes: int = 10000
+    tol: float = 1e-6
+
+    def solve(self, spec: CardinalitySpec, incumbent: Optional[Solution] = None) -> Solution:
+        solver = self.solver
+        if solver is None:
+            from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+            solver = MathOptOSQP()
+
+        base = spec.base
+        n = base.Q.shape[0]
+        lo = np.array([b[0] if b[0] is not None else 0.0 for b in base.bounds], dtype=float)
+        hi = np.array([b[1] if b[1] is not None else np.inf for b in base.bounds], dtype=float)
+        m, K, tol = spec.min_weight, spec.max_names, self.tol
+
+        def objective(x: Array) -> float:
+            return 0.5 * float(x @ (base.Q @ x)) + float(base.c @ x)
+
+        best_x, best_obj = None, np.inf
+        if incumbent is not None and incumbent.solved:
+            x_inc = np.asarray(incumbent.x, dtype=float)
+            held = x_inc[x_inc > tol]
+            if held.size <= K and np.all(held >= m - tol):
+                best_x, best_obj = x_inc, objective(x_inc)
+
+        def relax(out: frozenset, fixed_in: frozenset, x0: Optional[Array]):
+            keep = np.array([i for i in range(n) if i not in out and hi[i] > tol], dtype=np.int64)
+            if keep.size == 0:
+                return None
+            bounds = [(max(lo[i], m) if i in fixed_in else lo[i], hi[i]) for i in keep]
+            sol = solve_restricted(solver, base, keep, bounds, x0)
+            if not sol.solved:
+                return None
+            x = np.zeros(n)
+            x[keep] = sol.x
+            return x
+
+        counter = 0
+        nodes = 0
+        root = relax(frozenset(), frozenset(), None)
+        heap = [] if root is None else [(objective(root), counter, frozenset(), frozenset(), root)]
+        while heap and nodes < self.max_nodes:
+            bound, _, out, fixed_in, x = heapq.heappop(heap)
+            nodes += 1
+            if bound >= best_obj - tol * max(1.0, abs(best_obj)):
+                continue
+            held = np.flatnonzero(x > tol)
+            free_held = [i for i in held if i not in fixed_in]
+            lot_violations = [i for i in free_held if x[i] < m - tol]
+            if held.size <= K and not lot_violations:
+                best_x, best_obj = x, bound
+                continue
+            if len(fixed_in) >= K:
+                # Cannot add names: everything not fixed in must go.
+                children = [(frozenset(set(range(n)) - set(fixed_in)), fixed_in)]
+            else:
+                pool = lot_violations or free_held
+                j = min(pool, key=lambda i: x[i]) if not lot_violations else \
+                    max(pool, key=lambda i: min(x[i], m - x[i]))
+                children = [(out | {j}, fixed_in), (out, fixed_in | {j})]
+            for c_out, c_in in children:
+                xc = relax(c_out, c_in, x)
+                if xc is not None:
+                    counter += 1
+                    heapq.heappush(heap, (objective(xc), counter, c_out, c_in, xc))
+
+        complete = not heap
+        if best_x is None:
+            return Solution(x=np.zeros(n), obj=np.nan, status="infeasible",
+                            info=SolverInfo(status="infeasible", nodes=nodes))
+        status = "solved" if complete else "solved inaccurate"
+        return Solution(x=best_x, obj=best_obj, status=status,
+                        info=SolverInfo(status=status, nodes=nodes, optimal=complete))
+
+
+__all__ = [
+    "BranchAndBoundCardinality",
+]
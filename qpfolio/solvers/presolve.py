@@ -0,0 +1,149 @@
+# qpfolio/solvers/presolve.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from qpfolio.core.types import Array, ProblemSpec, Solution, SolverInfo
+
+
+def _row_blocks(problem: ProblemSpec) -> Optional[sp.csc_matrix]:
+    """Non-bound constraint rows in the solver's stacking order (sparse CSC)."""
+    if problem.A is not None:
+        return sp.csc_matrix(problem.A)
+    A_ineq = problem.A_ineq if problem.A_ineq is not None else problem.G
+    rows = [M for M in (problem.A_eq, A_ineq) if M is not None]
+    return sp.vstack([sp.csc_matrix(M) for M in rows], format="csc") if rows else None
+
+
+def _fixed_rows_dot(Q, rows: Array, x: Array) -> Array:
+    """``Q[rows, :] @ x`` without densifying a sparse Q."""
+    if sp.issparse(Q):
+        return np.asarray(Q.tocsr()[rows] @ x).ravel()
+    return np.asarray(Q)[rows] @ x
+
+
+@dataclass
+class Presolve:
+    """
+    Record of variables removed by :func:`presolve_fixed`, used to map a
+    reduced Solution back to the original problem.
+    """
+    problem: ProblemSpec
+    keep: Array     # indices of free variables
+    fixed: Array    # indices of fixed variables
+    x_fixed: Array  # their values
+    obj_shift: float
+
+    def reduce_x(self, x0: Optional[Array]) -> Optional[Array]:
+        return None if x0 is None else np.asarray(x0, dtype=float)[self.keep]
+
+    def reduce_y(self, y0: Optional[Array]) -> Optional[Array]:
+        if y0 is None:
+            return None
+        y0 = np.asarray(y0, dtype=float)
+        m_rows = y0.size - self.problem.Q.shape[0]
+        return np.concatenate([y0[:m_rows], y0[m_rows:][self.keep]])
+
+    def scatter(self, sol: Solution) -> Solution:
+        n = self.problem.Q.shape[0]
+        x = np.empty(n)
+        x[self.keep] = sol.x
+        x[self.fixed] = self.x_fixed
+
+        y = active = blocks = None
+        if sol.y is not None and sol.blocks is not None:
+            m_rows = sol.y.size - self.keep.size
+            y_rows = sol.y[:m_rows]
+            # Bound duals of fixed variables are their reduced costs:
+            # Q x + c + A_rows^T y_rows + y_bound = 0.
+            Q = self.problem.Q
+            grad = _fixed_rows_dot(Q, self.fixed, x)
+            if not self.problem.symmetric:
+                grad = 0.5 * (grad + _fixed_rows_dot(Q.T, self.fixed, x))
+            grad = grad + self.problem.c[self.fixed]
+            A_rows = _row_blocks(self.problem)
+            if A_rows is not None and m_rows:
+                grad = grad + A_rows[:, self.fixed].T @ y_rows
+            y_b = np.empty(n)
+            y_b[self.keep] = sol.y[m_rows:]
+            y_b[self.fixed] = -grad
+            y = np.concatenate([y_rows, y_b])
+            if sol.active is not None:
+                act_b = np.ones(n, dtype=bool)
+                act_b[self.keep] = sol.active[m_rows:]
+                active = np.concatenate([sol.active[:m_rows], act_b])
+            blocks = tuple(
+                (name, start, start + n) if name == "bounds" else (name, start, stop)
+                for name, start, stop in sol.blocks
+            )
+
+        info = sol.info
+        if info is not None:
+            info = SolverInfo(**{**dict(info), "presolve_fixed": int(self.fixed.size)})
+        return Solution(x=x, obj=sol.obj + self.obj_shift, status=sol.status, info=info,
+                        y=y, active=active, blocks=blocks)
+
+
+def presolve_fixed(problem: ProblemSpec, tol: float = 0.0) -> Tuple[ProblemSpec, Optional[Presolve]]:
+    """
+    Remove variables whose bounds fix them (lo == hi, e.g. exclusions and
+    zero caps) from Q, c and the constraint matrices.
+
+    Fixed values are moved into c (via Q's cross terms), the row bounds
+    l/u, b_eq and b_ineq, and a constant objective shift. Returns the reduced
+    problem and a :class:`Presolve` to scatter its solution back, or
+    ``(problem, None)`` when nothing (or everything) is fixed.
+    """
+    if problem.bounds is None:
+        return problem, None
+    n = problem.Q.shape[0]
+    lo = np.array([-np.inf if (b is None or b[0] is None) else float(b[0]) for b in problem.bounds])
+    hi = np.array([np.inf if (b is None or b[1] is None) else float(b[1]) for b in problem.bounds])
+    is_fixed = np.isfinite(lo) & (hi - lo <= tol)
+    if not is_fixed.any() or is_fixed.all():
+        return problem, None
+
+    fixed = np.flatnonzero(is_fixed)
+    keep = np.flatnonzero(~is_fixed)
+    x_f = lo[fixed]
+
+    Q = problem.Q.tocsr() if hasattr(problem.Q, "tocsr") else problem.Q
+    Q_kk = Q[keep][:, keep] if hasattr(Q, "tocsr") else Q[np.ix_(keep, keep)]
+    Q_kf = Q[keep][:, fixed] if hasattr(Q, "tocsr") else Q[np.ix_(keep, fixed)]
+    Q_fk = Q[fixed][:, keep] if hasattr(Q, "tocsr") else Q[np.ix_(fixed, keep)]
+    Q_ff = Q[fixed][:, fixed] if hasattr(Q, "tocsr") else Q[np.ix_(fixed, fixed)]
+    cross = Q_kf @ x_f if problem.symmetric else 0.5 * (Q_kf @ x_f + Q_fk.T @ x_f)
+    c_k = problem.c[keep] + np.asarray(cross).ravel()
+    obj_shift = 0.5 * float(x_f @ np.asarray(Q_ff @ x_f).ravel()) + float(problem.c[fixed] @ x_f)
+
+    def split(M, *rhs):
+        if M is None:
+            return (None,) + tuple(rhs)
+        shift = np.asarray(M[:, fixed] @ x_f).ravel()
+        return (M[:, keep],) + tuple(None if r is None else r - shift for r in rhs)
+
+    A, l, u = split(problem.A, problem.l, problem.u)
+    A_eq, b_eq = split(problem.A_eq, problem.b_eq)
+    A_ineq, b_ineq = split(problem.A_ineq, problem.b_ineq)
+    G, h = split(problem.G, problem.h)
+
+    reduced = ProblemSpec.trusted(
+        symmetric=problem.symmetric,
+        Q=Q_kk, c=c_k,
+        A=A, l=l, u=u,
+        bounds=[problem.bounds[i] for i in keep],
+        A_eq=A_eq, b_eq=b_eq,
+        A_ineq=A_ineq, b_ineq=b_ineq,
+        G=G, h=h,
+    )
+    return reduced, Presolve(problem=problem, keep=keep, fixed=fixed, x_fixed=x_f, obj_shift=obj_shift)
+
+
+__all__ = [
+    "Presolve",
+    "presolve_fixed",
+]
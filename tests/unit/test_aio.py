@@ -0,0 +1,70 @@
+# tests/unit/test_aio.py
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping async API test.")
+
+from qpfolio.aio import AsyncSolveExecutor, acompute_frontier, apersonal_index_batch, asolve
+from qpfolio.core.frontier import compute_frontier
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+MU = np.array([0.08, 0.10, 0.12])
+SIGMA = np.array([[0.04, 0.01, 0.00],
+                  [0.01, 0.05, 0.02],
+                  [0.00, 0.02, 0.06]])
+
+
+def test_async_variants_match_blocking_calls():
+    pool = AsyncSolveExecutor(max_workers=2)
+    solver = MathOptOSQP()
+    prob = build_mvo_problem(MU, SIGMA, r_target=0.10)
+
+    async def main():
+        sol = await asolve(solver, prob, executor=pool, timeout=10.0)
+        frontier = await acompute_frontier(MU, SIGMA, np.linspace(0.09, 0.11, 3), solver, executor=pool)
+        batch = await apersonal_index_batch(
+            [dict(Sigma=SIGMA, w_bench=np.full(3, 1 / 3), max_weight=0.5, exclude=[k]) for k in range(3)],
+            executor=pool,
+        )
+        return sol, frontier, batch
+
+    sol, frontier, batch = asyncio.run(main())
+    pool.shutdown()
+    np.testing.assert_allclose(sol.x, solver.solve(prob).x, atol=1e-8)
+    assert len(frontier) == 3
+    blocking = compute_frontier(MU, SIGMA, np.linspace(0.09, 0.11, 3), solver)
+    for (risk, ret, s), (risk_b, ret_b, s_b) in zip(frontier, blocking):
+        assert risk == pytest.approx(risk_b, abs=1e-8) and ret == pytest.approx(ret_b, abs=1e-8)
+        np.testing.assert_allclose(s.x, s_b.x, atol=1e-8)
+    assert [b.x[k] for k, b in enumerate(batch)] == [0.0, 0.0, 0.0]
+
+
+def test_backpressure_and_timeout():
+    pool = AsyncSolveExecutor(max_workers=2, max_pending=2)
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def job(delay):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(delay)
+        with lock:
+            running.pop()
+        return delay
+
+    async def main():
+        out = await asyncio.gather(*[pool.run(job, 0.02) for _ in range(6)])
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(job, 0.5, timeout=0.05)
+        return out
+
+    assert asyncio.run(main()) == [0.02] * 6
+    pool.shutdown()
+    assert max(peak) <= 2
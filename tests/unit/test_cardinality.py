@@ -0,0 +1,80 @@
+import itertools
+
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping cardinality test.")
+
+from qpfolio.core.cardinality import restrict_problem
+from qpfolio.core.types import ProblemSpec
+from qpfolio.personal_indexing import personal_index_optimizer, personal_index_optimizer_cardinality
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+from qpfolio.solvers.miqp import BranchAndBoundCardinality
+
+
+def _cov(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    B = rng.normal(size=(n, 3)) * 0.15
+    return B @ B.T + np.diag(rng.uniform(0.01, 0.05, n))
+
+
+def test_heuristic_respects_cardinality_and_lots():
+    n = 20
+    Sigma = _cov(n)
+    w_bench = np.ones(n) / n
+    sol = personal_index_optimizer_cardinality(Sigma, w_bench, max_names=6, min_weight=0.1, max_weight=0.4)
+    held = sol.x[sol.x > 1e-6]
+    assert sol.status.startswith("solved")
+    assert held.size <= 6
+    assert (held >= 0.1 - 1e-6).all()
+    assert np.isclose(sol.x.sum(), 1.0, atol=1e-5)
+
+
+def test_branch_and_bound_matches_enumeration():
+    n, K = 7, 3
+    Sigma = _cov(n, seed=3)
+    w_bench = np.ones(n) / n
+    sol = personal_index_optimizer_cardinality(
+        Sigma, w_bench, max_names=K, max_weight=0.6, exact=BranchAndBoundCardinality()
+    )
+    assert sol.info["optimal"]
+
+    # brute force over all supports of size K
+    full = personal_index_optimizer(Sigma, w_bench, max_weight=0.6)
+    best = np.inf
+    spec = ProblemSpec(Q=Sigma, c=-Sigma @ w_bench, A=np.ones((1, n)), l=np.ones(1), u=np.ones(1),
+                       bounds=[(0.0, 0.6)] * n)
+    for S in itertools.combinations(range(n), K):
+        sub = MathOptOSQP().solve(restrict_problem(spec, np.array(S)))
+        if sub.status.startswith("solved"):
+            best = min(best, sub.obj)
+    assert sol.obj == pytest.approx(best, abs=1e-6)
+    assert sol.obj >= full.obj - 1e-8
+
+
+def test_heuristic_marks_failed_resolve_infeasible_within_limits():
+    from qpfolio.core.cardinality import solve_cardinality_heuristic
+    from qpfolio.core.types import CardinalitySpec, Solution
+
+    class FailsAfterFirst:
+        def __init__(self):
+            self.calls = 0
+
+        def solve(self, problem):
+            self.calls += 1
+            sol = MathOptOSQP().solve(problem)
+            if self.calls > 1:
+                return Solution(x=sol.x, obj=sol.obj, status="maximum iterations reached")
+            return sol
+
+    n = 20
+    Sigma = _cov(n)
+    w_bench = np.ones(n) / n
+    base = ProblemSpec(Q=Sigma, c=-Sigma @ w_bench, A=np.ones((1, n)), l=np.ones(1), u=np.ones(1),
+                       bounds=[(0.0, 0.4)] * n)
+    sol = solve_cardinality_heuristic(CardinalitySpec(base, max_names=6, min_weight=0.04), FailsAfterFirst())
+    assert sol.status == "infeasible" and not sol.solved
+    assert sol.info["inner_status"] == "maximum iterations reached"
+    held = np.flatnonzero(sol.x > 1e-6)
+    assert 0 < held.size <= 6 and (sol.x[held] >= 0.04 - 1e-6).all()
+    np.testing.assert_array_equal(held, sol.info["support"])
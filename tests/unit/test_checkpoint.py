@@ -0,0 +1,93 @@
+# tests/unit/test_checkpoint.py
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping checkpoint test.")
+
+from qpfolio.checkpoint import CheckpointedSolver, CheckpointStore, problem_fingerprint
+from qpfolio.core.frontier import compute_frontier
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+MU = np.array([0.08, 0.10, 0.12])
+SIGMA = np.array([[0.04, 0.01, 0.00],
+                  [0.01, 0.05, 0.02],
+                  [0.00, 0.02, 0.06]])
+
+
+class _Counting:
+    def __init__(self):
+        self.inner = MathOptOSQP()
+        self.calls = []
+
+    def solve(self, problem, *, x0=None, y0=None):
+        self.calls.append(x0 is not None)
+        return self.inner.solve(problem, x0=x0, y0=y0)
+
+
+def test_fingerprint_tracks_data():
+    a = build_mvo_problem(MU, SIGMA, r_target=0.10)
+    assert problem_fingerprint(a) == problem_fingerprint(build_mvo_problem(MU, SIGMA, r_target=0.10))
+    assert problem_fingerprint(a) != problem_fingerprint(build_mvo_problem(MU, SIGMA, r_target=0.11))
+
+
+def test_rerun_skips_finished_solves_and_warm_starts(tmp_path):
+    targets = np.linspace(0.09, 0.11, 4)
+    first = _Counting()
+    pts1 = compute_frontier(MU, SIGMA, targets, CheckpointedSolver(first, CheckpointStore(tmp_path)),
+                            interpolate=False)
+    # Every solve after the first is warm-started from the stored neighbour.
+    assert first.calls == [False, True, True, True]
+
+    second = _Counting()
+    pts2 = compute_frontier(MU, SIGMA, targets, CheckpointedSolver(second, CheckpointStore(tmp_path)),
+                            interpolate=False)
+    assert second.calls == []
+    for (r1, m1, s1), (r2, m2, s2) in zip(pts1, pts2):
+        np.testing.assert_array_equal(s1.x, s2.x)
+        assert s2.blocks == s1.blocks and s2.info["iter"] == s1.info["iter"]
+
+
+def test_solver_settings_are_part_of_the_key(tmp_path):
+    from qpfolio.checkpoint import checkpoint_key, solver_fingerprint
+    from qpfolio.solvers.mathopt_osqp import TolerancePolicy
+
+    prob = build_mvo_problem(MU, SIGMA, r_target=0.10)
+    assert solver_fingerprint(MathOptOSQP()) == solver_fingerprint(MathOptOSQP())
+    for other in (MathOptOSQP(eps_abs=1e-4), MathOptOSQP(max_iter=10), MathOptOSQP(precondition=True),
+                  MathOptOSQP(policy=TolerancePolicy())):
+        assert checkpoint_key(prob, other) != checkpoint_key(prob, MathOptOSQP())
+
+    store = CheckpointStore(tmp_path)
+    assert CheckpointedSolver(MathOptOSQP(eps_abs=1e-3, eps_rel=1e-3), store).solve(prob).solved
+    counting = _Counting()
+    CheckpointedSolver(counting, store).solve(prob)
+    assert len(counting.calls) == 1  # not served from the loose-tolerance entry
+
+
+def test_large_shared_arrays_are_hashed_once(monkeypatch, tmp_path):
+    import scipy.sparse as sp
+
+    import qpfolio.checkpoint as ckpt
+
+    n = 80
+    rng = np.random.default_rng(0)
+    B = rng.normal(size=(n, n))
+    Sigma = B @ B.T / n + np.eye(n)
+    mu = rng.uniform(0.02, 0.1, n)
+    hashed = []
+    digest = ckpt._digest
+    monkeypatch.setattr(ckpt, "_digest", lambda v: hashed.append(np.size(v)) or digest(v))
+    keys = {problem_fingerprint(build_mvo_problem(mu, Sigma, r_target=t, trusted=True)) for t in (0.04, 0.05, 0.06)}
+    assert len(keys) == 3
+    assert hashed.count(n * n) == 1  # Sigma, shared by all three problems
+
+    # Sparse structure is hashed through its integer index arrays.
+    top = sp.csc_matrix((np.ones(1), np.array([0], dtype=np.int32), np.array([0, 1], dtype=np.int32)), shape=(2, 1))
+    bottom = sp.csc_matrix((np.ones(1), np.array([1], dtype=np.int32), np.array([0, 1], dtype=np.int32)), shape=(2, 1))
+    assert ckpt._digest(top) != ckpt._digest(bottom)
+
+    # A caller-supplied key bypasses fingerprinting.
+    solver = CheckpointedSolver(MathOptOSQP(), CheckpointStore(tmp_path))
+    sol = solver.solve(build_mvo_problem(MU, SIGMA, r_target=0.10), key="frontier-0")
+    assert "frontier-0" in solver.store and sol.solved
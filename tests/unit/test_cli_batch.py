@@ -0,0 +1,107 @@
+# tests/unit/test_cli_batch.py
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping CLI batch test.")
+
+from qpfolio.cli import main
+
+
+@pytest.fixture
+def returns_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal([0.0004, 0.0005, 0.0006, 0.0003], 0.01, size=(500, 4))
+    df = pd.DataFrame(X, columns=["AAA", "BBB", "CCC", "DDD"])
+    df.to_csv(tmp_path / "returns.csv")
+    return tmp_path
+
+
+def test_solve_mvo_streams_csv(returns_csv):
+    cfg = {
+        "returns": "returns.csv",
+        "freq": 252,
+        "model": "mvo",
+        "targets": {"start": 0.09, "stop": 0.13, "num": 5},
+        "workers": 2,
+        "output": "out.csv",
+    }
+    (returns_csv / "job.json").write_text(json.dumps(cfg))
+    assert main(["solve", "--config", str(returns_csv / "job.json")]) == 0
+
+    out = pd.read_csv(returns_csv / "out.csv")
+    assert len(out) == 5
+    assert list(out.columns[-4:]) == ["AAA", "BBB", "CCC", "DDD"]
+    ok = out[out["status"].str.startswith("solved")]
+    np.testing.assert_allclose(ok[["AAA", "BBB", "CCC", "DDD"]].sum(axis=1), 1.0, atol=1e-6)
+    np.testing.assert_allclose(ok["ret"], ok["target"], atol=1e-6)
+
+
+def test_solve_personal_index_jsonl(returns_csv):
+    cfg = {
+        "returns": "returns.csv",
+        "model": "personal_index",
+        "accounts": [{"id": "a", "max_weight": 0.5}, {"id": "b", "max_weight": 0.5, "exclude": ["BBB"]}],
+    }
+    (returns_csv / "job.json").write_text(json.dumps(cfg))
+    main(["solve", "--config", str(returns_csv / "job.json"), "--output", str(returns_csv / "out.jsonl")])
+
+    recs = {r["job"]: r for r in map(json.loads, (returns_csv / "out.jsonl").read_text().splitlines())}
+    assert set(recs) == {"a", "b"}
+    assert recs["b"]["BBB"] == 0.0
+    assert recs["a"]["BBB"] > 0.0
+
+
+def test_checkpointed_rerun_reproduces_output(returns_csv):
+    cfg = {"returns": "returns.csv", "freq": 252, "model": "mvo", "targets": [0.10, 0.11], "output": "out.jsonl"}
+    (returns_csv / "job.json").write_text(json.dumps(cfg))
+    args = ["solve", "--config", str(returns_csv / "job.json"), "--checkpoint", str(returns_csv / "ckpt")]
+    main(args)
+    first = (returns_csv / "out.jsonl").read_text()
+    assert len(list((returns_csv / "ckpt").glob("*.npz"))) == 3  # two problems + one warm start
+    main(args)
+    assert sorted(first.splitlines()) == sorted((returns_csv / "out.jsonl").read_text().splitlines())
+
+
+def test_memmapped_panel_and_mdp_normalization(returns_csv):
+    from qpfolio.batch import _normalized, build_jobs
+    from qpfolio.core.estimates import sample_mean_cov
+    from qpfolio.core.types import ProblemSpec, Solution
+
+    X = pd.read_csv(returns_csv / "returns.csv", index_col=0).to_numpy()
+    np.save(returns_csv / "returns.npy", X)
+    jobs, labels, mu, Sigma = build_jobs({"returns": "returns.npy", "freq": 252, "model": "mdp",
+                                          "chunk_size": 64, "base_dir": str(returns_csv)})
+    mu_ref, Sigma_ref = sample_mean_cov(X, freq=252)
+    np.testing.assert_allclose(mu, mu_ref, atol=1e-12)
+    np.testing.assert_allclose(Sigma, Sigma_ref, atol=1e-12)
+    sol = jobs[0].run()
+    assert np.sum(sol.x) == pytest.approx(1.0)
+    assert sol.obj == pytest.approx(0.5 * sol.x @ Sigma @ sol.x)
+
+    raw = Solution(x=np.array([2.0, 2.0]), obj=4.0, status="solved")
+    prob = ProblemSpec(Q=np.eye(2), c=np.zeros(2))
+    norm = _normalized(raw, prob)
+    assert np.array_equal(norm.x, [0.5, 0.5]) and np.array_equal(raw.x, [2.0, 2.0])
+    assert norm.obj == pytest.approx(0.25) and raw.obj == 4.0
+
+
+def test_parquet_schema_survives_failed_first_batch(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    from qpfolio.batch import Job, open_writer, record_columns, record_schema
+
+    jobs = [Job("j0", None, {"target": 0.1}), Job("j1", None, {"target": 0.2})]
+    labels = ["A", "B"]
+    w = open_writer(tmp_path / "out.parquet", columns=record_columns(jobs, labels),
+                    schema=record_schema(jobs, labels))
+    w._batch_size = 1
+    w.write({"job": "j0", "status": "error: boom", "target": 0.1})
+    w.write({"job": "j1", "status": "solved", "obj": 0.5, "ret": 0.1, "risk": 0.2, "iter": 25,
+             "solve_time": 0.01, "target": 0.2, "A": 0.4, "B": 0.6})
+    w.close()
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert table.num_rows == 2 and str(table.schema.field("A").type) == "double"
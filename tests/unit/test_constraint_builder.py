@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping constraint builder test.")
+
+from qpfolio.core.constraints import ConstraintBuilder
+from qpfolio.core.types import ProblemSpec
+from qpfolio.personal_indexing import personal_index_optimizer_esg
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+def test_group_caps_are_sparse_rows_and_respected():
+    n = 6
+    sectors = ["Tech", "Tech", "Tech", "Energy", "Energy", "Health"]
+    mu_tilt = np.array([-1.0, -1.0, -1.0, 0.0, 0.0, 0.0])  # pull toward Tech
+
+    cb = ConstraintBuilder(n).add_budget().add_group_limits(sectors, upper={"Tech": 0.4})
+    A, l, u = cb.build()
+    assert sp.issparse(A) and A.shape == (2, n)
+    assert cb.build()[0] is A  # assembled once
+
+    spec = ProblemSpec(Q=np.eye(n) * 0.1, c=mu_tilt * 0.1, A=A, l=l, u=u, bounds=[(0.0, 1.0)] * n)
+    w = MathOptOSQP().solve(spec).x
+    assert w[:3].sum() <= 0.4 + 1e-6
+    assert np.isclose(w.sum(), 1.0, atol=1e-6)
+
+    cb.set_limits("groups", upper=0.2)
+    A2, _, u2 = cb.build()
+    assert A2 is A and u2[1] == 0.2
+
+
+def test_esg_exposure_band_keeps_q_sparse():
+    n = 8
+    Sigma = np.diag(np.linspace(0.02, 0.09, n))
+    w_bench = np.ones(n) / n
+    E = np.zeros((1, n))
+    E[0, 0] = 1.0
+
+    sol = personal_index_optimizer_esg(
+        Sigma, w_bench, exposure_matrix=E, exposure_targets=np.array([0.0]),
+        exposure_band=0.01, max_weight=0.5,
+    )
+    assert sol.x[0] <= 0.01 + 1e-6
+    assert np.isclose(sol.x.sum(), 1.0, atol=5e-6)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping CVaR test.")
+
+from qpfolio.core.models import build_cvar_problem
+from qpfolio.core.scenarios import reduce_scenarios, scenarios_from_paths
+from qpfolio.simulation.gbm import simulate_gbm_paths
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+def _cvar(losses, beta):
+    var = np.quantile(losses, beta)
+    return var + np.mean(np.maximum(losses - var, 0.0)) / (1.0 - beta)
+
+
+def _scenarios(S=400, n=5):
+    paths = simulate_gbm_paths(np.linspace(0.02, 0.12, n), np.linspace(0.05, 0.4, n),
+                               s0=np.full(n, 100.0), T=0.25, steps_per_year=52, n_paths=S, seed=3)
+    return scenarios_from_paths(paths)
+
+
+def test_cvar_problem_matches_lp_and_empirical_cvar():
+    from scipy.optimize import linprog
+
+    R = _scenarios()
+    S, n = R.shape
+    beta = 0.9
+    prob = build_cvar_problem(R, beta=beta, r_target=0.01)
+    assert sp.issparse(prob.A) and prob.A.nnz == R.size + 2 * S + 2 * n
+    sol = MathOptOSQP(eps_abs=1e-6, eps_rel=1e-6).solve(prob)
+    w = sol.x[:n]
+    assert np.isclose(w.sum(), 1.0, atol=1e-5) and np.all(w >= -1e-6)
+    assert R.mean(axis=0) @ w >= 0.01 - 1e-5
+
+    bounds = [(b[0], b[1]) for b in prob.bounds]
+    ineq = np.isinf(prob.l)
+    eq = prob.l == prob.u
+    A = prob.A.toarray()
+    ge = ~ineq & ~eq
+    ref = linprog(prob.c, A_ub=np.vstack([A[ineq], -A[ge]]), b_ub=np.concatenate([prob.u[ineq], -prob.l[ge]]),
+                  A_eq=A[eq], b_eq=prob.u[eq], bounds=bounds, method="highs")
+    assert np.isclose(sol.obj, ref.fun, rtol=1e-3, atol=1e-5)
+    assert np.isclose(sol.obj, _cvar(-R @ w, beta), rtol=2e-2)
+
+
+def test_reduce_scenarios_kmeans_keeps_mean_and_mass():
+    R = _scenarios(S=2000)
+    Rk, pk = reduce_scenarios(R, 50, seed=0)
+    assert Rk.shape[0] <= 50 and np.isclose(pk.sum(), 1.0)
+    np.testing.assert_allclose(pk @ Rk, R.mean(axis=0), atol=1e-12)
+
+
+def test_reduce_scenarios_importance_keeps_sparse_rows_and_tail():
+    rng = np.random.default_rng(0)
+    R = sp.random(5000, 20, density=0.1, format="csr", random_state=1,
+                  data_rvs=lambda k: rng.normal(0.0, 0.1, size=k))
+    Rk, pk = reduce_scenarios(R, 300, method="importance", beta=0.95, seed=0)
+    assert sp.issparse(Rk) and Rk.shape[0] <= 300 and np.isclose(pk.sum(), 1.0)
+    loss, loss_k = -R.mean(axis=1).A.ravel(), -Rk.mean(axis=1).A.ravel()
+    # Tail scenarios are over-represented in count but carry their true mass.
+    tail = np.quantile(loss, 0.95)
+    assert np.mean(loss_k >= tail) > 0.3
+    assert abs(pk[loss_k >= tail].sum() - 0.05) < 0.03
+    prob = build_cvar_problem(Rk, probabilities=pk)
+    assert prob.A.shape == (Rk.shape[0] + 1, 20 + 1 + Rk.shape[0])
+    np.testing.assert_array_equal(prob.A[:Rk.shape[0], :20].toarray(), Rk.toarray())
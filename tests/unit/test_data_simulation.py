@@ -8,3 +8,33 @@ def test_simulation_is_deterministic_with_seed():
     assert np.allclose(R1, R2)
     assert np.allclose(mu1, mu2)
     assert np.allclose(S1, S2)
+
+
+def test_mvn_returns_identical_across_shards_and_workers():
+    from qpfolio.core.data import STREAM_BLOCK
+
+    n = 3 * STREAM_BLOCK + 17
+    R, mu, S = simulate_mvn_returns(4, n, seed=7)
+    R4, _, _ = simulate_mvn_returns(4, n, seed=7, workers=4)
+    assert np.array_equal(R, R4)
+    cuts = [0, 5, STREAM_BLOCK + 3, 2 * STREAM_BLOCK, n]
+    shards = [simulate_mvn_returns(4, b - a, seed=7, start=a)[0] for a, b in zip(cuts[:-1], cuts[1:])]
+    assert np.array_equal(np.concatenate(shards), R)
+    # Sample moments still match the generating parameters.
+    np.testing.assert_allclose(np.cov(R, rowvar=False) * 252, S, atol=5e-3)
+
+
+def test_gbm_paths_identical_across_shards_and_workers():
+    from qpfolio.simulation.gbm import simulate_gbm_paths
+
+    kw = dict(mus=np.array([0.05, 0.1]), sigmas=np.array([0.1, 0.3]), s0=np.array([100.0, 50.0]),
+              T=0.5, seed=11)
+    full = simulate_gbm_paths(n_paths=10, **kw)
+    par = simulate_gbm_paths(n_paths=10, workers=3, **kw)
+    shard = simulate_gbm_paths(n_paths=4, start=6, **kw)
+    assert sorted(shard) == [6, 7, 8, 9]
+    for p in range(10):
+        assert np.array_equal(full[p].to_numpy(), par[p].to_numpy())
+    for p in shard:
+        assert np.array_equal(full[p].to_numpy(), shard[p].to_numpy())
+    assert not np.array_equal(full[0].to_numpy(), full[1].to_numpy())
@@ -9,3 +9,32 @@ def test_sample_mean_cov_shapes_and_scaling():
     assert mu.shape == (4,)
     assert Sigma.shape == (4, 4)
     assert np.allclose(np.diag(Sigma) > 0, True)
+
+
+def test_factor_model_matches_sample_covariance_from_memmap(tmp_path):
+    from qpfolio.core.estimates import factor_model_from_returns
+
+    rng = np.random.default_rng(1)
+    T, N, k = 300, 800, 3
+    loadings = rng.normal(size=(N, k))
+    x = rng.normal(size=(T, k)) @ loadings.T * 0.01 + rng.normal(0, 0.002, size=(T, N))
+    np.save(tmp_path / "panel.npy", x)
+    panel = np.load(tmp_path / "panel.npy", mmap_mode="r")
+
+    fm = factor_model_from_returns(panel, k, chunk_size=64, seed=0)
+    mu, Sigma = sample_mean_cov(x)
+    assert fm.B.shape == (N, k) and fm.F.shape == (k, k)
+    np.testing.assert_allclose(fm.mu, mu, atol=1e-12)
+    approx = fm.covariance()
+    np.testing.assert_allclose(np.diag(approx), np.diag(Sigma), rtol=1e-8)
+    assert np.linalg.norm(approx - Sigma) / np.linalg.norm(Sigma) < 0.05
+    v = rng.normal(size=N)
+    np.testing.assert_allclose(fm.matvec(v), approx @ v, rtol=1e-10, atol=1e-14)
+
+
+def test_sample_mean_cov_chunked_matches_in_memory():
+    x = np.random.default_rng(1).normal(0.001, 0.01, size=(1000, 6))
+    mu, Sigma = sample_mean_cov(x, freq=252)
+    mu_c, Sigma_c = sample_mean_cov(x, freq=252, chunk_size=77)
+    np.testing.assert_allclose(mu_c, mu, atol=1e-14)
+    np.testing.assert_allclose(Sigma_c, Sigma, atol=1e-14)
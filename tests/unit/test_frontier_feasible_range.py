@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from qpfolio.core.frontier import compute_frontier, feasible_return_range
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+def test_feasible_return_range_box_bounds():
+    mu = np.array([0.05, 0.10, 0.20])
+    assert feasible_return_range(mu) == pytest.approx((0.05, 0.20))
+    # caps of 0.5 force splitting across the two best / two worst assets
+    assert feasible_return_range(mu, 0.0, 0.5) == pytest.approx((0.075, 0.15))
+    with pytest.raises(ValueError):
+        feasible_return_range(mu, 0.0, 0.3)
+
+
+def test_frontier_screens_infeasible_targets_before_solving():
+    class NoSolveAbove:
+        def __init__(self):
+            self.inner = MathOptOSQP()
+
+        def solve(self, problem):
+            assert -problem.b_ineq[0] <= mu.max() + 1e-12
+            return self.inner.solve(problem)
+
+    mu = np.array([0.08, 0.10, 0.12])
+    Sigma = np.diag([0.04, 0.05, 0.06])
+    targets = [0.09, 0.11, 0.13, 0.15]
+
+    assert len(compute_frontier(mu, Sigma, targets, solver=NoSolveAbove())) == 2
+    clipped = compute_frontier(mu, Sigma, targets, solver=NoSolveAbove(), infeasible="clip")
+    assert len(clipped) == 4
+    assert max(ret for (_, ret, _) in clipped) == pytest.approx(0.12, abs=1e-6)
+    with pytest.raises(ValueError):
+        compute_frontier(mu, Sigma, targets, solver=NoSolveAbove(), infeasible="raise")
@@ -0,0 +1,31 @@
+import numpy as np
+
+from qpfolio.core.data import simulate_mvn_returns
+from qpfolio.core.frontier import compute_frontier
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+class _CountingSolver:
+    def __init__(self):
+        self.inner = MathOptOSQP()
+        self.calls = 0
+
+    def solve(self, problem):
+        self.calls += 1
+        return self.inner.solve(problem)
+
+
+def test_interpolated_frontier_matches_per_target_solves():
+    _, mu, Sigma = simulate_mvn_returns(6, 10, seed=3)
+    targets = np.linspace(mu.min(), mu.max(), 60)
+
+    counting = _CountingSolver()
+    fast = compute_frontier(mu, Sigma, targets, solver=counting)
+    exact = compute_frontier(mu, Sigma, targets, solver=MathOptOSQP(), interpolate=False)
+
+    assert len(fast) == len(exact) == len(targets)
+    assert counting.calls < len(targets)
+    assert any(sol.info.get("interpolated") for (_, _, sol) in fast)
+    for (r1, m1, s1), (r2, m2, s2) in zip(fast, exact):
+        np.testing.assert_allclose(s1.x, s2.x, atol=1e-5)
+        assert abs(r1 - r2) < 1e-6 and abs(m1 - m2) < 1e-6
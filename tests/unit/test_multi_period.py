@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping multi-period test.")
+
+from qpfolio.core.models import build_multi_period_problem, multi_period_weights
+from qpfolio.core.types import ProblemSpec
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+def _inputs(T=4, n=5, seed=0):
+    rng = np.random.default_rng(seed)
+    mus, Sigmas = [], []
+    for _ in range(T):
+        B = rng.normal(size=(n, n)) * 0.1
+        Sigmas.append(B @ B.T + 0.01 * np.eye(n))
+        mus.append(rng.normal(0.05, 0.03, size=n))
+    return mus, Sigmas, np.full(n, 1.0 / n)
+
+
+def test_structure_is_block_banded():
+    mus, Sigmas, w0 = _inputs(T=6)
+    n = w0.size
+    prob = build_multi_period_problem(mus, Sigmas, w0, buy_cost=0.01, sell_cost=0.01, turnover_budget=0.2)
+    assert prob.Q.shape == (18 * n, 18 * n)
+    rows, cols = prob.A.nonzero()
+    m = prob.A.shape[0] // 6
+    # Row block t only touches the variables of periods t - 1 and t.
+    assert np.all(cols // (3 * n) - rows // m <= 0)
+    assert np.all(rows // m - cols // (3 * n) <= 1)
+    qr, qc = prob.Q.nonzero()
+    assert np.all(qr // (3 * n) == qc // (3 * n))
+
+
+def test_zero_cost_decouples_into_single_periods():
+    mus, Sigmas, w0 = _inputs()
+    n = w0.size
+    solver = MathOptOSQP()
+    W = multi_period_weights(solver.solve(build_multi_period_problem(mus, Sigmas, w0, risk_aversion=4.0)).x, n)
+    for t, (mu, S) in enumerate(zip(mus, Sigmas)):
+        single = ProblemSpec(Q=4.0 * S, c=-mu, A_eq=np.ones((1, n)), b_eq=np.array([1.0]),
+                             bounds=[(0.0, 1.0)] * n)
+        np.testing.assert_allclose(W[t], solver.solve(single).x, atol=1e-5)
+
+
+def test_costs_and_turnover_link_consecutive_periods():
+    mus, Sigmas, w0 = _inputs()
+    solver = MathOptOSQP()
+    frozen = solver.solve(build_multi_period_problem(mus, Sigmas, w0, buy_cost=10.0, sell_cost=10.0))
+    np.testing.assert_allclose(multi_period_weights(frozen.x, w0.size), np.tile(w0, (4, 1)), atol=1e-5)
+
+    capped = solver.solve(build_multi_period_problem(mus, Sigmas, w0, risk_aversion=0.5, turnover_budget=0.1))
+    W = np.vstack([w0, multi_period_weights(capped.x, w0.size)])
+    assert np.all(np.abs(np.diff(W, axis=0)).sum(axis=1) <= 0.1 + 1e-5)
+    assert np.allclose(W.sum(axis=1), 1.0, atol=1e-6)
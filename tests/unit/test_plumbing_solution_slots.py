@@ -0,0 +1,49 @@
+# tests/unit/test_plumbing_solution_slots.py
+import pickle
+import types
+
+import numpy as np
+import pytest
+
+from qpfolio.core.types import Solution, SolverInfo
+from qpfolio.solvers.mathopt_osqp import _osqp_info_to_struct
+
+
+def test_solution_has_no_instance_dict():
+    sol = Solution(x=np.zeros(2), obj=0.0, status="solved")
+    assert not hasattr(sol, "__dict__")
+    assert sol.obj_value == 0.0
+    assert sol.info is None
+
+
+def test_solution_keeps_dataclass_api():
+    import dataclasses
+
+    sol = Solution(x=np.zeros(2), obj=0.0, status="solved")
+    assert dataclasses.is_dataclass(sol)
+    assert [f.name for f in dataclasses.fields(sol)][:4] == ["x", "obj", "status", "info"]
+    assert dataclasses.replace(sol, obj=1.0).obj == 1.0
+    assert dataclasses.asdict(sol)["status"] == "solved"
+    assert Solution(x=np.zeros(1), obj=0.0, status="solved") == Solution(x=np.zeros(1), obj=0.0, status="solved")
+
+
+def test_solver_info_struct_behaves_like_mapping():
+    info_ns = types.SimpleNamespace(
+        status="solved", iter=7, obj_val=1.5, prim_res=1e-6, dual_res=2e-6, rho_estimate=0.1,
+    )
+    info = _osqp_info_to_struct(info_ns)
+    assert not hasattr(info, "__dict__")
+    assert info["iter"] == 7
+    assert info["pri_res"] == 1e-6 and info["dua_res"] == 2e-6
+    assert info.get("rho") == 0.1
+    assert info["setup_time"] is None
+    with pytest.raises(KeyError):
+        info["nope"]
+    with pytest.raises(AttributeError):
+        info.iter = 3
+
+    extra = SolverInfo(status="solved", passes=2)
+    assert extra["passes"] == 2 and "passes" in dict(extra)
+
+    back = pickle.loads(pickle.dumps(Solution(x=np.ones(2), obj=1.0, status="solved", info=extra)))
+    assert dict(back.info) == dict(extra)
@@ -1,6 +1,6 @@
 # tests/unit/test_plumbing_solver_info_schema.py
 import types
-from qpfolio.solvers.mathopt_osqp import _osqp_info_to_dict
+from qpfolio.solvers.mathopt_osqp import _osqp_info_to_struct
 
 def test_solver_info_schema_tolerance():
     # Simulate two OSQP versions:
@@ -15,7 +15,7 @@ def test_solver_info_schema_tolerance():
         setup_time=0.001,
         solve_time=0.002,
     )
-    dA = _osqp_info_to_dict(info_vA)
+    dA = _osqp_info_to_struct(info_vA)
     assert "pri_res" in dA and "dua_res" in dA
     assert dA["pri_res"] == 1e-6 and dA["dua_res"] == 2e-6
 
@@ -28,12 +28,13 @@ def test_solver_info_schema_tolerance():
         pri_res_norm=3e-6,
         dua_res_norm=4e-6,
     )
-    dB = _osqp_info_to_dict(info_vB)
+    dB = _osqp_info_to_struct(info_vB)
     assert "pri_res" in dB and "dua_res" in dB
     assert dB["pri_res"] == 3e-6 and dB["dua_res"] == 4e-6
 
     # vC: minimal info
     info_vC = types.SimpleNamespace(status="solved")
-    dC = _osqp_info_to_dict(info_vC)
+    dC = _osqp_info_to_struct(info_vC)
     # Fields exist but may be None
     assert "pri_res" in dC and "dua_res" in dC
+    assert dC["pri_res"] is None and dC["iter"] is None
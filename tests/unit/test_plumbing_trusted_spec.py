@@ -0,0 +1,56 @@
+# tests/unit/test_plumbing_trusted_spec.py
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping trusted spec test.")
+
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.core.types import ProblemSpec
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+
+def test_trusted_builder_is_zero_copy_and_matches_validated():
+    mu = np.array([0.08, 0.10, 0.12])
+    Sigma = np.array([[0.04, 0.01, 0.00],
+                      [0.01, 0.05, 0.02],
+                      [0.00, 0.02, 0.06]])
+
+    fast = build_mvo_problem(mu, Sigma, r_target=0.10, trusted=True)
+    slow = build_mvo_problem(mu, Sigma, r_target=0.10)
+    assert fast.Q is Sigma and fast.symmetric
+    assert slow.Q is not Sigma and not slow.symmetric
+
+    solver = MathOptOSQP()
+    np.testing.assert_allclose(solver.solve(fast).x, solver.solve(slow).x, atol=1e-6)
+
+
+def test_trusted_skips_validation():
+    # Mis-shaped c would be rejected by __post_init__; trusted() does not check.
+    spec = ProblemSpec.trusted(Q=np.eye(2), c=np.zeros(3))
+    assert spec.c.shape == (3,)
+    with pytest.raises(ValueError):
+        ProblemSpec(Q=np.eye(2), c=np.zeros(3))
+    with pytest.raises(TypeError):
+        ProblemSpec.trusted(Q=np.eye(2), c=np.zeros(2), bogus=1)
+    with pytest.raises(TypeError, match="'c'"):
+        ProblemSpec.trusted(Q=np.eye(2))
+
+
+def test_dense_objective_to_upper_csc_without_dense_copy():
+    import tracemalloc
+
+    import scipy.sparse as sp
+
+    from qpfolio.solvers.mathopt_osqp import _objective_to_csc
+
+    n = 600
+    B = np.random.default_rng(0).normal(size=(n, n))
+    Q = B @ B.T
+    tracemalloc.start()
+    P = _objective_to_csc(Q, symmetric=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert (P != sp.csc_matrix(np.triu(Q))).nnz == 0
+    # Only the result is allocated: no dense triu(Q) temporary (8 n^2 bytes).
+    out = P.data.nbytes + P.indices.nbytes + P.indptr.nbytes
+    assert peak < out + 0.5 * Q.nbytes
@@ -0,0 +1,77 @@
+# tests/unit/test_reporting_artifacts.py
+import numpy as np
+import pytest
+
+from qpfolio.core.types import Solution, SolverInfo
+from qpfolio.reporting.artifacts import (
+    ArtifactLog,
+    load_frontier,
+    load_solution,
+    open_log,
+    save_frontier,
+    save_solution,
+)
+
+
+def _sol(k, n=4):
+    x = np.full(n, 1.0 / n) + 0.01 * k * np.arange(n)
+    return Solution(x=x, obj=0.1 * k, status="solved", info=SolverInfo(iter=10 + k, rho=0.1),
+                    y=np.arange(3.0), active=np.array([True, False, True]),
+                    blocks=(("eq", 0, 1), ("bounds", 1, 3)))
+
+
+def test_frontier_and_solution_roundtrip(tmp_path):
+    points = [(0.1 + k, 0.05 + k, _sol(k)) for k in range(3)]
+    save_frontier(tmp_path / "f.npz", points, labels=list("ABCD"), meta={"run": "nightly"})
+    art = load_frontier(tmp_path / "f.npz")
+    assert art.weights.shape == (3, 4) and art.labels == list("ABCD")
+    assert art.provenance["run"] == "nightly" and "qpfolio" in art.provenance
+    back = art.to_points()
+    np.testing.assert_array_equal(back[2][2].x, points[2][2].x)
+    assert back[1][2].info["iter"] == 11
+
+    save_solution(tmp_path / "s.npz", points[0][2])
+    sol = load_solution(tmp_path / "s.npz")
+    np.testing.assert_array_equal(sol.y, points[0][2].y)
+    assert sol.blocks == points[0][2].blocks and sol.duals["bounds"].size == 2
+
+
+def test_log_appends_and_memmaps(tmp_path):
+    with ArtifactLog(tmp_path / "log", 4) as log:
+        log.append(_sol(0), account="a")
+        log.append(_sol(1), account="b")
+    with ArtifactLog(tmp_path / "log", 4) as log:  # reopen and continue
+        log.append(_sol(2), account="c")
+    # Simulate a crash mid-append: a dangling half row of weights.
+    with open(tmp_path / "log" / "weights.f64", "ab") as fh:
+        fh.write(b"\0" * 12)
+    ArtifactLog(tmp_path / "log", 4).close()
+
+    view = open_log(tmp_path / "log")
+    assert isinstance(view.weights, np.memmap) and view.weights.shape == (3, 4)
+    assert [r["account"] for r in view.records] == ["a", "b", "c"]
+    np.testing.assert_array_equal(view.solution(2).x, _sol(2).x)
+    with pytest.raises(ValueError):
+        ArtifactLog(tmp_path / "log", 5)
+
+
+def test_checkpoint_entries_share_the_solution_format(tmp_path):
+    from qpfolio.checkpoint import CheckpointStore
+
+    sol = _sol(2)
+    CheckpointStore(tmp_path).put("abc", sol)
+    back = load_solution(tmp_path / "abc.npz")
+    np.testing.assert_array_equal(back.x, sol.x)
+    np.testing.assert_array_equal(back.active, sol.active)
+    assert back.blocks == sol.blocks and back.info["iter"] == sol.info["iter"]
+
+
+def test_frontier_csv_roundtrip(tmp_path):
+    pd = pytest.importorskip("pandas")
+    from qpfolio.core.metrics import frontier_to_frame
+    from qpfolio.reporting.artifacts import save_frontier_csv
+
+    df = frontier_to_frame([(0.1 + k, 0.05 + k, _sol(k)) for k in range(3)], asset_labels=list("ABCD"))
+    save_frontier_csv(df, tmp_path / "f.csv")
+    back = pd.read_csv(tmp_path / "f.csv", index_col="idx")
+    pd.testing.assert_frame_equal(back, df)
@@ -0,0 +1,79 @@
+# tests/unit/test_reporting_html.py
+import numpy as np
+import pandas as pd
+
+from qpfolio.reporting.html import render_report
+
+
+def _frame(n):
+    return pd.DataFrame({"risk": np.linspace(0.1, 0.2, n), "ret": np.linspace(0.05, 0.1, n),
+                         "account": [f"acct-{i}" for i in range(n)]})
+
+
+def test_render_report_pages_and_inlines_images(tmp_path):
+    png = tmp_path / "frontier.png"
+    png.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(100))
+
+    def draw(fig):
+        fig.add_subplot().plot([0, 1], [0, 1])
+
+    out = tmp_path / "index.html"
+    rows = render_report(_frame(1200), {"frontier_png": str(png)}, str(out),
+                         figures={"line": draw, "line2": draw}, figure_format="svg", page_size=500)
+    text = out.read_text()
+    assert rows == 1200
+    assert text.count('<tbody class="page">') == 3
+    assert "data:image/png;base64,iVBORw0KGgo" in text
+    assert text.count("<svg") == 2 and "<?xml" not in text
+    assert "acct-1199" in text
+
+
+def test_render_report_streams_chunks(tmp_path):
+    out = tmp_path / "index.html"
+    chunks = (_frame(10) for _ in range(4))
+    assert render_report(chunks, None, str(out), page_size=5) == 40
+    assert out.read_text().count('<tbody class="page">') == 8
+
+
+def test_inline_svg_ids_are_unique(tmp_path):
+    import re
+
+    def draw(fig):
+        ax = fig.add_subplot()
+        ax.plot([0, 1], [0, 1], marker="o")
+
+    out = tmp_path / "index.html"
+    render_report(_frame(1), None, str(out), figures={"a": draw, "b": draw}, figure_format="svg")
+    text = out.read_text()
+    ids = re.findall(r'\bid="([^"]+)"', text)
+    assert len(ids) == len(set(ids))
+    # every internal reference still resolves
+    refs = set(re.findall(r'(?:href="#|url\(#)([^")]+)', text))
+    assert refs and refs <= set(ids)
+
+
+def test_figures_render_in_a_bounded_window(tmp_path):
+    import threading
+    import time
+
+    started = []
+    seen_when_first_done = []
+    lock = threading.Lock()
+
+    def make(i):
+        def draw(fig):
+            with lock:
+                started.append(i)
+            if i == 0:
+                time.sleep(0.2)  # slow first figure: later ones must not pile up
+                with lock:
+                    seen_when_first_done.append(len(started))
+            fig.add_subplot().plot([0, i])
+        return draw
+
+    out = tmp_path / "index.html"
+    render_report(_frame(1), None, str(out), figures={f"f{i}": make(i) for i in range(8)}, max_workers=2)
+    assert seen_when_first_done == [2]
+    assert sorted(started) == list(range(8))
+    text = out.read_text()
+    assert [text.index(f'id="f{i}"') for i in range(8)] == sorted(text.index(f'id="f{i}"') for i in range(8))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from qpfolio.core.metrics import risk_contributions
+from qpfolio.core.risk_parity import risk_parity_weights
+
+
+def risk_contribution_fractions(w, Sigma):
+    trc = risk_contributions(w, Sigma)["trc"]
+    return trc / trc.sum()
+
+
+def _factor_cov(n: int, k: int = 5, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    B = rng.normal(size=(n, k)) * 0.1
+    return B @ B.T + np.diag(rng.uniform(0.01, 0.09, n))
+
+
+@pytest.mark.parametrize("method", ["newton", "ccd"])
+def test_equal_risk_contributions(method):
+    Sigma = _factor_cov(40)
+    sol = risk_parity_weights(Sigma, method=method)
+    assert sol.status == "solved"
+    assert np.isclose(sol.x.sum(), 1.0)
+    assert (sol.x > 0).all()
+    np.testing.assert_allclose(risk_contribution_fractions(sol.x, Sigma), 1.0 / 40, atol=1e-9)
+
+
+def test_budgeted_risk_parity_and_qp_fallback():
+    pytest.importorskip("osqp")
+    Sigma = _factor_cov(8, seed=1)
+    budgets = np.linspace(1.0, 3.0, 8)
+    sol = risk_parity_weights(Sigma, budgets, method="qp", tol=1e-6)
+    assert sol.status == "solved"
+    np.testing.assert_allclose(risk_contribution_fractions(sol.x, Sigma), budgets / budgets.sum(), atol=1e-5)
+
+
+def test_rejects_bad_budgets():
+    with pytest.raises(ValueError):
+        risk_parity_weights(np.eye(3), np.array([1.0, 0.0, 1.0]))
+
+
+def test_newton_scales_to_thousands_of_assets():
+    # Guard on work, not wall-clock: the low-rank preconditioner keeps the
+    # inner CG to a few Sigma products per Newton step.
+    n = 3000
+    Sigma = _factor_cov(n, k=20)
+    sol = risk_parity_weights(Sigma)
+    assert sol.status == "solved"
+    assert sol.info["iter"] <= 12 and sol.info["cg_iter"] <= 40
+    np.testing.assert_allclose(risk_contribution_fractions(sol.x, Sigma), 1.0 / n, rtol=1e-6)
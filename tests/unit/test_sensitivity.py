@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping sensitivity test.")
+
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.core.sensitivity import sensitivity_to_caps, sensitivity_to_mu, sensitivity_to_target
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+
+MU = np.array([0.06, 0.08, 0.10, 0.12, 0.14])
+SIGMA = np.diag([0.02, 0.03, 0.04, 0.06, 0.09]) + 0.005
+R = 0.11
+
+
+def _solve(mu=MU, r=R):
+    prob = build_mvo_problem(mu, SIGMA, r_target=r)
+    return prob, MathOptOSQP().solve(prob)
+
+
+def test_solution_exposes_block_duals_and_active_set():
+    _, sol = _solve()
+    assert set(sol.duals) == {"eq", "ineq", "bounds"}
+    assert sol.duals["bounds"].shape == (5,)
+    assert sol.active_set["eq"].all()
+    assert sol.active_set["ineq"].all()  # return target binds above the GMV return
+    assert sol.duals["ineq"][0] > 0
+
+
+def test_first_order_sensitivities_match_resolves():
+    prob, sol = _solve()
+    h = 1e-4
+
+    dx = sensitivity_to_target(prob, sol) * h
+    np.testing.assert_allclose(dx, _solve(r=R + h)[1].x - sol.x, atol=1e-6)
+
+    dmu = np.array([0.0, 0.0, 1.0, 0.0, 0.0]) * h
+    np.testing.assert_allclose(sensitivity_to_mu(prob, sol, dmu), _solve(mu=MU + dmu)[1].x - sol.x, atol=1e-6)
+
+    # caps are slack at 1.0 here, so moving them changes nothing
+    np.testing.assert_allclose(sensitivity_to_caps(prob, sol, -h * np.ones(5)), 0.0, atol=1e-12)
+
+
+def test_sparse_lifted_problem_uses_sparse_kkt():
+    import scipy.sparse as sp
+
+    from qpfolio.core.models import build_transaction_cost_problem
+    from qpfolio.core.sensitivity import weight_sensitivity
+    from qpfolio.core.types import ProblemSpec
+
+    n = 5
+    w_prev = np.full(n, 0.2)
+
+    def lifted(mu):
+        return build_transaction_cost_problem(SIGMA, -mu, w_prev, buy_cost=0.002, sell_cost=0.002,
+                                              A=np.ones((1, n)), l=np.ones(1), u=np.ones(1),
+                                              bounds=[(0.0, 0.5)] * n)
+
+    solver = MathOptOSQP(eps_abs=1e-9, eps_rel=1e-9)
+    prob = lifted(MU)
+    assert sp.issparse(prob.Q) and sp.issparse(prob.A)
+    sol = solver.solve(prob)
+    dmu = np.array([0.0, 0.0, 1.0, 0.0, 0.0]) * 1e-3
+    dc = np.concatenate([-dmu, np.zeros(2 * n)])
+    dx = weight_sensitivity(prob, sol, dc=dc)
+    np.testing.assert_allclose(dx[:n], solver.solve(lifted(MU + dmu)).x[:n] - sol.x[:n], atol=1e-6)
+
+    dense = ProblemSpec(Q=prob.Q.toarray(), c=prob.c, A=prob.A.toarray(), l=prob.l, u=prob.u, bounds=prob.bounds)
+    np.testing.assert_allclose(dx, weight_sensitivity(dense, sol, dc=dc), atol=1e-9)
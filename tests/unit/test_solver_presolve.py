@@ -0,0 +1,65 @@
+# tests/unit/test_solver_presolve.py
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping presolve test.")
+
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.core.sensitivity import sensitivity_to_caps
+from qpfolio.core.types import ProblemSpec
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP
+from qpfolio.solvers.presolve import presolve_fixed
+
+
+def _problem():
+    rng = np.random.default_rng(3)
+    n = 8
+    F = rng.normal(size=(n, 3))
+    Sigma = 0.02 * (F @ F.T) / 3 + np.diag(rng.uniform(0.01, 0.04, n))
+    mu = rng.uniform(0.04, 0.12, n)
+    prob = build_mvo_problem(mu, Sigma, r_target=0.08)
+    prob.bounds[1] = (0.0, 0.0)    # exclusion
+    prob.bounds[5] = (0.05, 0.05)  # fixed holding
+    return prob
+
+
+def test_presolve_drops_fixed_columns():
+    reduced, post = presolve_fixed(_problem())
+    assert reduced.Q.shape == (6, 6)
+    np.testing.assert_array_equal(post.fixed, [1, 5])
+    assert presolve_fixed(ProblemSpec(Q=np.eye(2), c=np.zeros(2)))[1] is None
+
+
+def test_presolve_matches_full_solve():
+    prob = _problem()
+    full = MathOptOSQP(presolve=False).solve(prob)
+    fast = MathOptOSQP().solve(prob)
+    assert fast.info["presolve_fixed"] == 2
+    np.testing.assert_allclose(fast.x, full.x, atol=1e-6)
+    assert fast.x[1] == 0.0 and fast.x[5] == 0.05
+    assert fast.obj == pytest.approx(full.obj, abs=1e-8)
+    assert fast.blocks == full.blocks
+    np.testing.assert_allclose(fast.y, full.y, atol=1e-5)
+    # Scattered duals keep the sensitivity API working on the original problem.
+    dcap = np.zeros(8)
+    dcap[0] = 0.01
+    np.testing.assert_allclose(sensitivity_to_caps(prob, fast, dcap),
+                               sensitivity_to_caps(prob, full, dcap), atol=1e-5)
+
+
+def test_presolve_duals_on_sparse_triplet_problem():
+    import scipy.sparse as sp
+
+    from qpfolio.core.models import build_transaction_cost_problem
+
+    base = _problem()
+    n = 8
+    prob = build_transaction_cost_problem(sp.csc_matrix(base.Q), np.zeros(n), np.full(n, 1.0 / n),
+                                          buy_cost=0.01, sell_cost=0.01, A=np.ones((1, n)),
+                                          l=np.array([1.0]), u=np.array([1.0]),
+                                          bounds=[(0.0, 0.3)] * 3 + [(0.0, 0.0)] + [(0.0, 0.3)] * 4)
+    full = MathOptOSQP(presolve=False).solve(prob)
+    fast = MathOptOSQP().solve(prob)
+    assert fast.info["presolve_fixed"] == 1
+    np.testing.assert_allclose(fast.x, full.x, atol=1e-6)
+    np.testing.assert_allclose(fast.y, full.y, atol=1e-5)
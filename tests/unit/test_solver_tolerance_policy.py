@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping tolerance policy test.")
+
+from qpfolio.core.data import simulate_mvn_returns
+from qpfolio.core.models import build_mvo_problem
+from qpfolio.solvers.mathopt_osqp import MathOptOSQP, TolerancePolicy
+
+
+def test_policy_solution_matches_tight_solve():
+    _, mu, Sigma = simulate_mvn_returns(12, 10, seed=5)
+    prob = build_mvo_problem(mu, Sigma, r_target=float(np.median(mu)))
+
+    tight = MathOptOSQP().solve(prob)
+    loose_first = MathOptOSQP(policy=TolerancePolicy()).solve(prob)
+
+    assert loose_first.status.startswith("solved")
+    assert 1 <= loose_first.info["passes"] <= 3
+    np.testing.assert_allclose(loose_first.x, tight.x, atol=1e-5)
+
+
+def test_weight_change_rule():
+    policy = TolerancePolicy(weight_tol=1e-5, gap_tol=None)
+    info = object()
+    x = np.array([0.5, 0.5])
+    assert not policy.converged(x, None, info)
+    assert policy.converged(x, x + 1e-6, info)
+    assert not policy.converged(x, x + 1e-3, info)
+
+
+def test_per_call_iteration_budget():
+    _, mu, Sigma = simulate_mvn_returns(12, 10, seed=5)
+    prob = build_mvo_problem(mu, Sigma, r_target=float(np.median(mu)))
+    sol = MathOptOSQP(polish=False).solve(prob, max_iter=1, time_limit=10.0)
+    assert not sol.status.startswith("solved")
+    assert sol.info["iter"] <= 1
+
+
+@pytest.mark.parametrize("polish", [True, False])
+def test_policy_uses_fewer_iterations_than_tight_solve(polish):
+    _, mu, Sigma = simulate_mvn_returns(200, 10, seed=6)
+    prob = build_mvo_problem(mu, Sigma, r_target=float(np.median(mu)))
+    policy = TolerancePolicy()
+    eps = policy.eps_schedule[-1]
+
+    tight = MathOptOSQP(eps_abs=eps, eps_rel=eps, polish=polish).solve(prob)
+    loose_first = MathOptOSQP(policy=policy, polish=polish).solve(prob)
+
+    assert loose_first.status.startswith("solved")
+    assert loose_first.info["iter"] < tight.info["iter"]
+    np.testing.assert_allclose(loose_first.x, tight.x, atol=1e-5)
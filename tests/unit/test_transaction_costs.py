@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+osqp = pytest.importorskip("osqp", reason="OSQP not installed; skipping transaction cost test.")
+
+from qpfolio.personal_indexing import personal_index_optimizer, personal_index_optimizer_tcost
+
+
+def _setup(n=6):
+    rng = np.random.default_rng(7)
+    B = rng.normal(size=(n, n)) * 0.1
+    Sigma = B @ B.T + 0.02 * np.eye(n)
+    w_bench = np.ones(n) / n
+    w_prev = np.zeros(n)
+    w_prev[:2] = 0.5
+    return Sigma, w_bench, w_prev
+
+
+def test_zero_cost_matches_plain_tracking():
+    Sigma, w_bench, w_prev = _setup()
+    base = personal_index_optimizer(Sigma, w_bench, max_weight=0.6)
+    tc = personal_index_optimizer_tcost(Sigma, w_bench, w_prev=w_prev, buy_cost=0.0, sell_cost=0.0, max_weight=0.6)
+    np.testing.assert_allclose(tc.x, base.x, atol=1e-5)
+    np.testing.assert_allclose(tc.x, w_prev + tc.info["buy"] - tc.info["sell"], atol=1e-6)
+
+
+def test_turnover_budget_and_costs_limit_trading():
+    Sigma, w_bench, w_prev = _setup()
+    capped = personal_index_optimizer_tcost(Sigma, w_bench, w_prev=w_prev, turnover_budget=0.3, max_weight=0.6)
+    assert np.abs(capped.x - w_prev).sum() <= 0.3 + 1e-5
+    assert np.isclose(capped.x.sum(), 1.0, atol=1e-6)
+
+    frozen = personal_index_optimizer_tcost(Sigma, w_bench, w_prev=w_prev, buy_cost=1.0, sell_cost=1.0, max_weight=0.6)
+    np.testing.assert_allclose(frozen.x, w_prev, atol=1e-5)
+
+
+def test_tcost_solution_keeps_duals_and_blocks():
+    Sigma, w_bench, w_prev = _setup()
+    n = w_bench.size
+    sol = personal_index_optimizer_tcost(Sigma, w_bench, w_prev=w_prev, turnover_budget=0.3, max_weight=0.3)
+    assert [b[0] for b in sol.blocks] == ["A", "bounds"]
+    assert sol.duals["bounds"].shape == (n,)
+    assert sol.y.shape == sol.active.shape == (sol.blocks[-1][2],)
+    # Weights at the cap show up as binding bound rows.
+    np.testing.assert_array_equal(sol.active_set["bounds"], np.isclose(sol.x, 0.3, atol=1e-6) | (sol.x <= 1e-6))
@@ -0,0 +1,45 @@
+# tests/unit/test_visualize_frontiers.py
+import matplotlib
+import numpy as np
+import pandas as pd
+
+matplotlib.use("Agg")  # headless
+
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from qpfolio.core.visualize import plot_frontiers
+
+
+def _bootstrap_frontiers(K=5000, P=40, seed=0):
+    rng = np.random.default_rng(seed)
+    risk = np.linspace(0.1, 0.3, P)
+    scale = rng.normal(1.0, 0.1, size=(K, 1))
+    ret = 0.02 + scale * np.sqrt(risk - 0.09)
+    return np.stack([np.broadcast_to(risk, (K, P)), ret], axis=2)
+
+
+def test_many_frontiers_single_collection_with_bands():
+    F = _bootstrap_frontiers()
+    fig, ax = plt.subplots()
+    plot_frontiers(F, ax=ax, bands=(0.05, 0.95), median=True)
+    fig.canvas.draw()
+    collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(collections) == 1 and len(collections[0].get_segments()) == 5000
+    assert collections[0].get_rasterized()
+    med = ax.get_lines()[0].get_ydata()
+    expected = 0.02 + np.sqrt(ax.get_lines()[0].get_xdata() - 0.09)
+    np.testing.assert_allclose(med, expected, rtol=0.02)
+    plt.close(fig)
+
+
+def test_columnar_and_point_list_inputs():
+    df = pd.DataFrame({"frontier": [0, 0, 0, 1, 1],
+                       "risk": [0.1, 0.2, 0.3, 0.15, 0.25],
+                       "return": [0.05, 0.07, 0.08, 0.06, 0.075]})
+    ax = plot_frontiers(df)
+    assert len(ax.collections[0].get_segments()) == 2
+    pts = [[(0.1, 0.05, None), (0.2, 0.07, None)]] * 3
+    ax = plot_frontiers(pts, bands=(0.1, 0.9))
+    assert len(ax.collections[0].get_segments()) == 3
+    plt.close("all")
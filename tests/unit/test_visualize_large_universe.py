@@ -0,0 +1,60 @@
+# tests/unit/test_visualize_large_universe.py
+import tracemalloc
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+matplotlib.use("Agg")  # headless
+
+import matplotlib.pyplot as plt
+
+from qpfolio.core.visualize import (
+    plot_corr_heatmap,
+    plot_risk_contributions,
+    plot_weights_along_frontier,
+)
+
+
+def _factor_cov(n, k=5, seed=0):
+    rng = np.random.default_rng(seed)
+    B = rng.normal(size=(n, k))
+    return 0.01 * (B @ B.T) / k + np.diag(rng.uniform(0.01, 0.03, n))
+
+
+def test_large_heatmap_is_block_averaged_without_dense_copy():
+    Sigma = _factor_cov(5000)
+    fig, ax = plt.subplots()
+    plot_corr_heatmap(Sigma, ax=ax)
+    fig.canvas.draw()
+    img = ax.get_images()[0]
+    assert img.get_array().shape == (200, 200) and img.get_rasterized()
+
+    # No n x n temporary (200 MB here): only block-sized arrays are allocated.
+    tracemalloc.start()
+    plot_corr_heatmap(Sigma, ax=ax)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 50e6
+    plt.close(fig)
+
+
+def test_grouped_and_top_k_aggregation():
+    n = 300
+    Sigma = _factor_cov(n)
+    w = np.full(n, 1.0 / n)
+    sectors = np.array(["Tech", "Energy", "Health"])[np.arange(n) % 3]
+
+    ax = plot_risk_contributions(w, Sigma)
+    assert len(ax.patches) == 31  # top 30 + "other"
+    ax = plot_risk_contributions(w, Sigma, groups=sectors)
+    heights = [p.get_height() for p in ax.patches]
+    assert len(heights) == 3
+    assert np.isclose(sum(heights), np.sqrt(w @ Sigma @ w))
+
+    W = pd.DataFrame(np.tile(w, (4, 1)))
+    ax = plot_weights_along_frontier(W, top_k=5)
+    assert len(ax.get_legend().get_texts()) == 6
+    ax = plot_corr_heatmap(Sigma, groups=sectors)
+    assert ax.get_images()[0].get_array().shape == (3, 3)
+    plt.close("all")